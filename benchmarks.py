@@ -0,0 +1,105 @@
+"""""
+This script benchmarks the GSMArena cleaner on seeded synthetic scrapes (see synthetic_data.py).
+It times clean() end to end and every cleaning function on its own, at every size, and writes the timings as JSON.
+Given the JSON of a previous run as a baseline, it exits with an error if a timing got slower than the tolerance allows,
+so that merges can be gated on it:
+
+    python benchmarks.py --rows 10000 100000 1000000 --output baseline.json
+    python benchmarks.py --rows 10000 100000 1000000 --baseline baseline.json --tolerance 0.2
+
+"""""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import pandas as pd
+from cleaners import GSMArena_Dataset_Cleaner
+from synthetic_data import generate_gsmarena
+
+
+def benchmark(n_rows, repeat=3, seed=0, vectorized=True):
+
+    """""
+    This function cleans a synthetic scrape of n_rows rows repeat times and returns the best timings, in seconds.
+    Every run uses a new cleaner, so the cache starts empty. The cleaning functions are timed by the report of clean(),
+    each one on the output of the previous ones, as they run in the pipeline.
+
+    """""
+
+    raw = generate_gsmarena(n_rows, seed=seed)
+
+    clean_times = []
+    stage_times = {} # Timings of every cleaning function
+    for _ in range(repeat):
+        cleaner = GSMArena_Dataset_Cleaner(raw, vectorized=vectorized)
+        start = time.perf_counter()
+        cleaner.clean()
+        clean_times.append(time.perf_counter() - start)
+        for record in cleaner.report.records:
+            stage_times.setdefault(record['stage'], []).append(record['wall_time_s'])
+
+    return {'clean': min(clean_times), 'stages': {stage: min(times) for stage, times in stage_times.items()}}
+
+
+def find_regressions(results, baseline, tolerance, min_time):
+
+    """""
+    This function compares the timings of results with the ones of baseline, for the sizes found in both.
+    It returns a (rows, name, time, baseline time) tuple for every timing slower than the baseline by more than tolerance
+    (0.2 is 20%). Timings under min_time seconds in the baseline are too noisy and are not compared.
+
+    """""
+
+    regressions = []
+    for rows, result in results['rows'].items():
+        if rows not in baseline['rows']:
+            continue
+        base = baseline['rows'][rows]
+        timings = [('clean', result['clean'], base['clean'])] # End-to-end timing
+        timings += [(stage, seconds, base['stages'].get(stage)) for stage, seconds in result['stages'].items()] # Timings of the cleaning functions
+        for name, seconds, base_seconds in timings:
+            if base_seconds is not None and base_seconds >= min_time and seconds > base_seconds * (1 + tolerance):
+                regressions.append((rows, name, seconds, base_seconds))
+
+    return regressions
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Benchmarks the GSMArena cleaner on synthetic scrapes.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000], help="sizes of the synthetic scrapes")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per size, the best one is kept")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the synthetic scrapes")
+    parser.add_argument('--no-vectorized', action='store_true', help="benchmarks the per-value extractors instead of the vectorized ones")
+    parser.add_argument('--output', help="file to write the timings to, as JSON")
+    parser.add_argument('--baseline', help="timings of a previous run to compare with, as JSON")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed slowdown against the baseline (0.2 is 20%%)")
+    parser.add_argument('--min-time', type=float, default=0.01, help="baseline timings under this many seconds are not compared")
+    args = parser.parse_args(argv)
+
+    results = {'python': platform.python_version(), 'pandas': pd.__version__, 'repeat': args.repeat, 'seed': args.seed,
+               'vectorized': not args.no_vectorized, 'rows': {}}
+    for n_rows in args.rows:
+        results['rows'][str(n_rows)] = benchmark(n_rows, args.repeat, args.seed, not args.no_vectorized) # JSON keys are strings
+        print("{:>9} rows: clean() {:.3f}s".format(n_rows, results['rows'][str(n_rows)]['clean']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance, args.min_time)
+        for rows, name, seconds, base_seconds in regressions:
+            print("REGRESSION {} rows, {}: {:.3f}s vs {:.3f}s in the baseline".format(rows, name, seconds, base_seconds))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,1702 +1,3355 @@
+import hashlib
+import inspect
+import json
+import os
 import re
+import shutil
+import sys
+import time
+import traceback
+import tracemalloc
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
+try:
+    import resource # Peak RSS of the process, not available on Windows
+except ImportError:
+    resource = None
+try:
+    import pyarrow # Parquet datasets and fast CSV reading, only needed by write_dataset(), read_dataset() and from_csv()
+    import pyarrow.csv
+    import pyarrow.dataset
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
-class GSMArena_Dataset_Cleaner:
 
-    def __init__(self, df):
-        self.df = df
-        self.cleaning_functions =[self.drop_columns, self.fix_network_technology, self.fix_announced, self.fix_status, self.fix_brand,
-                                  self.fix_dimensions, self.fix_weight, self.fix_Build, self.fix_SIM, self.fix_IP_Rating, self.fix_Display_Type,
-                                  self.fix_Display_Size, self.fix_Display_Resolution, self.fix_Display_Protection, self.fix_Operating_Software, 
-                                  self.fix_Chipset, self.fix_CPU, self.fix_SD_Card_Slot, self.fix_Number_of_Rear_Cameras, self.fix_Camera,
-                                  self.fix_Camera_Features, self.fix_Rear_Video, self.fix_Number_of_Selfie_Cameras, self.fix_Selfie_Video,
-                                  self.fix_Headphone_Jack, self.fix_WLAN_Technology, self.fix_Bluetooth, self.fix_NFC, self.fix_Radio, self.fix_USB,
-                                  self.fix_Sensors, self.fix_UWB, self.fix_Battery, self.fix_Charging, self.fix_Colors, self.fix_Battery_Life,
-                                  self.fix_Internal_Storage, self.fix_Storage_Type, self.fix_Loudspeaker, self.fix_price_and_approx_price]
+def map_unique(series, func, cache=None, key=None, vectorized=False):
 
+    """""
+    This function applies func to every distinct value of a column instead of to every row.
+    The column is factorized into integer codes, func is called once per distinct value (and once for the missing values)
+    and the results are broadcast back to the rows through the codes. The result has the same dtype Series.apply would give.
+    If a cache is given, the results are looked up and stored in it under key, so distinct values seen before are not parsed again.
+    If vectorized is True, func takes a Series of distinct values and returns a Series of results instead of taking a single value.
 
+    """""
 
+    codes, uniques = pd.factorize(series) # Integer code of every row and the distinct values of the column
+    if cache is None:
+        results = call_extractor(func, uniques, vectorized) # Calls func once per distinct value
+    else:
+        results = cache.lookup(key, uniques, func, vectorized) # Calls func once per distinct value not already in the cache
 
+    missing = codes == -1 # Missing values are coded as -1
+    if missing.any():
+        results += call_extractor(func, [series[missing].iloc[0]], vectorized) # Calls func once for the missing values
+        codes = np.where(missing, len(uniques), codes) # Points the missing rows to the last result
 
-    def drop_columns(self, df):
+    mapped = pd.Series(results, dtype=None if results else object).take(codes) # Broadcasts the results back to the rows
+    mapped.index = series.index
+    mapped.name = series.name
 
-        """""
-        This function drops the columns that are redundant or otherwise not needed for the analysis.
-        These columns were created during the scraping process and are not needed for the analysis.
-        """""
+    return mapped
 
 
-        to_drop = ['Brands-href', 'Model', 'Models-href', 'Pages', 'Pages-href', 'web-scraper-order', 'web-scraper-start-url', 'GPU', 'Selfie Features'] # Columns to drop
+def call_extractor(func, values, vectorized):
 
-        df.drop(to_drop, inplace=True, axis=1) # Drops the columns
-        df = df.rename(columns={'Models': 'Model'}) # Renames the Models column to Model
+    """""
+    This function returns the results of func for values as a list, calling it per value or once on all of them if it is vectorized.
 
-        return df
+    """""
 
-    def fix_network_technology(self, df):
-    
-        """""
-        This function fixes the network technology column. It removes the extra information from the column and
-        makes it easier to analyze. It takes only the highest network technology and removes the rest.
-        """""
-            
-        df['Network Technology'] = df['Network Technology'].str.split('/').str.get(-1) # Splits the column and takes the last element
-        df['Network Technology'] = df['Network Technology'].apply(lambda x: x.strip()) # Removes the extra spaces
-        df = df.rename(columns={'Network Technology': 'Highest_Network_Technology'}) # Renames the column
-        return df
+    if vectorized:
+        return func(pd.Series(values, dtype=object)).tolist() if len(values) else [] # tolist() gives back Python ints and floats
+    return [func(value) for value in values]
 
-    def fix_announced(self, df):
-    
-        """""
-        This function fixes the announced column. It splits the information in the column into 2 columns: Announced and Released
-        It then converts these to datetime objects for easier analysis, retaining only the year and month.
-        """""
-            
-        # splitting the column into Announced and Released
-        df['Released'] = df['Announced'].str.split('.').str.get(-1) # Splits the column and takes the last element - Released
-        df['Announced'] = df['Announced'].str.split('.').str.get(0) # Splits the column and takes the first element - Announced
-
-        # working on the released column
-        df['Released'] = df['Released'].apply(lambda x: str(x).replace('Released','')) # Removes the word 'Released' from date and converts it to string
-        df['Released'] = df['Released'].apply(lambda x: x.strip()) # Removes the extra spaces
-        df['Released'] = pd.to_datetime(df['Released'], infer_datetime_format=True, errors='coerce').dt.to_period('M') # Converts the column to datetime and takes only the month and year
-        df['Released'] = df['Released'].fillna('Not Released Yet') # Fills the missing values with 'Not Released Yet'
-
-        # working on the announced column
-        df['Announced'] = df['Announced'].apply(lambda x: str(x).strip()) # Removes the extra spaces and converts the column to string
-        df['Announced'] = pd.to_datetime(df['Announced'], infer_datetime_format=True, errors='coerce').dt.to_period('M') # Converts the column to datetime and takes only the month and year
-        df['Announced'] = df['Announced'].fillna('Not Announced Yet') # Fills the missing values with 'Not Announced Yet'
-        df.insert(4, "Released", df.pop('Released')) # Moves the released column to the 4th position
-        
-        return df
 
-    def fix_status(self, df):
+class UniqueValueCache:
 
-        """""
-        This function fixes the status column. It splits the status column into 2 columns: Status and Released 2.
-        This is necessitated by the fact that some release dates are not available in the Announced column and are instead in the Status column.
-        After splitting the column, it converts the Released 2 column to datetime objects for easier analysis, retaining only the year and month.
-        Finally it merges the Released column with the Released 2 column and then drops the Released 2 column
-        """""
-        
-        df['Released 2'] = df['Status'].str.split('.').str.get(-1) # Splits the column and takes the last element - Released
-        df['Status'] = df['Status'].str.split('.').str.get(0) # Splits the column and takes the first element - Announced
+    """""
+    This class is a least-recently-used cache of extractor results, keyed by the extractor key and the raw value.
+    It is bounded to maxsize entries and lives on the cleaner, so it persists across clean() calls.
 
+    """""
 
-        df['Released 2'] = df['Released 2'].apply(lambda x: str(x).replace('Released','')) # Removes the word 'Released' from date and converts it to string
-        df['Released 2'] = df['Released 2'].apply(lambda x: x.strip()) # Removes the extra spaces
-        df['Released 2'] = pd.to_datetime(df['Released 2'], infer_datetime_format=True, errors='coerce').dt.to_period('M') # Converts the column to datetime and takes only the month and year
-        df['Released'] = np.where(df['Released 2'].notna(), df['Released 2'], df['Released']) # Replaces the released column with the released 2 column if the released 2 column is not null
-        df = df.drop(columns=['Released 2']) # Drops the released 2 column
-        
-        return df
+    def __init__(self, maxsize):
+        self.maxsize = maxsize # Maximum number of cached results
+        self.results = OrderedDict() # Cached results, least recently used first
 
+    def lookup(self, key, values, func, vectorized=False):
 
-    def fix_brand(self, df):
         """""
-        this function fixes the brand column. It removes the extra information from the column,
-        leaving only the brand name.
+        This function returns the results of func for values, computing and caching only the ones that are not cached yet.
+        If func is vectorized, all the values that are not cached yet are computed in a single call.
 
         """""
-        df['Brands'] = df['Brands'].str.split("\n").str.get(0)
-        df['Brands'] = df['Brands'].str.strip()
-        df = df.rename(columns={'Brands': "Brand"})
-        return df
 
+        results = [None] * len(values)
+        to_compute = [] # Positions of the values that are not cached yet
+        for i, value in enumerate(values):
+            entry = (key, value)
+            if entry in self.results: # If the result is cached, marks it as recently used
+                self.results.move_to_end(entry)
+                results[i] = self.results[entry]
+            else:
+                to_compute.append(i)
 
-    def fix_dimensions(self, df):
-        """""
-        This function fixes the dimensions column. It splits the column into 3 columns: Height, Width and Thickness.
-        It then converts these to float objects for easier analysis.
-        Finally it drops the original Dimensions column
+        computed = call_extractor(func, [values[i] for i in to_compute], vectorized) # Computes the results that are not cached yet
+        for i, result in zip(to_compute, computed): # and caches them
+            self.results[(key, values[i])] = result
+            results[i] = result
 
-        """""
+        while len(self.results) > self.maxsize: # Evicts the least recently used results
+            self.results.popitem(last=False)
 
-        df['Dimensions'] = df['Dimensions'].str.replace(r'mm\s*\([^)]*\)', '') # removes the dimensions in inches
+        return results
 
-        df['Length'] = df['Dimensions'].str.split('x').str.get(0) # Splits the column and takes the first element - Length
-        df['Width'] = df['Dimensions'].str.split('x').str.get(1) # Splits the column and takes the second element - Width
-        df['Thickness'] = df['Dimensions'].str.split('x').str.get(2) # Splits the column and takes the third element - Thickness
+    def clear(self):
+        self.results.clear()
 
-        df['Length'] = pd.to_numeric(df['Length'], errors='coerce') # Converts the Length column to float
-        df['Width'] = pd.to_numeric(df['Width'], errors='coerce') # Converts the Width column to float
-        df['Thickness'] = pd.to_numeric(df['Thickness'], errors='coerce') # Converts the Thickness column to float
 
-        columns_to_move = ["Length", "Width", "Thickness"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=6): # Iterates through the columns to move and moves them to the 6th, 7th and 8th positions
-            df.insert(i, col, df.pop(col))
+class KeywordClassifier:
 
-        df[['Length', 'Width', 'Thickness']] = df[['Length', 'Width', 'Thickness']].fillna("Not Measured") # Fills the missing values with 'Not Measured'
-        df = df.drop(columns=['Dimensions']) # Drops the original Dimensions column
+    """""
+    This class classifies the strings of a column using an ordered list of (label, keywords) rules.
+    The label of the first rule with a keyword found in the lowercased string is returned (first match wins).
+    Missing values get the null label and strings that match no rule get the default label.
+    All keywords are matched in a single pass of one compiled alternation regex, and every distinct string is only classified once.
+    The cleaning functions call it with their apply_unique, so that its results are cached under key, which is made of its rules,
+    and the values it fails on are quarantined.
 
-        return df
+    """""
 
+    def __init__(self, rules, default, null=None):
+        self.labels = [label for label, _ in rules] # Labels in order of priority
+        self.default = default # Label for strings that match no rule
+        self.null = default if null is None else null # Label for missing values
+        self.key = ('KeywordClassifier', tuple((label, keywords if isinstance(keywords, str) else tuple(keywords)) for label, keywords in rules),
+                    default, null) # Cache key, the same for classifiers with the same rules
+
+        self.priority = {} # Maps every keyword to the first rule it appears in
+        for i, (_, keywords) in enumerate(rules):
+            for keyword in ([keywords] if isinstance(keywords, str) else keywords):
+                self.priority.setdefault(keyword, i)
+
+        alternation = "|".join(re.escape(keyword) for keyword in self.priority) # Keywords in order of priority
+        self.pattern = re.compile("(?=(" + alternation + "))") # Zero-width lookahead so that overlapping keywords are all found
+
+    def classify(self, value):
 
-    def fix_weight(self, df):
         """""
-        This function fixes the weight column. removes the weight in oz and converts the column to float objects for easier analysis.
-        It then  fills the missing values with 'Not Measured'
+        This function returns the label of a single value.
 
         """""
-        df['Weight'] = df['Weight'].str.replace(r'g\s*\([^)]*\)', '') # removes the weight in ounces
-        df['Weight'] = pd.to_numeric(df['Weight'], errors='coerce') # Converts the Weight column to float
-        df['Weight'] = df['Weight'].fillna("Not Measured") # Fills the missing values with 'Not Measured'
-        return df
 
+        if pd.isnull(value): # If the value is null, return the null label
+            return self.null
 
-    def fix_Build(self, df):
+        matches = [self.priority[keyword] for keyword in self.pattern.findall(value.lower())] # Priorities of all the keywords in the string
+        return self.labels[min(matches)] if matches else self.default
 
+    def __call__(self, series, apply_unique=None):
+        if apply_unique is None:
+            return map_unique(series, self.classify)
+        return apply_unique(series, self.classify, self.key)
 
-        """""
-        This function fixes the BUILD column. It creates 3 new columns for Front, Back and Frame and extracts that information from
-        the BUILD column.
-        It then  drops the original BUILD column
 
-        """""
+def as_text(values):
 
+    """""
+    This function returns values as an object Series with a fresh positional index, so that the rows of
+    extract/extractall results can be grouped by position even when the original index has duplicates.
 
-        df['Build'] = df['Build'].apply(lambda x: str(x).split(',')) # Splits the column into a list
+    """""
 
-        df['Front'] = df['Build'].apply(lambda x: list(filter(lambda x: 'front' in x, x))) # creates the Front column with filtered front information
-        df['Back'] = df['Build'].apply(lambda x: list(filter(lambda x: 'back' in x, x))) # creates the Back column with filtered back information
-        df['Frame'] = df['Build'].apply(lambda x: list(filter(lambda x: 'frame' in x, x))) # creates the Frame column with filtered frame information
+    return pd.Series(np.asarray(values, dtype=object), dtype=object)
 
-        df['Front'] = df['Front'].astype(str) # converts Front column to string for easier manipulation
-        df['Back'] = df['Back'].astype(str) # converts Back column to string for easier manipulation
-        df['Frame'] = df['Frame'].astype(str) # converts Frame column to string for easier manipulation
 
+def fill_results(n, positions, numbers, is_integer, fallback):
 
-        df['Front'] = df['Front'].str.replace(r'\((.*)\)','').str.replace(r'[\[\]]','').str.replace('front','').str.replace("'",'').str.strip() # removes the extra information from the column
-        df['Back'] = df['Back'].str.replace(r'\((.*)\)','').str.replace(r'[\[\]]','').str.replace('back','').str.replace("'",'').str.strip() # removes the extra information from the column
-        df['Frame'] = df['Frame'].str.replace(r'\((.*)\)','').str.replace(r'[\[\]]','').str.replace('frame','').str.replace("'",'').str.strip() # removes the extra information from the column
+    """""
+    This function builds the results a per-value extractor would have returned, from the rows that have a number.
+    numbers go to positions, as Python ints where is_integer is True and as Python floats otherwise,
+    and every other row gets fallback (a single label or one label per row).
+    The result is an object Series, so map_unique infers the dtype of the column exactly like Series.apply does.
 
-        columns_to_move = ["Front", "Back", "Frame"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=10): # Iterates through the columns to move and moves them to the 6th, 7th and 8th positions
-            df.insert(i, col, df.pop(col))
+    """""
 
-        df = df.drop(columns=['Build']) # Drops the original Build column
+    positions = np.asarray(positions, dtype=np.intp)
+    numbers = np.asarray(numbers, dtype=np.float64)
+    is_integer = np.asarray(is_integer, dtype=bool)
 
-        return df
+    results = np.empty(n, dtype=object)
+    results[:] = fallback
+    results[positions[is_integer]] = numbers[is_integer].astype(np.int64).astype(object) # Python ints
+    results[positions[~is_integer]] = numbers[~is_integer].astype(object) # Python floats
+    return pd.Series(results, dtype=object)
 
 
-    def fix_SIM(self, df):
+def vectorized_first_integer(values, sentinel):
 
-        """""
-        This function fixes the SIM column. It creates two columns for Number of SIMs and Type of SIM.
-        It utilizes dictionaries to map the characteristics of the SIM to the categorical values.
-        It then  drops the original SIM column
+    """""
+    This function is the vectorized version of extract_battery_size: the first whole number in str(value), or sentinel.
 
-        """""
+    """""
 
-        df['SIMS'] = df['SIM'].apply(lambda x: str(x).split(' ')) # Splits the column into a list
+    numbers = as_text(values).astype(str).str.extract(r'\b(\d+)\b', expand=False) # First whole number of every row, NaN if there is none
+    found = numbers.notna().to_numpy()
+    numbers = numbers[found].astype(np.int64)
+    return fill_results(len(found), np.flatnonzero(found), numbers, np.ones(len(numbers), dtype=bool), sentinel)
 
 
-        number_of_sims_dict = {'2': 2, 'yes': 1, '4': 4, 'dual': 2, 'no' : 0, 'triple' : 3, 'dual': 2, '1' : 1, 'nan': 0} # Dictionary for Number of SIMs
-        df['Number_of_SIMs'] = df['SIMS'].apply(lambda x: max([number_of_sims_dict.get(i.lower(), 1) for i in x])) # Creates the Number of SIMs column
+def vectorized_max_integer(values, pattern, sentinel):
 
-        type_of_sim_dict = {'mini-sim': 'Mini-SIM', 'micro-sim': 'Micro-SIM', 'nano-sim': 'Nano-SIM', 'esim': 'eSIM'} # Dictionary for Types of SIM
-        df['Type_of_SIM'] = [type_of_sim_dict.get(x[0].lower(), 'Unspecified') for x in df['SIMS']] # Creates the Type of SIM column
+    """""
+    This function is the vectorized version of extract_charging_speed and extract_endurance:
+    the highest number captured by pattern in the row, or sentinel if there is none.
 
+    """""
 
-        columns_to_move = ["Number_of_SIMs", "Type_of_SIM"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=13): # Iterates through the columns to move and moves them to the 13th, 14th positions
-            df.insert(i, col, df.pop(col))
+    matches = as_text(values).str.extractall(pattern)[0].astype(np.int64) # Every match, indexed by (row, match)
+    highest = matches.groupby(level=0).max()
+    return fill_results(len(values), highest.index.to_numpy(), highest, np.ones(len(highest), dtype=bool), sentinel)
 
-        df = df.drop(columns=['SIM', 'SIMS']) # Drops the original Build column and intermediate SIMS column
 
-        return df
+def vectorized_capacity(values, highest):
 
+    """""
+    This function is the vectorized version of extract_storage (highest=True) and extract_ram (highest=False).
+    Every GB and MB capacity of the row is converted to GB (MB as a float), and the highest one is the storage,
+    while the lowest one is the RAM if there are at least two. Brackets are only removed for the storage.
+    As with max() and min() over the GB matches followed by the MB matches, a tie between a GB and an MB capacity gives the GB int.
 
-    def fix_IP_Rating(self, df):
+    """""
 
-        """""
-        This function fixes the IP Rating column. It eplaces it with a new IP Rating column.
-        It looks for key substrings to identify the type of IP Rating a phone has.
-        It reports the type of IP Rating a phone has.
+    text = as_text(values)
+    if highest:
+        text = text.str.replace(r'\([^)]*\)', '', regex=True) # remove anything inside brackets
+    matches = text.str.extractall(r'\b(\d+)([GM]B)') # Every capacity, indexed by (row, match)
 
-        """""
+    gigabytes = (matches[1] == "GB").to_numpy()
+    numbers = matches[0].astype(np.int64).to_numpy()
+    capacity = pd.Series(np.where(gigabytes, numbers, numbers / 1000), index=matches.index) # Converts the capacity to GB
+    rows = matches.index.get_level_values(0)
 
-        df["IP_Rating"] = df["IP Rating"].apply(lambda x: 
-            next((x for x in x.split() if x.startswith("IP")), "water/dust resistant") if not pd.isnull(x) and any(y in x for y in ["proof", "resistant", "repellant", "protection"]) else 
-            "Military-Grade Certification" if not pd.isnull(x) and any(y in x for y in ["MIL"]) else
-            "Weather-Sealed Ports" if not pd.isnull(x) and "sealed" in x else 
-            "Self-Healing Capability" if not pd.isnull(x) and "healing" in x else
-            "No Resistance"
-        ) # Creates the IP Rating column by looking for key substrings and categorizing them
+    grouped = capacity.groupby(rows)
+    chosen = grouped.max() if highest else grouped.min()
+    is_integer = pd.Series(gigabytes & (capacity.to_numpy() == chosen.reindex(rows).to_numpy())).groupby(rows).any() # A GB capacity reached the extreme
+    if not highest: # The RAM needs at least two capacities
+        enough = (grouped.size() > 1).to_numpy()
+        chosen, is_integer = chosen[enough], is_integer[enough]
 
-        df = df.drop(columns=['IP Rating']) # Drops the original IP Rating column
+    return fill_results(len(values), chosen.index.to_numpy(), chosen, is_integer, "unspecified")
 
-        
-        return df
 
-    def fix_Display_Type(self, df):
-        """""
-        This function fixes the Display Type column. It creates two new columns for Display Brightness and HDR Capability.
-        It combs through the information in the original Display Type column and extracts the relevant information for 
-        Type, Brightness, and HDR Capability
+def vectorized_camera_resolution(values):
 
-        """""
+    """""
+    This function is the vectorized version of extract_highest_camera_resolution.
+    Strings that contain "VGA" give "VGA", and otherwise the first of the highest resolutions before "MP" is taken.
+    It is returned as an integer, unless it has decimals or there is none, which gives "no camera".
 
-        # creating HDR Capability Column
-        df["Display_HDR_Capability"] = df["Display Type"].apply(lambda x: 
-            "HDR10+" if not pd.isnull(x) and x.lower().find("hdr10+") != -1 else
-            "HDR10" if not pd.isnull(x) and x.lower().find("hdr10") != -1 else
-            "HDR" if not pd.isnull(x) and x.lower().find("hdr") != -1 else
-            "No HDR"
-        ) # creates the HDR capability column by finding the key substrings "hdr", "hdr10", and "hdr10+"
+    """""
 
+    text = as_text(values)
+    vga = text.str.contains("VGA", regex=False).fillna(False).to_numpy(dtype=bool) # Missing values are not VGA
+    matches = text[~vga].str.extractall(r"\b(\d+\.\d+|\d+)\b MP")[0] # Every resolution, indexed by (row, match)
 
-        # creating Display Brightness column
-        df["Display_Brightness"] = df["Display Type"].apply(lambda x:
-            next((substring for i, substring in enumerate(str(x).split()) if substring.isnumeric() and x.split()[i+1] == "nits"), "Not Specified") if x is not None else "Not specified"
-        ) # creates the Display Brightness column by looking for the number of nits in the Display Type column
+    best = matches.loc[matches.astype(float).groupby(level=0).idxmax()] # First of the highest resolutions of every row
+    best = best[~best.str.contains(".", regex=False)] # int() fails on decimals, which gives "no camera"
+    rows = best.index.get_level_values(0).to_numpy()
 
-        df["Display_Brightness"] = df["Display_Brightness"].replace("Not Specified", np.nan) # replaces the "Not Specified" with NaNs
-        df["Display_Brightness"] = df["Display_Brightness"].astype(float) # converts the column to float
-        df["Display_Brightness"] = df["Display_Brightness"].fillna("Not Specified") # replaces the NaNs with "Not Specified"
+    fallback = np.where(vga, "VGA", "no camera").astype(object) # Label of the rows without a resolution
+    return fill_results(len(values), rows, best.astype(np.int64), np.ones(len(best), dtype=bool), fallback)
 
-            
-        # updating the Display Type column
-        df["Display_Type"] = df["Display Type"].apply(lambda x: 
-            "CSTN" if not pd.isnull(x) and x.lower().find("cstn") != -1 else
-            "TFT" if not pd.isnull(x) and x.lower().find("tft") != -1 else
-            "Foldable LTPO AMOLED" if not pd.isnull(x) and x.lower().find("foldable ltpo amoled") != -1 else
-            "Foldable AMOLED" if not pd.isnull(x) and x.lower().find("foldable amoled") != -1 else
-            "LTPO AMOLED" if not pd.isnull(x) and x.lower().find("ltpo amoled") != -1 else
-            "LTPO2 AMOLED" if not pd.isnull(x) and x.lower().find("ltpo2 amoled") != -1 else
-            "LTPO3 AMOLED" if not pd.isnull(x) and x.lower().find("ltpo3 amoled") != -1 else
-            "LTPO4 AMOLED" if not pd.isnull(x) and x.lower().find("ltpo4 amoled") != -1 else
-            "Super AMOLED" if not pd.isnull(x) and x.lower().find("super amoled") != -1 else
-            "Dynamic AMOLED" if not pd.isnull(x) and x.lower().find("dynamic amoled") != -1 else
-            "AMOLED" if not pd.isnull(x) and x.lower().find("amoled") != -1 else
-            "Super AMOLED" if not pd.isnull(x) and x.lower().find("super amoled") != -1 else
-            "OLED" if not pd.isnull(x) and x.lower().find("oled") != -1 else 
-            "STN" if not pd.isnull(x) and x.lower().find("stn") != -1 else
-            "TFD" if not pd.isnull(x) and x.lower().find("tfd") != -1 else
-            "LCD" if not pd.isnull(x) and x.lower().find("lcd") != -1 else
-            "IPS LCD" if not pd.isnull(x) and x.lower().find("ips") != -1 else
-            "IGZO" if not pd.isnull(x) and x.lower().find("igzo") != -1 else
-            "CGS" if not pd.isnull(x) and x.lower().find("CGS") != -1 else
-            "Monochrome" if not pd.isnull(x) and x.lower().find("monochrome") != -1 else
-            "TN" if not pd.isnull(x) and x.lower().find("tn") != -1 else
-            "Not Specified"
-        ) # creates the Display Type column by looking for the key substrings "cstn", "tft", "ltpo", "amoled", "oled", "stn", "tfd", "lcd", "ips", "igzo", "cgs", "monochrome", and "tn"
-
-        columns_to_move = ["Display_Type", "Display_Brightness", "Display_HDR_Capability"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=16): # Iterates through the columns to move and moves them to the 16th, 18th positions
-            df.insert(i, col, df.pop(col))
-
-        df = df.drop(columns=['Display Type']) # Drops the original Display Type column
 
+MONTH_NUMBERS = {name: number for number, month in enumerate(['january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+                                                               'september', 'october', 'november', 'december'], start=1)
+                 for name in (month, month[:3])} # Number of every month name and abbreviation
+MONTH_NUMBERS['sept'] = 9 # "2019, Sept" is a date too, as it was for pd.to_datetime
+DATE_PATTERN = re.compile(r'(\d{4})(?:,\s*(?:Q([1-4])|([A-Za-z]+)(?:\s+\d{1,2})?))?') # "2019", "2019, Q3", "2019, March" and "2019, March 12"
+NAT_ORDINAL = pd.NaT.value # Month ordinal of the dates that are not known
 
-        return df
 
-    def fix_Display_Size(self, df):
-        """""
-        This function fixes the Display Size Column. It extracts the most important information from this column
-        and creates 2 new columns with it - Screen to body ratio and Display size in inches
-        Finally, it drops the original Display Size Column
+def month_ordinal(text):
 
-        """""
+    """""
+    This function returns the month of a GSMArena date as a monthly Period ordinal (months since January 1970),
+    NAT_ORDINAL if the text is not a date. A year alone gives its January and a quarter its first month.
 
-        df["Screen_To_Body_Ratio_(%)"] = df["Display Size"].apply(lambda x: float(re.findall(r'~(.*?)%', x)[0]) 
-        if not pd.isnull(x) and str(x).strip() != "" and re.findall(r'~(.*?)%', x) else "Not Measured") # creates screen to body ratio column by finding the number between the ~ and % signs
-        df["Display_Size_(inches)"] = df["Display Size"].apply(lambda x: float(x[:x.find(" inches")].strip().split()[-1])
-        if x is not None and str(x).strip() != "" and str(x).find(" inches") != -1 else "Not Measured") # creates the Display size column by finding the number before the "inches" substring
+    """""
 
-        columns_to_move = ["Display_Size_(inches)", "Screen_To_Body_Ratio_(%)"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=19): # Iterates through the columns to move and moves them to the 19th, 20th positions
-            df.insert(i, col, df.pop(col))
+    match = DATE_PATTERN.fullmatch(text.strip())
+    if match is None:
+        return NAT_ORDINAL
+    year, quarter, month = match.groups()
+    if quarter:
+        number = 3 * int(quarter) - 2 # First month of the quarter
+    elif month:
+        number = MONTH_NUMBERS.get(month.lower())
+        if number is None:
+            return NAT_ORDINAL
+    else:
+        number = 1
+    return (int(year) - 1970) * 12 + number - 1
 
-        df = df.drop(columns='Display Size') # Drops the original Display Size column
 
-        return df
+def parse_announced(value):
 
-    def fix_Display_Resolution(self, df):
+    """""
+    This function parses a value of the Announced column, like "2019, March 12. Released 2019, April 5", into the months
+    the phone was announced and released, as Period ordinals. Without a release date, the phone was released when it was announced.
+    Expected dates ("Exp. announcement 2023, Q3" or "2023, March 2. Exp. release 2023, Q4") are not known dates.
 
-        """""
-        This function fixes the Display Resolution column. It extracts the most important information and creates 2 new columns with 
-        it - Aspect Ratio and Pixel Density. Finally, it drops the original Display Resolution column
+    """""
 
-        """"" 
+    if not isinstance(value, str):
+        return NAT_ORDINAL, NAT_ORDINAL
+    parts = re.split(r'\.\s*', value.strip(), maxsplit=1) # Announcement and release
+    if parts[0] == 'Exp': # Expected announcement
+        return NAT_ORDINAL, NAT_ORDINAL
 
-        df["Display_Aspect_Ratio"] = df["Display Resolution"].apply(lambda x: x[:x.find(" ratio")].strip().split()[-1]
-        if x is not None and str(x).strip() != "" and str(x).find(" ratio") != -1 else "Not Measured") # creates the Aspect Ratio column by finding the number before the "ratio" substring
+    announced = month_ordinal(parts[0])
+    if len(parts) == 1 or not parts[1]:
+        return announced, announced
+    if parts[1].startswith('Released'):
+        return announced, month_ordinal(parts[1][len('Released'):])
+    return announced, NAT_ORDINAL # Expected release
 
-        df["Pixel_Density"] = df["Display Resolution"].apply(lambda x: x[:x.find(" ppi")].strip().split()[-1]
-        if x is not None and str(x).strip() != "" and str(x).find(" ppi") != -1 else "Not Measured") # creates the Pixel Density column by finding the number before the "ppi" substring
-        df["Pixel_Density"] = df["Pixel_Density"].apply(lambda x: int(x.replace("(~",'')) if x != "Not Measured" and "~" in x else x) # removes the (~ from the Pixel Density column
 
-        columns_to_move = ["Display_Aspect_Ratio", "Pixel_Density"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=21): # Iterates through the columns to move and moves them to the 21st, 22nd positions
-            df.insert(i, col, df.pop(col))
+def parse_status(value):
 
-        df = df.drop(columns='Display Resolution') # Drops the original Display Size column
+    """""
+    This function parses the release month of a value of the Status column, like "Available. Released 2019, April 5", as a Period ordinal.
+    Statuses without a release date ("Cancelled" or "Coming soon. Exp. release 2023, Q1") give NAT_ORDINAL.
+    It returns a tuple, like parse_announced.
 
-        return df
+    """""
 
-    def fix_Display_Protection(self, df):
-        """""
-        This function fixes the Display Protection column. It extracts the most display protective glass information and creates a new column with 
-        it - Display_Protection. Finally, it drops the original Display Protection column
+    if not isinstance(value, str):
+        return (NAT_ORDINAL,)
+    release = re.split(r'\.\s*', value.strip())[-1]
+    return (month_ordinal(release[len('Released'):]) if release.startswith('Released') else NAT_ORDINAL,)
 
-        """""
 
+def map_unique_months(series, func, cache=None, key=None):
 
-        df["Display_Protection"] = df["Display Protection"].apply(lambda x: 
-            # gorilla glasses
-            "Corning Gorilla Glass 1" if not pd.isnull(x) and x.lower().find("gorilla glass 1") != -1 else
-            "Corning Gorilla Glass 2" if not pd.isnull(x) and x.lower().find("gorilla glass 2") != -1 else
-            "Corning Gorilla Glass 3" if not pd.isnull(x) and x.lower().find("gorilla glass 3") != -1 else
-            "Corning Gorilla Glass 3+" if not pd.isnull(x) and x.lower().find("gorilla glass 3+") != -1 else
-            "Corning Gorilla Glass 4" if not pd.isnull(x) and x.lower().find("gorilla glass 4") != -1 else
-            "Corning Gorilla Glass 5" if not pd.isnull(x) and x.lower().find("gorilla glass 5") != -1 else
-            "Corning Gorilla Glass 6" if not pd.isnull(x) and x.lower().find("gorilla glass 6") != -1 else
-            "Corning Gorilla Glass Victus+" if not pd.isnull(x) and x.lower().find("gorilla glass victus+") != -1 else
-            "Corning Gorilla Glass Victus" if not pd.isnull(x) and x.lower().find("gorilla glass victus") != -1 else
-            "Corning Gorilla Glass DX" if not pd.isnull(x) and x.lower().find("gorilla glass dx") != -1 else
-            "Corning Gorilla Glass DX+" if not pd.isnull(x) and x.lower().find("gorilla glass dx+") != -1 else
-            "Corning Gorilla Glass (unspecified)" if not pd.isnull(x) and x.lower().find("gorilla glass") != -1 else
-            
-            # dragontrail
-            "Asahi Dragontail Glass Pro" if not pd.isnull(x) and x.lower().find("dragontail glass pro") != -1 else
-            "Asahi Dragontail Glass" if not pd.isnull(x) and x.lower().find("dragontail") != -1 else
+    """""
+    This function is map_unique for the date parsers, which return a tuple of month ordinals per value.
+    func is called once per distinct value (and once for the missing values), and the tuples are split into one int64 array
+    of ordinals per element of the tuples, for all the rows.
 
-            # sapphire
-            "Sapphire Crystal Glass" if not pd.isnull(x) and x.lower().find("sapphire") != -1 else
+    """""
 
-            # Huawei
-            "Huawei Kunlun Glass" if not pd.isnull(x) and x.lower().find("huawei") != -1 else
+    codes, uniques = pd.factorize(series)
+    results = cache.lookup(key, uniques, func) if cache is not None else call_extractor(func, uniques, False)
+    months = np.array(list(results) + [func(np.nan)], dtype=np.int64) # The last row is for the missing values
+    months = months[np.where(codes == -1, len(uniques), codes)] # Broadcasts the ordinals back to the rows
+    return list(months.T)
 
-            "Rainbow Glass" if not pd.isnull(x) and x.lower().find("rainbow") != -1 else
-            "Innolux Glass" if not pd.isnull(x) and x.lower().find("innolux") != -1 else
 
-            "Ceramic Shield Glass" if not pd.isnull(x) and x.lower().find("ceramic") != -1 else
-            "Yes (unspecified)" if not pd.isnull(x) and x.lower().find("yes") != -1 else
-            "AGC Glass" if not pd.isnull(x) and x.lower().find("agc") != -1 else
-            "Panda Glass" if not pd.isnull(x) and x.lower().find("panda") != -1 else
+VIDEO_RESOLUTIONS = [("8K", "8K"), ("4K", "4K"), ("1440p", "(?i:1440p)"), ("1080p", "(?i:1080p)"), ("1152p", "(?i:1152p)"), ("720p", "(?i:720p)"),
+                     ("480p", "(?i:480p)"), ("360p", "(?i:360p)"), ("240p", "(?i:240p)"), ("320p", "(?i:320p)"), ("288p", "(?i:288p)"),
+                     ("144p", "(?i:144p)"), ("120p", "(?i:120p)"), ("QCIF", "(?i:qcif)"), ("QCIF", "(?i:176x144)"), ("CIF", "(?i:cif)"),
+                     ("CIF", "(?i:352x288)"), ("QVGA", "(?i:qvga)"), ("VGA", "vga")] # (label, regex) of every video resolution, in order of priority
+VIDEO_RESOLUTION_PATTERN = re.compile("(?=" + "|".join("({})".format(regex) for _, regex in VIDEO_RESOLUTIONS) + ")") # Overlapping resolutions are all found
+VIDEO_MODE_PATTERN = re.compile(r'([^\s@,;()]+)@(\d+(?:/\d+)*)\s*fps', re.IGNORECASE) # "4K@24/30/60fps"
 
-            "Schott UTG Glass" if not pd.isnull(x) and x.lower().find("schott utg") != -1 else
-            "Schott Xensation Glass" if not pd.isnull(x) and x.lower().find("schott") != -1 else
-            "NEG Dinorex T2X-1 Glass" if not pd.isnull(x) and x.lower().find("dino") != -1 else
-            "NEG Dinorex T2X-1 Glass" if not pd.isnull(x) and x.lower().find("t2x") != -1 else
-            "NEG Dinorex T2X-1 Glass" if not pd.isnull(x) and x.lower().find("neg") != -1 else
-            "Ion-strengthened Glass" if not pd.isnull(x) and x.lower().find("ion") != -1 else
-            "Ion-strengthened Glass" if not pd.isnull(x) and x.lower().find("strength") != -1 else
 
+def parse_video_spec(value):
 
+    """""
+    This function parses a value of the Rear Video or Selfie Video column, like "4K@30/60fps, 1080p@30/60/240fps, 10-bit HDR, gyro-EIS",
+    into a (resolution, framerate, modes, hdr, gyro_eis, ten_bit) tuple.
+    resolution and framerate are the highest video recording resolution and its framerates, read from the first mode of the string
+    ("4K" and "30/60"), "no video" if the phone records no video and "unspecified" if they are not given.
+    modes are all the (resolution, framerates) pairs of the string, like (("4K", (30, 60)), ("1080p", (30, 60, 240))),
+    and hdr, gyro_eis and ten_bit flag the HDR, gyro-EIS and 10-bit recording. Missing values give NaN for resolution and framerate,
+    because the two video columns label them differently.
 
-            "no special protection"
-        )
-        columns_to_move = ["Display_Protection"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=23): # Iterates through the columns to move and moves them to the 23rd position
-            df.insert(i, col, df.pop(col))
+    """""
 
-        df = df.drop(columns='Display Protection') # Drops the original Display Protection column
+    if not isinstance(value, str):
+        return np.nan, np.nan, (), False, False, False
+    lower = value.lower()
+    if lower.strip() == "no": # If the value is "no", the phone records no video
+        return "no video", "no video", (), False, False, False
 
-        return df
+    first = value.split(",")[0] # The first mode is the highest resolution
+    matches = [i for groups in VIDEO_RESOLUTION_PATTERN.findall(first) for i, group in enumerate(groups) if group] # Priorities of the resolutions found
+    if matches: # The resolution of highest priority found in the first mode
+        resolution = VIDEO_RESOLUTIONS[min(matches)][0]
+    else:
+        res = [i for i in first.split(" ") if i[-2:] == "p@"] # Other resolutions, like "2160p@"
+        resolution = res[0][:-2] + "p" if res else "unspecified"
 
-    def fix_Operating_Software(self, df):
-        """""
-        This function fixes the Operating Software column. It extracts the most common operating system information and creates a new column with
-        it - Mobile_OS. It retains the original information in the Mobile_OS_Version column.
-        Finally, it drops the original Operating Software column
+    fps = [i for i in first.split("@") if i[-3:] == "fps" or i[-4:] == "fps."] # The framerates before the fps substring
+    framerate = (fps[0][:-3] if fps[0][-3:] == "fps" else fps[0][:-4]) if fps else "unspecified"
 
-        """""
+    modes = tuple((mode, tuple(int(rate) for rate in rates.split("/"))) for mode, rates in VIDEO_MODE_PATTERN.findall(value))
+    return resolution, framerate, modes, "hdr" in lower, "gyro-eis" in lower, "10-bit" in lower
 
 
-        df["Mobile_OS"] = df["Operating Software"].apply(lambda x: 
-            # Android
-            "Android" if not pd.isnull(x) and x.lower().find("android") != -1 else # If the value is not null and the string contains "android", then it is Android
-                
-                
-            # Apple
-            "iOS" if not pd.isnull(x) and x.lower().find("ios") != -1 else # If the value is not null and the string contains "ios", then it is iOS
-            "iPad OS" if not pd.isnull(x) and x.lower().find("ipad") != -1 else # If the value is not null and the string contains "ipad", then it is iPad OS
-            "watchOS" if not pd.isnull(x) and x.lower().find("watchos") != -1 else # If the value is not null and the string contains "watchos", then it is watchOS
+def map_unique_fields(series, func, cache=None, key=None, vectorized=False):
 
-            # Blackerry
-            "Blackberry Tablet OS" if not pd.isnull(x) and x.lower().find("blackberry tablet") != -1 else # If the value is not null and the string contains "blackberry tablet", then it is Blackberry Tablet OS
-            "Blackberry OS" if not pd.isnull(x) and x.lower().find("blackberry") != -1 else # If the value is not null and the string contains "blackberry", then it is Blackberry OS
+    """""
+    This function is map_unique for the parsers that return a tuple of fields per value, like parse_video_spec and parse_cpu.
+    func is called once per distinct value (and once for the missing values), and every field is broadcast back to the rows
+    as a Series of its own, with the dtype Series.apply would give.
+    If vectorized is True, func takes a Series of distinct values and returns a Series of tuples instead of taking a single value.
 
-            # Huawei
-            "HarmonyOS" if not pd.isnull(x) and x.lower().find("harmony") != -1 else # If the value is not null and the string contains "harmony", then it is HarmonyOS
-            "Huawei Lite OS" if not pd.isnull(x) and x.lower().find("huawei lite") != -1 else # If the value is not null and the string contains "huawei lite", then it is Huawei Lite OS
-            "EMUI" if not pd.isnull(x) and x.lower().find("emui") != -1 else # If the value is not null and the string contains "emui", then it is EMUI
+    """""
 
-            # Microsoft
-            "Microsoft Windows Mobile" if not pd.isnull(x) and x.lower().find("microsoft windows mobile") != -1 else # If the value is not null and the string contains "microsoft windows mobile", then it is Microsoft Windows Mobile
-            "Microsoft Windows Phone" if not pd.isnull(x) and x.lower().find("microsoft windows phone") != -1 else # If the value is not null and the string contains "microsoft windows phone", then it is Microsoft Windows Phone
-            "Microsoft Windows PocketPC" if not pd.isnull(x) and x.lower().find("microsoft windows pocketpc") != -1 else # If the value is not null and the string contains "microsoft windows pocketpc", then it is Microsoft Windows PocketPC
-            "Microsoft Smartphone" if not pd.isnull(x) and x.lower().find("microsoft smartphone") != -1 else # If the value is not null and the string contains "microsoft smartphone", then it is Microsoft Smartphone
-            "Microsoft Windows" if not pd.isnull(x) and x.lower().find("microsoft windows") != -1 else # If the value is not null and the string contains "microsoft windows", then it is Microsoft Windows
-            "Microsoft Windows" if not pd.isnull(x) and x.lower().find("wince") != -1 else # If the value is not null and the string contains "wince", then it is Microsoft Windows
+    codes, uniques = pd.factorize(series)
+    results = cache.lookup(key, uniques, func, vectorized) if cache is not None else call_extractor(func, uniques, vectorized)
+    missing_result = call_extractor(func, [np.nan], vectorized)[0] # Every parser returns tuples of the same length
+    missing = codes == -1
+    if missing.any():
+        results = list(results) + [missing_result] # The last result is for the missing values
+        codes = np.where(missing, len(uniques), codes)
 
-            # Nokia
-            "Symbian" if not pd.isnull(x) and x.lower().find("symbian") != -1 else # If the value is not null and the string contains "symbian", then it is Symbian
-            "Nokia Asha Software Platform" if not pd.isnull(x) and x.lower().find("nokia asha") != -1 else # If the value is not null and the string contains "nokia asha", then it is Nokia Asha Software Platform
-            "Internet Tablet OS" if not pd.isnull(x) and x.lower().find("internet tablet") != -1 else # If the value is not null and the string contains "internet tablet", then it is Internet Tablet OS
-            
-            # Samsung
-            "Bada OS" if not pd.isnull(x) and x.lower().find("bada") != -1 else # If the value is not null and the string contains "bada", then it is Bada OS
-            "Tizen OS" if not pd.isnull(x) and x.lower().find("tizen") != -1 else # If the value is not null and the string contains "tizen", then it is Tizen OS
-            "Touchwiz Lite UI" if not pd.isnull(x) and x.lower().find("touchwiz lite ui") != -1 else # If the value is not null and the string contains "touchwiz lite ui", then it is Touchwiz Lite UI
+    fields = []
+    for i in range(len(missing_result)):
+        values = [result[i] for result in results]
+        field = pd.Series(values, dtype=None if values else object).take(codes)
+        field.index = series.index
+        fields.append(field)
+    return fields
 
-            # Others
-            "Firefox OS" if not pd.isnull(x) and x.lower().find("firefox") != -1 else  # If the value is not null and the string contains "firefox", then it is Firefox OS
-            "Proprietary OS" if not pd.isnull(x) and x.lower().find("proprietary") != -1 else # If the value is not null and the string contains "proprietary", then it is Proprietary OS
-            "Linux" if not pd.isnull(x) and x.lower().find("linux") != -1 else # If the value is not null and the string contains "linux", then it is Linux
-            "LiMo OS" if not pd.isnull(x) and x.lower().find("limo") != -1 else # If the value is not null and the string contains "limo", then it is LiMo OS
-            "Danger" if not pd.isnull(x) and x.lower().find("danger") != -1 else # If the value is not null and the string contains "danger", then it is Danger
-            "Sonim OS" if not pd.isnull(x) and x.lower().find("sonim") != -1 else  # If the value is not null and the string contains "sonim", then it is Sonim OS
-            "Palm OS" if not pd.isnull(x) and x.lower().find("palm") != -1 else # If the value is not null and the string contains "palm", then it is Palm OS
-            "KaiOS" if not pd.isnull(x) and x.lower().find("kai") != -1 else # If the value is not null and the string contains "kai", then it is KaiOS
-            "Maemo OS" if not pd.isnull(x) and x.lower().find("maemo") != -1 else # If the value is not null and the string contains "maemo", then it is Maemo OS
-            "MeeGo" if not pd.isnull(x) and x.lower().find("meego") != -1 else # If the value is not null and the string contains "meego", then it is MeeGo
-            "Sailfish OS" if not pd.isnull(x) and x.lower().find("sailfish") != -1 else # If the value is not null and the string contains "sailfish", then it is Sailfish OS
-            "Ubuntu Touch" if not pd.isnull(x) and x.lower().find("ubuntu touch") != -1 else # If the value is not null and the string contains "ubuntu touch", then it is Ubuntu Touch
-            "Ubuntu" if not pd.isnull(x) and x.lower().find("ubuntu") != -1 else # If the value is not null and the string contains "ubuntu", then it is Ubuntu
-            "WebOS" if not pd.isnull(x) and x.lower().find("webos") != -1 else # If the value is not null and the string contains "webos", then it is WebOS
-            "Flyme OS" if not pd.isnull(x) and x.lower().find("flyme") != -1 else # If the value is not null and the string contains "flyme", then it is Flyme OS
-            "Moto Watch OS" if not pd.isnull(x) and x.lower().find("moto watch") != -1 else # If the value is not null and the string contains "moto watch", then it is Moto Watch OS
-            "Chrome OS" if not pd.isnull(x) and x.lower().find("chrome") != -1 else # If the value is not null and the string contains "chrome", then it is Chrome OS
-
-            "unspecified" # If none of the above conditions are met, then it is unspecified
-        )
 
-        df["Mobile_OS_Version"] = df["Operating Software"].str.strip()
-        df['Mobile_OS_Version'] = df['Mobile_OS_Version'].fillna('unspecified') # Fills the missing values with 'unspecified'
+BUILD_PARTS = ['front', 'back', 'frame'] # Materials of the Build column, in the order of parse_build
+BUILD_PARENTHESES_PATTERN = re.compile(r'\((.*)\)') # Everything from the first "(" to the last ")"
+BUILD_BRACKETS_PATTERN = re.compile(r'[\[\]]')
 
-        columns_to_move = ["Mobile_OS", "Mobile_OS_Version"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=24): # Iterates through the columns to move and moves them to the 24th and 25th positions
-            df.insert(i, col, df.pop(col))
 
-        df = df.drop(columns='Operating Software') # Drops the original Display Protection column
+def parse_build(value):
 
-        return df
+    """""
+    This function parses a value of the Build column, like "Glass front (Gorilla Glass 5), glass back, aluminum frame",
+    into a (front, back, frame) tuple of materials, like ("Glass", "glass", "aluminum"). The string is split once,
+    the comma-separated parts that mention a material are kept for it and its details in parentheses are removed.
+    Missing values and materials that are not mentioned give "".
 
+    """""
 
-    def fix_Chipset(self, df):
-        """""
-        This function fixes the Chipset column. It extracts the Chipset maker information and creates a new column with
-        it - Chipset_Maker. It then extracts the fabrication process information and forms a new column of integers
-        with it - 'Fabrication_Process'.
-        Finally, it drops the original Chipset column
+    parts = str(value).split(',')
+    materials = []
+    for part_name in BUILD_PARTS:
+        text = str([part for part in parts if part_name in part]) # Kept as the string of the list, so that quotes are removed as before
+        text = BUILD_BRACKETS_PATTERN.sub('', BUILD_PARENTHESES_PATTERN.sub('', text))
+        materials.append(text.replace(part_name, '').replace("'", '').strip())
+    return tuple(materials)
 
-        """""
 
+SIM_NUMBERS = {'2': 2, 'yes': 1, '4': 4, 'dual': 2, 'no': 0, 'triple': 3, '1': 1, 'nan': 0} # Number of SIMs implied by every word, 1 for the other words
+SIM_TYPES = {'mini-sim': 'Mini-SIM', 'micro-sim': 'Micro-SIM', 'nano-sim': 'Nano-SIM', 'esim': 'eSIM'} # Type of SIM implied by the first word
 
-        df["Chipset_Maker"] = df["Chipset"].apply(lambda x: 
-            # checks
-            "Qualcomm" if not pd.isnull(x) and x.lower().find("qualcomm") != -1 else # If the value is not null and the string contains "qualcomm", then it is Qualcomm
-            "MediaTek" if not pd.isnull(x) and x.lower().find("mediatek") != -1 else # If the value is not null and the string contains "mediatek", then it is MediaTek
-            "MediaTek" if not pd.isnull(x) and x.lower().find("mt") != -1 else # If the value is not null and the string contains "mt", then it is MediaTek
-            "NVIDIA" if not pd.isnull(x) and x.lower().find("nvidia") != -1 else # If the value is not null and the string contains "nvidia", then it is NVIDIA
-            "Marvell" if not pd.isnull(x) and x.lower().find("marvell") != -1 else # If the value is not null and the string contains "marvell", then it is Marvell
-            "Intel" if not pd.isnull(x) and x.lower().find("intel") != -1 else # If the value is not null and the string contains "intel", then it is Intel
-            "Qualcomm" if not pd.isnull(x) and x.lower().find("msm") != -1 else # If the value is not null and the string contains "msm", then it is Qualcomm
-            "UNISOC" if not pd.isnull(x) and x.lower().find("spreadtrum") != -1 else # If the value is not null and the string contains "spreadtrum", then it is UNISOC
-            "UNISOC" if not pd.isnull(x) and x.lower().find("unisoc") != -1 else # If the value is not null and the string contains "unisoc", then it is UNISOC
-            "UNISOC" if not pd.isnull(x) and x.lower().find("sc") != -1 else # If the value is not null and the string contains "sc", then it is UNISOC
-            "Allwinner" if not pd.isnull(x) and x.lower().find("allwinner") != -1 else # If the value is not null and the string contains "allwinner", then it is Allwinner
-            "Broadcom" if not pd.isnull(x) and x.lower().find("bcm") != -1 else # If the value is not null and the string contains "bcm", then it is Broadcom
-            "Broadcom" if not pd.isnull(x) and x.lower().find("broadcom") != -1 else # If the value is not null and the string contains "broadcom", then it is Broadcom
-            "Xiaomi" if not pd.isnull(x) and x.lower().find("xiaomi") != -1 else # If the value is not null and the string contains "xiaomi", then it is Xiaomi
-            "Leadcore" if not pd.isnull(x) and x.lower().find("leadcore") != -1 else # If the value is not null and the string contains "leadcore", then it is Leadcore
-            "JLQ" if not pd.isnull(x) and x.lower().find("jlq") != -1 else # If the value is not null and the string contains "jlq", then it is JLQ
-            "Rockchip" if not pd.isnull(x) and x.lower().find("rockchip") != -1 else # If the value is not null and the string contains "rockchip", then it is Rockchip
-            "Rockchip" if not pd.isnull(x) and x.lower().find("rochip") != -1 else # If the value is not null and the string contains "rochip", then it is Rockchip
-            "Exynos" if not pd.isnull(x) and x.lower().find("exynos") != -1 else # If the value is not null and the string contains "exynos", then it is Exynos
-            "TI" if not pd.isnull(x) and x.lower().find("ti") != -1 else # If the value is not null and the string contains "ti", then it is TI
-            "Hummingbird" if not pd.isnull(x) and x.lower().find("hummingbird") != -1 else # If the value is not null and the string contains "hummingbird", then it is Hummingbird
-            "Apple" if not pd.isnull(x) and x.lower().find("apple") != -1 else # If the value is not null and the string contains "apple", then it is Apple
-            "NovaThor" if not pd.isnull(x) and x.lower().find("novathor") != -1 else # If the value is not null and the string contains "novathor", then it is NovaThor
-            "Rockchip" if not pd.isnull(x) and x.lower().find("rockchip") != -1 else # If the value is not null and the string contains "rockchip", then it is Rockchip
-            "Philips" if not pd.isnull(x) and x.lower().find("philips") != -1 else # If the value is not null and the string contains "philips", then it is Philips
-            "Pega-Dual" if not pd.isnull(x) and x.lower().find("pega") != -1 else # If the value is not null and the string contains "pega", then it is Pega-Dual
-            "LG" if not pd.isnull(x) and x.lower().find("lg") != -1 else # If the value is not null and the string contains "lg", then it is LG
-            "Intel®" if not pd.isnull(x) and x.lower().find("intel") != -1 else # If the value is not null and the string contains "intel", then it is Intel
-            "Vivante" if not pd.isnull(x) and x.lower().find("vivante") != -1 else # If the value is not null and the string contains "vivante", then it is Vivante
-            "Huawei" if not pd.isnull(x) and x.lower().find("huawei") != -1 else # If the value is not null and the string contains "huawei", then it is Huawei
-            "Kirin" if not pd.isnull(x) and x.lower().find("kirin") != -1 else # If the value is not null and the string contains "kirin", then it is Kirin
-            "ATI" if not pd.isnull(x) and x.lower().find("ati") != -1 else # If the value is not null and the string contains "ati", then it is ATI
-            "HiSilicon" if not pd.isnull(x) and x.lower().find("hisilicon") != -1 else # If the value is not null and the string contains "hisilicon", then it is HiSilicon
-            "Google" if not pd.isnull(x) and x.lower().find("google") != -1 else # If the value is not null and the string contains "google", then it is Google
-            "Infineon" if not pd.isnull(x) and x.lower().find("infineon") != -1 else # If the value is not null and the string contains "infineon", then it is Infineon
-            "Nordic Semiconductor" if not pd.isnull(x) and x.lower().find("nrf") != -1 else # If the value is not null and the string contains "nrf", then it is Nordic Semiconductor
-            "RDA" if not pd.isnull(x) and x.lower().find("rda") != -1 else # If the value is not null and the string contains "rda", then it is RDA
-            "VIA" if not pd.isnull(x) and x.lower().find("via") != -1 else # If the value is not null and the string contains "via", then it is VIA
-            "STM" if not pd.isnull(x) and x.lower().find("st") != -1 else # If the value is not null and the string contains "st", then it is STM
-            "Qualcomm" if not pd.isnull(x) and x.lower().find("snapdragon") != -1 else # If the value is not null and the string contains "snapdragon", then it is Qualcomm
-            "Qualcomm" if not pd.isnull(x) and x.lower().find("qm") != -1 else # If the value is not null and the string contains "qm", then it is Qualcomm
-        
-            "unspecified" # If none of the above conditions are met, then it is unspecified
-        )
 
-        df['Fabrication_Process'] = df['Chipset'].str.extract("\(([^)]+)\)", expand=False).str.replace("nm", "") # Extracts the fabrication process from the Chipset column and removes the "nm" from the end of the string
-        df['Fabrication_Process'] = df['Fabrication_Process'].where(df['Chipset'].str.contains("\("), "unspecified") # If the Chipset column does not contain "(", then the fabrication process is unspecified
-        df['Fabrication_Process'] = pd.to_numeric(df['Fabrication_Process'], errors='coerce').fillna(0).astype(int) # Converts the fabrication process to an integer
+def parse_sim(value):
 
-        columns_to_move = ["Chipset_Maker", "Fabrication_Process"] # Columns to move
-        for i, col in enumerate(columns_to_move, start=26): # Iterates through the columns to move and moves them to the 26th and 27th positions
-            df.insert(i, col, df.pop(col))
+    """""
+    This function parses a value of the SIM column, like "Nano-SIM and eSIM" or "Dual SIM (Nano-SIM, dual stand-by)",
+    into a (number of SIMs, type of SIM) tuple. The words are split once and looked up in SIM_NUMBERS and SIM_TYPES.
 
-        df = df.drop(columns=["Chipset"]) # Drops the original Chipset column
-        
-        return df
+    """""
 
-    def fix_CPU(self, df):
+    words = str(value).lower().split(' ')
+    return max(SIM_NUMBERS.get(word, 1) for word in words), SIM_TYPES.get(words[0], 'Unspecified')
 
-        """""
-        This function fixes the CPU column by extracting the CPU speed and the number of cores from the CPU column.
-        It creates three new columns: Number_of_CPU_Cores CPU_Perfomance_Core_Frequency and CPU_Perfomance_Core_Frequency.
-        It also drops the original CPU column.
 
-        """""
+CPU_CORES = KeywordClassifier([
+    (2, "dual"),
+    (4, "quad"),
+    (6, "hexa"),
+    (8, "octa"),
+    (10, "deca"),
+    (12, "dodeca"),
+    (16, "hexadeca"),
+], default=1, null="Unspecified") # Number of cores implied by the CPU string, assuming 1 core if none is found
+CPU_CLUSTER_PATTERN = re.compile(r'(?:(\d+)\s*x\s*)?(\d+\.\d+\s*(?:GHz)|\d+\d+\s*(?:MHz))'
+                                 r'((?:(?!\d+\.\d+\s*(?:GHz)|\d+\d+\s*(?:MHz))[^&+,()])*)') # "2x2.8 GHz Cortex-A715", the core name never hides a frequency
+CPU_CLUSTER_WIDTH = 4 # Clusters kept by cluster_array, big.LITTLE phones have up to 4
 
 
-        df["Number_of_CPU_Cores"] = df["CPU"].apply(lambda x: 
-            
-            "Unspecified" if pd.isnull(x) else # checks for NaN values
-
-            int(2) if x.lower().find("dual") != -1 else # If the value is not null and the string contains "dual", then it is dual core
-            int(4) if x.lower().find("quad") != -1 else # If the value is not null and the string contains "quad", then it is quad core
-            int(6) if x.lower().find("hexa") != -1 else # If the value is not null and the string contains "hexa", then it is hexa core
-            int(8) if x.lower().find("octa") != -1 else # If the value is not null and the string contains "octa", then it is octa core
-            int(10) if x.lower().find("deca") != -1 else # If the value is not null and the string contains "deca", then it is deca core
-            int(12) if x.lower().find("dodeca") != -1 else # If the value is not null and the string contains "dodeca", then it is dodeca core
-            int(16) if x.lower().find("hexadeca") != -1 else # If the value is not null and the string contains "hexadeca", then it is hexadeca core
-
-            int(1) # If none of the above conditions are met, then assume 1 core
-
-        )
-
-        def extract_max_processor_frequency(value): # Extracts the maximum processor frequency from the CPU column
-            if value is not np.nan: # Checks for NaN values
-                freq = re.findall(r'\d+\.\d+\s*(?:GHz)|\d+\d+\s*(?:MHz)', value) # Finds all the frequencies in the string
-                
-                if freq: # Checks if the list is not empty
-                    freq = [f.split(" ")[0] for f in freq] # Splits the string at the space and takes the first element
-                    freq = [float(f.replace("GHz", "").replace("MHz", "")) for f in freq] # Removes the "GHz" and "MHz" from the string and converts it to a float
-                    max_freq = max(freq) # Finds the maximum frequency
-                    if max_freq >= 100: # Checks if the frequency is in MHz
-                        return max_freq/1000 # Converts the frequency to GHz
-                    else:
-                        return max_freq # Returns the frequency in GHz
-                else:
-                    return np.nan # Returns NaN if the list is empty
-            else:
-                return np.nan # Returns NaN if the value is NaN
-
-        def extract_min_processor_frequency(value): # Extracts the minimum processor frequency from the CPU column
-            if value is not np.nan: # Checks for NaN values
-                freq = re.findall(r'\d+\.\d+\s*(?:GHz)|\d+\d+\s*(?:MHz)', value) # Finds all the frequencies in the string
-                if freq: # Checks if the list is not empty
-                    freq = [f.split(" ")[0] for f in freq] # Splits the string at the space and takes the first element
-                    freq = [float(f.replace("GHz", "").replace("MHz", "")) for f in freq] # Removes the "GHz" and "MHz" from the string and converts it to a float
-                    min_freq =  min(freq) # Finds the minimum frequency
-                    if min_freq >= 100: # Checks if the frequency is in MHz
-                        return min_freq/1000 # Converts the frequency to GHz
-                    else:
-                        return min_freq # Returns the frequency in GHz
-                else:
-                    return np.nan # Returns NaN if the list is empty
-            else:
-                return np.nan # Returns NaN if the value is NaN
+def parse_cpu(value):
 
-        def extract_processor_frequency_df(df): # Extracts the maximum and minimum processor frequencies from the CPU column
-            df['CPU_Performance_Core_Frequency'] = df['CPU'].apply(extract_max_processor_frequency) # Extracts the maximum processor frequency
-            df['CPU_Efficiency_Core_Frequency'] = df['CPU'].apply(extract_min_processor_frequency) # Extracts the minimum processor frequency
-            df['CPU_Performance_Core_Frequency'].fillna(value="unspecified", inplace=True) # Fills the NaN values with "unspecified"
-            df['CPU_Efficiency_Core_Frequency'].fillna(value="unspecified", inplace=True) # Fills the NaN values with "unspecified"
-            return df
+    """""
+    This function parses a value of the CPU column, like "Octa-core (1x3.2 GHz Cortex-X3 & 2x2.8 GHz Cortex-A715 & 5x2.0 GHz Cortex-A510)",
+    in a single pass into a (cores, max_frequency, min_frequency, clusters, core_ghz) tuple.
+    clusters are the (count, GHz, core name) records of the string, like ((1, 3.2, "Cortex-X3"), (2, 2.8, "Cortex-A715"), ...).
+    A frequency without a count, like "Quad-core 1.3 GHz", is a cluster of all the cores if it is the only one and of 0 (unknown) cores otherwise.
+    core_ghz is the sum of count x GHz over the clusters. max_frequency and min_frequency, in GHz, are NaN if the string has no frequency.
 
-        df = extract_processor_frequency_df(df) # Extracts the maximum and minimum processor frequencies from the CPU column
+    """""
 
-        columns_to_move = ['Number_of_CPU_Cores', 'CPU_Performance_Core_Frequency', 'CPU_Efficiency_Core_Frequency'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=28): # Iterates through the columns to move and moves them to the 28th and 29th and 30thpositions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    if not isinstance(value, str):
+        return CPU_CORES.null, np.nan, np.nan, (), np.nan
 
-        df = df.drop(columns=["CPU"]) # Drops the original CPU column
+    cores = CPU_CORES.classify(value)
+    matches = CPU_CLUSTER_PATTERN.findall(value)
+    if not matches:
+        return cores, np.nan, np.nan, (), np.nan
 
-        return df
+    numbers = [float(frequency.split(" ")[0].replace("GHz", "").replace("MHz", "")) for _, frequency, _ in matches]
+    max_frequency, min_frequency = max(numbers), min(numbers) # Frequencies of 100 and more are in MHz
+    max_frequency = max_frequency / 1000 if max_frequency >= 100 else max_frequency
+    min_frequency = min_frequency / 1000 if min_frequency >= 100 else min_frequency
 
-    def fix_SD_Card_Slot(self, df):
-        """""
-        This function fixes the SD Card Slot column. It specifies the type of SD Card Slot. Unless "no" is pecified, it is assumed that the phone has an SD Card Slot.
+    clusters = tuple((int(count) if count else (cores if len(matches) == 1 else 0), number / 1000 if "MHz" in frequency else number, name.strip())
+                     for (count, frequency, name), number in zip(matches, numbers))
+    return cores, max_frequency, min_frequency, clusters, sum(count * ghz for count, ghz, _ in clusters)
 
-        """""
 
+def cluster_array(clusters, width=CPU_CLUSTER_WIDTH):
 
-        df["SD Card Slot"] = df["SD Card Slot"].apply(lambda x: 
-            # checks
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the value is not null and the string contains "no", then it is no
-            "microSDHC" if not pd.isnull(x) and x.lower().find("microsdhc") != -1 else # If the value is not null and the string contains "microsdhc", then it is microSDHC
-            "microSDXC" if not pd.isnull(x) and x.lower().find("microsdxc") != -1 else # If the value is not null and the string contains "microsdxc", then it is microSDXC
-            "microSD" if not pd.isnull(x) and x.lower().find("microsd") != -1 else # If the value is not null and the string contains "microsd", then it is microSD
-            "miniSD" if not pd.isnull(x) and x.lower().find("minisd") != -1 else # If the value is not null and the string contains "minisd", then it is miniSD
-            "SDHC" if not pd.isnull(x) and x.lower().find("sdhc") != -1 else # If the value is not null and the string contains "sdhc", then it is SDHC
-            "SDXC" if not pd.isnull(x) and x.lower().find("sdxc") != -1 else # If the value is not null and the string contains "sdxc", then it is SDXC
-            "SD" if not pd.isnull(x) and x.lower().find("sd") != -1 else # If the value is not null and the string contains "sd", then it is SD
-            "Memory Stick Duo Pro" if not pd.isnull(x) and x.lower().find("memory stick duo pro") != -1 else # If the value is not null and the string contains "memory stick duo pro", then it is Memory Stick Duo Pro
-            "Memory Stick Duo" if not pd.isnull(x) and x.lower().find("memory stick duo") != -1 else # If the value is not null and the string contains "memory stick duo", then it is Memory Stick Duo
-            "Memory Stick" if not pd.isnull(x) and x.lower().find("memory stick") != -1 else # If the value is not null and the string contains "memory stick pro duo", then it is Memory Stick Pro Duo
-            "Yes" # If none of the above conditions are met, then assume yes
-        )
+    """""
+    This function turns a Series of CPU clusters, as given by parse_cpu, into a compact fixed-width float32 array
+    of shape (rows, width, 2), holding the (count, GHz) of the first width clusters of every row, padded with NaN.
+    Every distinct tuple of clusters is only converted once.
 
-        return df
+    """""
 
+    codes, uniques = pd.factorize(clusters)
+    arrays = np.full((len(uniques) + 1, width, 2), np.nan, dtype=np.float32) # The last array is for the missing values
+    for i, records in enumerate(uniques):
+        for j, (count, ghz, _) in enumerate(records[:width]):
+            arrays[i, j] = count, ghz
+    return arrays[np.where(codes == -1, len(uniques), codes)]
 
-        
-    def fix_Number_of_Rear_Cameras(self, df):
-        """""
-        This function fixes the Number of Rear Cameras column. It specifies the number of rear cameras. Unless "no" is pecified,
-        It is assumed that the phone has a rear camera. The number of rear cameras is implied from the string eg. "Penta" implies 5 rear cameras.
-        If both the Numner of Rear Cameras and the Camera column are null, then the number of rear cameras is assumed to be 0.
-        if the Number of Rear Cameras column is null, but the Camera column is not null, then the number of rear cameras is assumed to be 1.
 
-        """""
+LOUDSPEAKER_PATTERN = r'(?s)^([^/]*)(?:/([^/]*))?(?:.*/([^/]*))?$' # "Voice 66dB / Noise 73dB / Ring 82dB", the ring is the last part
 
-        def has_camera_or_not(x):
-            """""
-            This function checks if the phone has a camera or not. 
-            If the string in the Camera column contains "no" or is null, 
-            then it is assumed that the phone does not have a camera.
 
-            """""
+def vectorized_loudspeaker(values):
 
-            if pd.isnull(x) or x.lower().find("no") != -1: # If the value is null or the string contains "no", then it has no camera
-                return 0 # Returns 0
-            return np.nan # Returns NaN for all rows with a camera
-        
-        def get_num_cameras(x):
+    """""
+    This function is the vectorized version of extract_loudspeaker: the first whole number of the voice, noise and ring parts
+    of every row, as a (voice, noise, ring) tuple with None for the parts without a number. Values measured in LUFS are not used.
+    The parts are split by a single str.extract, and the numbers of all the parts are found by one more per part.
 
-            """""
-            This function extracts the number of cameras from the string in the Number of Rear Cameras column.
-            Its results are used to fill the NaN values with the values with the extracted number of cameras.
+    """""
 
-            """""
+    text = as_text(values)
+    text = text.where(~text.str.contains("LUFS", regex=False).fillna(False).to_numpy(dtype=bool)) # Values in LUFS are not in dB
+    parts = text.str.extract(LOUDSPEAKER_PATTERN)
+    parts[2] = parts[2].fillna(parts[1]).fillna(parts[0]) # With fewer than three parts, the ring is the last one
 
-            if not isinstance(x, str): # If the value is not a string, then return 1
-                return 1 # Returns deafault value 1 for all rows with a camera
-            
-            if x.lower().find("penta") != -1: # If the string contains "penta", then return 5
-                return 5
-            if x.lower().find("five") != -1: # If the string contains "five", then return 5
-                return 5
-            if x.lower().find("quad") != -1: # If the string contains "quad", then return 4
-                return 4
-            if x.lower().find("triple") != -1: # If the string contains "triple", then return 3
-                return 3
-            if x.lower().find("dual") != -1: # If the string contains "dual", then
-                return 2
-            if x.lower().find("single") != -1: # If the string contains "single", then return 1
-                return 1    
-
-        df["Number_of_Rear_Cameras"] = df["Camera"].apply(lambda x: has_camera_or_not(x)) # Creates a new column with the results of the has_camera_or_not function
-        
-        df["Number_of_Rear_Cameras"] = df["Number_of_Rear_Cameras"].fillna(df["Number of Rear Cameras"].apply(lambda x: get_num_cameras(x))) # Fills the NaN values with the results of the get_num_cameras function
+    numbers = []
+    for part in range(3):
+        first = as_text(parts[part]).str.extract(r'(\d+)', expand=False) # First number of the part, NaN if there is none
+        found = first.notna().to_numpy()
+        numbers.append(fill_results(len(found), np.flatnonzero(found), first[found].astype(np.int64), np.ones(found.sum(), dtype=bool), None))
+    return pd.Series(list(zip(*numbers)), dtype=object)
 
-        columns_to_move = ['Number_of_Rear_Cameras'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=33): # Iterates through the columns to move and moves them to the 33rd
-            df.insert(i, col, df.pop(col)) # Moves the columns
 
-        df = df.drop(columns=["Number of Rear Cameras"]) # Drops the original Number of Rear Cameras column
-        
-        return df
+CURRENCY_RATES = {'€': 1.0, '$': 0.93, '₹': 0.011, '£': 1.13} # Euros per unit of every currency on 08/02/2023, in order of priority
+PRICE_PATTERN = r'(?:([€$£])\s*(\d+(?:\.\d+)?)|(₹)\s*(\d+(?:,\d+)?))' # "€ 899.99" or "₹ 80,910", rupees are written with commas
+APPROX_PRICE_PATTERN = r'About (\d+\.\d+|\d+) (EUR|INR)' # "About 250 EUR"
+APPROX_PRICE_RATES = {'EUR': CURRENCY_RATES['€'], 'INR': CURRENCY_RATES['₹']}
 
-    def fix_Camera(self, df):
 
-        """""
-        This function fixes the Camera column. It extracts the highest camera resolution from the string in the Camera column.
-        If the string contains "VGA", then the highest camera resolution is assumed to be VGA.
-        If the string contains "no", "no camera" is returned.
-        The highest camera resolution is assumed to be the maximum value in the string that appears before "MP".
-        It is returned as an integer and the original Camera column is dropped.
+CURRENCY_CODES = {'€': 'EUR', '$': 'USD', '₹': 'INR', '£': 'GBP', 'EUR': 'EUR', 'INR': 'INR'} # ISO code of the currencies of the prices
+EXCHANGE_RATE_COLUMNS = ['Date', 'Currency', 'Rate'] # Columns of an exchange-rate table, Rate is in euros per unit of Currency
 
-        """""
 
-        def extract_highest_camera_resolution(val): # Extracts the highest camera resolution from the string in the Camera column
-            if pd.isna(val): # If the value is null, then return "no camera"
-                return "no camera"
-            elif "VGA" in val: # If the string contains "VGA", then return "VGA"
-                return "VGA"
-            else:
-                pattern = r"\b(\d+\.\d+|\d+)\b MP" # Regex pattern to extract the highest camera resolution
-                resolutions = re.findall(pattern, val) # Finds all the matches in the string
-                try:
-                    return int(max(resolutions, key=float)) # Returns the maximum value in the string that appears before "MP"
-                except ValueError: # If the string does not contain any numbers, then
-                    return "no camera" # Returns "no camera" if the string does not contain any numbers
+def first_price_matches(matches, currencies, rates):
 
-        df["Highest_Camera_Resolution"] = df["Camera"].apply(lambda x: extract_highest_camera_resolution(x)) # Creates a new column with the results of the extract_highest_camera_resolution function
+    """""
+    This function finds, for every row of an extractall result, the first match of the currency of highest priority in rates.
+    It returns the row of every match, the positions of the chosen matches and the priority of every match.
 
+    """""
 
-        columns_to_move = ['Highest_Camera_Resolution'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=34): # Iterates through the columns to move and moves them to the 34th position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    priority = pd.Series(currencies, dtype=object).map({currency: i for i, currency in enumerate(rates)}).to_numpy(dtype=np.intp)
+    rows = matches.index.get_level_values(0).to_numpy(dtype=np.intp)
+    order = np.lexsort((np.arange(len(rows)), priority, rows)) # Matches by row, then by priority, then in order
+    chosen = order[np.r_[True, rows[order][1:] != rows[order][:-1]]] if len(order) else order # First match of every row
+    return rows, chosen, priority
 
-        df = df.drop(columns=["Camera"]) # Drops the original Camera column
 
-        return df
+def convert_prices(n, matches, currencies, amounts, rates, fallback):
 
-    def fix_Camera_Features(self, df):
-        """""
-        This function fixes the Camera Features column. Essentially, it looks at whether a camera has HDR or not.
-        If the string contains "HDR", then it is assumed that the camera has HDR.
+    """""
+    This function keeps, for every row of an extractall result, the first amount of the currency of highest priority in rates,
+    converts it to euros with a NumPy rate lookup, rounds it and returns the results a per-value extractor would have returned.
 
-        """""
+    """""
 
+    rows, chosen, priority = first_price_matches(matches, currencies, rates)
+    rate_table = np.array(list(rates.values())) # Rate of every priority
+    euros = np.asarray(amounts, dtype=object)[chosen].astype(np.float64) * rate_table[priority[chosen]]
+    return fill_results(n, rows[chosen], np.rint(euros), np.ones(len(euros), dtype=bool), fallback)
 
-        df["HDR"] = df["Camera Features"].apply(lambda x: 
-            # checks
-            "HDR" if not pd.isnull(x) and x.lower().find("hdr") != -1 else # If the string contains "HDR", then return "HDR"
-            "no HDR" # Returns "no HDR" for all other rows
 
-        )
+def price_amounts(n, matches, currencies, amounts, rates):
 
-        columns_to_move = ['HDR'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=35): # Iterates through the columns to move and moves them to the 35th position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    """""
+    This function is convert_prices for convert_prices_asof: it returns the (currency code, amount) of the chosen match of every row,
+    unconverted, and (None, NaN) for the rows without a price.
 
-        df = df.drop(columns=["Camera Features"]) # Drops the original Camera Features column
+    """""
 
-        return df
+    rows, chosen, _ = first_price_matches(matches, currencies, rates)
+    codes = np.full(n, None, dtype=object)
+    codes[rows[chosen]] = pd.Series(np.asarray(currencies, dtype=object)[chosen], dtype=object).map(CURRENCY_CODES).to_numpy()
+    values = np.full(n, np.nan)
+    values[rows[chosen]] = np.asarray(amounts, dtype=object)[chosen].astype(np.float64)
+    return pd.Series(list(zip(codes, values.tolist())), dtype=object)
 
-    def fix_Rear_Video(self, df):
-        """""
-        This function fixes the Rear Video column. Essentially, it extracts the highest video recording resolution and the frame rate at that resolution
-        It also drops the original Rear Video column.
 
-        """""
-        def get_video_resolution(x):
+def extract_prices(values):
 
-            """""
-            This function extracts the highest video recording resolution from the string in the Rear Video column.
-            If the string contains "no", then "no video" is returned.
-            It uses matching to extract the highest video recording resolution.
+    """""
+    This function matches every amount of the Price column, whatever its currency, with a single extractall.
+    It returns the matches, indexed by (row, match), with their currency symbols and amounts (without the commas of rupees).
 
-            """""
-            if pd.isnull(x) or x.lower().strip() == "no": # If the value is null or contains "no", then return "no video"
-                return "no video"
-            
-            x = x.split(",")[0] # Splits the string at the comma and takes the first element, highest resolution
+    """""
 
-            if x.find("8K") != -1: # If the string contains "8K", then return "8K"
-                return "8K"
-            
-            if x.find("4K") != -1: # If the string contains "4K", then return "4K"
-                return "4K"
+    matches = as_text(values).str.extractall(PRICE_PATTERN)
+    currencies = matches[0].fillna(matches[2]).to_numpy()
+    amounts = matches[1].fillna(matches[3].str.replace(',', '', regex=False)).to_numpy()
+    return matches, currencies, amounts
 
-            if x.lower().find("1440p") != -1: # If the string contains "1440p", then return "1440p"
-                return "1440p"
-            
-            if x.lower().find("1080p") != -1: # If the string contains "1080p", then return "1080p"
-                return "1080p"
 
-            if x.lower().find("1152p") != -1: # If the string contains "1152p", then return "1152p"
-                return "1152p"
-            
-            if x.lower().find("720p") != -1: # If the string contains "720p", then return "720p"
-                return "720p"
+def extract_approx_prices(values):
 
-            if x.lower().find("480p") != -1: # If the string contains "480p", then return "480p"
-                return "480p"
+    """""
+    This function is extract_prices for the "About ... EUR" and "About ... INR" amounts of the Approx Price column.
 
-            if x.lower().find("360p") != -1: # If the string contains "360p", then return "360p"
-                return "360p"
+    """""
 
-            if x.lower().find("240p") != -1: # If the string contains "240p", then return "240p"
-                return "240p"
+    matches = as_text(values).str.extractall(APPROX_PRICE_PATTERN)
+    return matches, matches[1].to_numpy(), matches[0].to_numpy()
 
-            if x.lower().find("320p") != -1: # If the string contains "320p", then return "320p"
-                return "320p"
 
-            if x.lower().find("288p") != -1: # If the string contains "288p", then return "288p"
-                return "288p"
+def vectorized_price(values):
 
-            if x.lower().find("144p") != -1: # If the string contains "144p", then return "144p"
-                return "144p"
+    """""
+    This function is the vectorized version of extract_from_price: the price in euros of the first amount of the first
+    of €, $, ₹ and £ found in the row, rounded, or NaN. All the currencies are matched by a single extractall.
 
-            if x.lower().find("120p") != -1: # If the string contains "120p", then return "120p"
-                return "120p"
+    """""
 
-            if x.lower().find("qcif") != -1: # If the string contains "qcif", then return "qcif"
-                return "QCIF"
+    return convert_prices(len(values), *extract_prices(values), CURRENCY_RATES, float('nan'))
 
-            if x.lower().find("176x144") != -1: # If the string contains "176x144", then return "176x144"
-                return "QCIF"
 
-            if x.lower().find("cif") != -1: # If the string contains "cif", then return "cif"
-                return "CIF"
+def vectorized_approx_price(values):
 
-            if x.lower().find("352x288") != -1: # If the string contains "352x288", then return "352x288"
-                return "CIF"
+    """""
+    This function is the vectorized version of extract_from_approx_price: the approximate price in euros, rounded,
+    from "About ... EUR" or else "About ... INR", or None.
 
-            if x.lower().find("qvga") != -1: # If the string contains "qvga", then return "qvga"
-                return "QVGA"
-            
-            if x.find("vga") != -1: # If the string contains "vga", then return "vga"
-                return "VGA"
-            
-            res = [i for i in x.split(" ") if i[-2:] == "p@"] # Extracts the highest resolution from the string
-            if len(res) > 0: # If the length of the list is greater than 0, then return the highest resolution
-                return res[0][:-2] + "p" # Returns the highest resolution
-            
-            return "unspecified" # Returns "unspecified" for all other rows
-            
-        def get_video_framerate(x):
+    """""
 
-            """""
-            This function extracts the frame rate at the highest video recording resolution from the string in the Rear Video column.
-            If the string contains "no", then "no video" is returned.
-            It extracts the framerate before the fps substring.
-            """""
+    return convert_prices(len(values), *extract_approx_prices(values), APPROX_PRICE_RATES, None)
 
-            if pd.isnull(x) or x.lower().strip() == "no": # If the value is null or contains "no", then
-                return "no video"
-            
-            x = x.split(",")[0] # Splits the string at the comma and takes the first element, highest resolution
-            
-            fps = [i for i in x.split("@") if i[-3:] == "fps" or i[-4:] == "fps."] # Extracts the frame rate from the string
-            if len(fps) > 0: # If the length of the list is greater than 0, then return the frame rate
-                return (fps[0][:-3] if fps[0][-3:] == "fps" else fps[0][:-4]) # Returns the frame rate
-            
-            return "unspecified"    # Returns "unspecified" for all other rows
-        
-        df["Rear_Video_Resolution"] = df["Rear Video"].apply(lambda x: get_video_resolution(x)) # Applies the get_video_resolution function to the Rear Video column
-        df["Rear_Video_Framerate"] = df["Rear Video"].apply(lambda x: get_video_framerate(x))    # Applies the get_video_framerate function to the Rear Video column
 
-        columns_to_move = ['Rear_Video_Resolution',"Rear_Video_Framerate" ] # Columns to move
-        for i, col in enumerate(columns_to_move, start=36): # Iterates through the columns to move and moves them to the 36th and 37th position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+def first_price(matches, rates):
 
-        df = df.drop(columns=["Rear Video"]) # Drops the original Camera Features column
-        
-        return df
+    """""
+    This function returns the (currency code, amount) of the first of the (currency, amount) matches of the currency
+    of highest priority in rates, or (None, NaN) if there is none.
 
+    """""
 
-    def fix_Number_of_Selfie_Cameras(self, df):
-        """""
-        This function fixes the Number of Selfie Cameras column.
-        It extracts the number of selfie cameras from the string in the Number of Selfie Cameras column.
-        After extracting the number of selfie cameras, it drops the original Number of Selfie Cameras column.
+    if not matches:
+        return None, np.nan
+    priority = list(rates)
+    currency, amount = min(matches, key=lambda match: priority.index(match[0])) # min() keeps the first of the ties
+    return CURRENCY_CODES[currency], float(amount)
 
-        """""
 
+def parse_price(value):
 
-        df["Number_of_Selfie_Cameras"] = df["Number of Selfie Cameras"].apply(lambda x: 
-            # checks
-            3 if not pd.isnull(x) and x.lower().find("triple") != -1 else # If the string contains "triple", then return 3
-            2 if not pd.isnull(x) and x.lower().find("dual") != -1 else # If the string contains "dual", then return 2
-            1 if not pd.isnull(x) and x.lower().find("single") != -1 else # If the string contains "single", then return 1
-            0 # Returns 0 for all other rows
+    """""
+    This function returns the (currency code, amount) of a value of the Price column, like ("USD", 971.99) for "$ 971.99 / £ 791.00",
+    taking the first amount of the first of €, $, ₹ and £ found, as extract_from_price does. It is (None, NaN) without a price.
 
-        )
+    """""
 
-        columns_to_move = ['Number_of_Selfie_Cameras'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=39): # Iterates through the columns to move and moves them to the 39th position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    if not isinstance(value, str):
+        return None, np.nan
+    matches = [(symbol or rupee, amount or rupees.replace(',', '')) for symbol, amount, rupee, rupees in re.findall(PRICE_PATTERN, value)]
+    return first_price(matches, CURRENCY_RATES)
 
-        df = df.drop(columns=["Number of Selfie Cameras"]) # Drops the original Camera Features column
 
-        return df
+def parse_approx_price(value):
+
+    """""
+    This function is parse_price for the Approx Price column, like ("EUR", 250.0) for "About 250 EUR".
+
+    """""
+
+    if not isinstance(value, str):
+        return None, np.nan
+    return first_price([(currency, amount) for amount, currency in re.findall(APPROX_PRICE_PATTERN, value)], APPROX_PRICE_RATES)
+
+
+def vectorized_price_amounts(values):
+
+    """""
+    This function is the vectorized version of parse_price.
+
+    """""
+
+    return price_amounts(len(values), *extract_prices(values), CURRENCY_RATES)
+
+
+def vectorized_approx_price_amounts(values):
+
+    """""
+    This function is the vectorized version of parse_approx_price.
+
+    """""
+
+    return price_amounts(len(values), *extract_approx_prices(values), APPROX_PRICE_RATES)
+
+
+def read_exchange_rates(source):
+
+    """""
+    This function reads an exchange-rate time series: a CSV or Parquet file, a DataFrame or (Date, Currency, Rate) records,
+    with the euros per unit of every currency (ISO codes, like "USD") over time. The rates are averaged per month,
+    and returned as a DataFrame with the Date (first day of the month), Currency and Rate columns, sorted by Date.
+
+    """""
+
+    if isinstance(source, (str, os.PathLike)):
+        rates = pd.read_parquet(source) if os.fspath(source).endswith('.parquet') else pd.read_csv(source)
+    elif isinstance(source, pd.DataFrame):
+        rates = source
+    else:
+        rates = pd.DataFrame(list(source), columns=EXCHANGE_RATE_COLUMNS)
+
+    missing = [col for col in EXCHANGE_RATE_COLUMNS if col not in rates.columns]
+    if missing:
+        raise ValueError("The exchange rates have no columns {}".format(missing))
+
+    rates = pd.DataFrame({'Date': pd.to_datetime(rates['Date']).dt.to_period('M'), 'Currency': rates['Currency'].astype(str),
+                          'Rate': pd.to_numeric(rates['Rate'])}).dropna()
+    rates = rates.groupby(['Date', 'Currency'], as_index=False, sort=True)['Rate'].mean() # Monthly rates
+    rates['Date'] = rates['Date'].dt.to_timestamp()
+    return rates[EXCHANGE_RATE_COLUMNS]
+
+
+def convert_prices_asof(currencies, amounts, months, rates):
+
+    """""
+    This function converts prices to euros with the exchange rates of read_exchange_rates, in bulk, with one merge_asof.
+    currencies are the ISO codes of the prices (None without a price), amounts their amounts and months the monthly Period ordinals
+    they are converted at. Every price takes the last rate of its currency up to its month, the first rate if its month is earlier
+    and the latest rate if its month is NAT_ORDINAL (not known). Euros need no rate. Currencies that are not in the table raise a ValueError.
+    It returns the rounded prices in euros as floats, NaN without a price.
+
+    """""
+
+    currencies = np.asarray(currencies, dtype=object)
+    months = np.asarray(months, dtype=np.int64)
+    priced = pd.notna(currencies)
+    table = pd.DataFrame({'Month': rates['Date'].dt.to_period('M').array.asi8, 'Currency': rates['Currency'].to_numpy(dtype=object),
+                          'Rate': rates['Rate'].to_numpy(dtype=np.float64)})
+
+    unknown = set(currencies[priced]) - set(table['Currency']) - {'EUR'}
+    if unknown:
+        raise ValueError("There are no exchange rates for the currencies {}".format(sorted(unknown)))
+
+    rate = np.full(len(currencies), np.nan)
+    in_table = priced & np.isin(currencies, table['Currency'].unique())
+    rate[priced & ~in_table] = 1.0 # Euros without rates in the table
+
+    dated = in_table & (months != NAT_ORDINAL)
+    left = pd.DataFrame({'Month': months[dated], 'Currency': currencies[dated], 'Row': np.flatnonzero(dated)}).sort_values('Month', kind='stable')
+    merged = pd.merge_asof(left, table, on='Month', by='Currency', direction='backward') # Last rate up to the month of every price
+    grouped = table.groupby('Currency')['Rate']
+    rate[merged['Row'].to_numpy()] = merged['Rate'].fillna(merged['Currency'].map(grouped.first())).to_numpy() # Earlier months take the first rate
+    undated = in_table & (months == NAT_ORDINAL)
+    rate[undated] = pd.Series(currencies[undated], dtype=object).map(grouped.last()).to_numpy() # Unknown months take the latest rate
+
+    return np.rint(np.asarray(amounts, dtype=np.float64) * rate)
+
+
+class CleaningStage:
+
+    """""
+    This class holds the column metadata of a cleaning function, declared with the cleaning_stage decorator.
+    consumes are the columns the function reads and produces the columns it writes, in the order it creates them.
+    The function itself only computes its columns. Its layout is planned afterwards: the moves columns are moved to
+    position (and the following positions), then the drops columns are dropped and the renames columns are renamed.
+    The planned layouts of all the functions are applied at once, by a single reindex at the end of the run.
+
+    """""
+
+    def __init__(self, name, consumes, produces, position, moves, drops, renames):
+        self.name = name
+        self.consumes = list(consumes) # Columns read by the function
+        self.produces = list(produces) # Columns written by the function
+        self.position = position # Position the moves columns are moved to
+        self.moves = list(moves) # Columns moved after the function has run
+        self.drops = list(drops) # Columns dropped after the function has run
+        self.renames = dict(renames) # Columns renamed after the function has run
+
+    @property
+    def writes(self):
+        return set(self.produces) | set(self.drops) | set(self.renames) | set(self.renames.values()) # Every column the stage changes
+
+    def depends_on(self, other):
+
+        """""
+        This function checks whether this stage has to run after an earlier stage: it reads or changes a column the
+        earlier stage changes, or it changes a column the earlier stage reads.
+
+        """""
+
+        return bool((set(self.consumes) | self.writes) & other.writes or self.writes & set(other.consumes))
+
+    def plan_layout(self, columns, new_columns):
+
+        """""
+        This function applies the layout of the function to a list of column names, new_columns being the columns created by the function.
+
+        """""
+
+        columns = columns + [col for col in new_columns if col not in columns] # New columns are added at the end
+        for i, col in enumerate(self.moves, start=self.position): # Moves the columns to their positions
+            columns.remove(col)
+            columns.insert(i, col)
+        return [self.renames.get(col, col) for col in columns if col not in self.drops]
+
+    def rename_columns(self, df):
+
+        """""
+        This function renames the renames columns of df without copying them. The dropped columns are still in df until
+        the final reindex, so the ones that already have one of the new names are removed first.
+
+        """""
+
+        if not self.renames:
+            return df
+        replaced = [col for col in self.renames.values() if col in df.columns] # Dropped columns with one of the new names
+        return df.drop(columns=replaced).rename(columns=self.renames, copy=False)
+
+
+def cleaning_stage(consumes=(), produces=(), position=0, moves=(), drops=(), renames=None):
+
+    """""
+    This decorator declares the columns a cleaning function reads and writes, and the layout applied after it.
+    The metadata is kept in the stage attribute of the function.
+
+    """""
+
+    def decorator(func):
+        func.stage = CleaningStage(func.__name__, consumes, produces, position, moves, drops, renames or {})
+        return func
+
+    return decorator
+
+
+def as_object_strings(df, columns):
+
+    """""
+    This function converts the columns of df that have a string dtype (string[pyarrow] from from_csv(), for example) to object
+    columns with NaN for the missing values, which is what the cleaning functions were written for. Other columns are left as they are.
+
+    """""
+
+    strings = [col for col in columns if col in df.columns and isinstance(df[col].dtype, pd.StringDtype)]
+    if strings:
+        df = df.copy(deep=False) # Does not change the frame of the caller
+        for col in strings:
+            df[col] = df[col].to_numpy(dtype=object, na_value=np.nan)
+    return df
+
+
+def run_stage(func, df, columns):
+
+    """""
+    This function runs the cleaning function func on df and plans its layout on columns, the planned columns of df.
+    Nothing is moved or dropped in df: the dropped columns stay in it until the final reindex, unless the function creates
+    a column with the same name. It returns df and its new planned columns.
+
+    """""
+
+    stage = func.stage
+    df = as_object_strings(df, stage.consumes + list(stage.renames)) # Only converts the string columns once they are needed
+    reused = [col for col in stage.produces if col in df.columns and col not in columns] # Dropped columns created again by the function
+    if reused:
+        df = df.drop(columns=reused)
+    existing = set(df.columns)
+
+    df = func(df)
+
+    columns = stage.plan_layout(columns, [col for col in df.columns if col not in existing])
+    return stage.rename_columns(df), columns
+
+
+class CleaningReport:
+
+    """""
+    This class measures every cleaning function of a clean() run: wall and CPU time, memory, rows and columns.
+    The peak of the memory allocated by the function is only traced with trace_memory (tracemalloc slows the run down),
+    while the growth of the peak RSS of the process is recorded wherever the resource module is available.
+    callback is called with the record of every cleaning function as soon as it has run.
+
+    """""
+
+    def __init__(self, trace_memory=False, callback=None):
+        self.trace_memory = trace_memory
+        self.callback = callback
+        self.records = [] # One record per cleaning function run
+
+    def measure(self, func, df, columns, **fields):
+
+        """""
+        This function runs the cleaning function func on df, plans its layout on columns (see run_stage) and records its measurements.
+        fields are added to the record, e.g. the chunk number in clean_csv(). It returns df and its new planned columns.
+
+        """""
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+        columns_before, rows_before = columns, len(df)
+        wall_before, cpu_before = time.perf_counter(), time.process_time()
+
+        df, columns = run_stage(func, df, columns)
+
+        wall_time, cpu_time = time.perf_counter() - wall_before, time.process_time() - cpu_before
+        peak_memory = tracemalloc.get_traced_memory()[1] - memory_before if self.trace_memory else None
+        if started_tracing:
+            tracemalloc.stop()
+
+        record = dict(fields)
+        record.update({
+            'stage': func.__name__,
+            'wall_time_s': wall_time,
+            'cpu_time_s': cpu_time,
+            'peak_memory_bytes': peak_memory, # Peak of the memory allocated during the stage, with trace_memory
+            'max_rss_growth_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before if resource else None,
+            'rows_in': rows_before,
+            'rows_out': len(df),
+            'columns_added': [col for col in columns if col not in columns_before],
+            'columns_dropped': [col for col in columns_before if col not in columns],
+        })
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+        return df, columns
+
+    def to_frame(self):
+        return pd.DataFrame(self.records) # One row per cleaning function run
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.records, **kwargs)
+
+
+TYPED_SCHEMA = { # Dtype of every column in the typed output, and the labels the cleaner gives to its missing values
+    'Brand': ('category', []),
+    'Highest_Network_Technology': ('category', []),
+    'Announced': ('period[M]', []),
+    'Released': ('period[M]', []),
+    'Status': ('category', []),
+    'Length': ('Float32', ['Not Measured']),
+    'Width': ('Float32', ['Not Measured']),
+    'Thickness': ('Float32', ['Not Measured']),
+    'Weight': ('Float32', ['Not Measured']),
+    'Front': ('category', []),
+    'Back': ('category', []),
+    'Frame': ('category', []),
+    'Number_of_SIMs': ('Int32', []),
+    'Type_of_SIM': ('category', []),
+    'Display_Type': ('category', []),
+    'Display_Brightness': ('Int32', ['Not Specified', 'Not specified']),
+    'Display_HDR_Capability': ('category', []),
+    'Display_Size_(inches)': ('Float32', ['Not Measured']),
+    'Screen_To_Body_Ratio_(%)': ('Float32', ['Not Measured']),
+    'Display_Aspect_Ratio': ('category', []),
+    'Pixel_Density': ('Int32', ['Not Measured']),
+    'Display_Protection': ('category', []),
+    'Mobile_OS': ('category', []),
+    'Mobile_OS_Version': ('category', []),
+    'Chipset_Maker': ('category', []),
+    'Fabrication_Process': ('Int32', [0]),
+    'Number_of_CPU_Cores': ('Int32', ['Unspecified']),
+    'CPU_Performance_Core_Frequency': ('Float32', ['unspecified']),
+    'CPU_Efficiency_Core_Frequency': ('Float32', ['unspecified']),
+    'SD Card Slot': ('category', []),
+    'ROM': ('Float32', ['unspecified']),
+    'RAM': ('Float32', ['unspecified']),
+    'Number_of_Rear_Cameras': ('Int32', []),
+    'Storage_Type_Version': ('category', []),
+    'Storage_Type': ('category', []),
+    'Highest_Camera_Resolution': ('Int32', ['no camera', 'VGA']),
+    'HDR': ('category', []),
+    'Rear_Video_Resolution': ('category', []),
+    'Rear_Video_Framerate': ('category', []),
+    'Number_of_Selfie_Cameras': ('Int32', []),
+    'Selfie_Video_Resolution': ('category', []),
+    'Selfie_Video_Framerate': ('category', []),
+    'Headphone_Jack': ('category', []),
+    'WI-FI': ('category', []),
+    'Bluetooth': ('category', []),
+    'NFC': ('category', []),
+    'Radio': ('category', []),
+    'USB_Connector': ('category', []),
+    'USB_Version': ('category', []),
+    'Biometric_Sensor': ('category', []),
+    'Biometric_Sensor_Type': ('category', []),
+    'Biometric_Sensor_Technology': ('category', []),
+    'Biometric_Sensor_Location': ('category', []),
+    'UWB': ('category', []),
+    'Removable': ('category', []),
+    'Battery_Type': ('category', []),
+    'Battery_Capacity': ('Int32', ['unspecified']),
+    'Charging_Speed': ('Int32', ['unspecified']),
+    'Wireless_Charging': ('category', []),
+    'Reverse_Charging': ('category', []),
+    'Colors': ('Int32', []),
+    'Loudspeaker_Voice': ('Int32', ['untested']),
+    'Loudspeaker_Noise': ('Int32', ['untested']),
+    'Loudspeaker_Ring': ('Int32', ['untested']),
+    'Battery_Life': ('Int32', ['untested']),
+    'IP_Rating': ('category', []),
+    'Price': ('Float32', ['unspecified']),
+}
+MISSING_REASON_COLUMNS = ['Highest_Camera_Resolution'] # Columns whose missing values can mean different things
+PARTITION_COLUMNS = ['Brand', 'Release_Year'] # Directories of the Parquet datasets, Release_Year being the year of Released
+QUARANTINE_COLUMNS = ['stage', 'column', 'value', 'error'] # Columns of the table of quarantined values
+MEASURE_COLUMNS = [col for col, (dtype, _) in TYPED_SCHEMA.items() if dtype in ('Float32', 'Int32')] # Columns with a number per phone
+CUBE_DIMENSIONS = ['Brand', 'Release_Year'] # Default dimensions of an AggregateCube, 'Mobile_OS' and 'Chipset_Maker' can be added
+CUBE_STATS = {'count': 'sum', 'sum': 'sum', 'min': 'min', 'max': 'max'} # Statistics of every measure, and how cells are merged into one
+SKETCH_ZERO_KEY = np.iinfo(np.int32).min # Bucket of the values of a sketch that are not positive
+SPEC_INDEX_DIMENSIONS = ['Brand', 'Mobile_OS', 'Release_Year'] # Columns a SpecIndex keeps a bitmap of every value of
+
+
+def apply_typed_schema(df):
+
+    """""
+    This function converts the columns of a cleaned dataset to the dtypes of TYPED_SCHEMA: nullable Float32 and Int32
+    for the measures, monthly periods for the dates and categories for the classified columns.
+    The labels of the missing values ("Not Measured", "unspecified", ...) become missing values of the measures and dates,
+    while the categories keep them as a category. Values of a measure that are not numbers become missing values too.
+    The columns of MISSING_REASON_COLUMNS get a _Missing_Reason column after them, holding the label of every missing value.
+    Columns that are not in the schema (like Model) are left as they are.
+
+    """""
+
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        dtype, labels = TYPED_SCHEMA.get(col, (None, []))
+        if dtype is None:
+            columns[col] = series
+        elif dtype == 'category':
+            columns[col] = series.astype('category')
+        else:
+            missing = series.isin(labels)
+            values = series.mask(missing) # Missing values instead of the labels
+            if dtype != 'period[M]':
+                values = pd.to_numeric(values, errors='coerce')
+            columns[col] = values.astype(dtype)
+            if col in MISSING_REASON_COLUMNS:
+                columns[col + '_Missing_Reason'] = series.where(missing).astype('category') # Label of the missing values only
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def dataset_partitioning():
+
+    """""
+    This function returns the partitioning of the Parquet datasets: one directory per value of PARTITION_COLUMNS.
+
+    """""
+
+    return pyarrow.dataset.partitioning(pyarrow.schema([('Brand', pyarrow.string()), ('Release_Year', pyarrow.int32())]), flavor='hive')
+
+
+worker_cleaners = {} # Cleaner of every worker process, kept between tasks so that its cache is reused
+
+
+def worker_cleaner(config):
+
+    """""
+    This function returns the cleaner of the worker process for the cleaner options in config.
+
+    """""
+
+    key = tuple(sorted(config.items()))
+    if key not in worker_cleaners:
+        worker_cleaners[key] = GSMArena_Dataset_Cleaner(None, **config)
+    return worker_cleaners[key]
+
+
+def run_stage_in_worker(name, frame, config):
+
+    """""
+    This function runs the cleaning function name on frame, which only holds the columns it consumes, in a worker process.
+    It returns the columns produced by the function, in the order they were created, and the values it quarantined.
+
+    """""
+
+    cleaner = worker_cleaner(config)
+    func = getattr(cleaner, name)
+
+    cleaner.running_stage = name
+    frame = func(frame)
+    return frame[[col for col in frame.columns if col in func.stage.produces]], cleaner.take_quarantined()
+
+
+def clean_partition_in_worker(frame, config, names):
+
+    """""
+    This function runs the cleaning functions names on a partition of the rows of the dataset in a worker process.
+    It returns the cleaned partition and the values it quarantined.
+
+    """""
+
+    cleaner = worker_cleaner(config)
+    all_functions = cleaner.cleaning_functions
+    cleaner.cleaning_functions = [getattr(cleaner, name) for name in names]
+    try:
+        return cleaner.run_cleaning_functions(frame), cleaner.take_quarantined()
+    finally:
+        cleaner.cleaning_functions = all_functions
+
+
+class GSMArena_Dataset_Cleaner:
+
+    def __init__(self, df, cache_size=2**18, vectorized=True, trace_memory=False, stage_callback=None, typed=False, exchange_rates=None,
+                 checkpoint_dir=None, checkpoint_every=10, quarantine=False):
+        self.df = df
+        self.cache = UniqueValueCache(cache_size) # Results of the per-value extractors, kept across clean() calls
+        self.vectorized = vectorized # Whether the numeric extractors use their vectorized .str versions
+        self.trace_memory = trace_memory # Whether the report traces the memory allocated by every cleaning function
+        self.stage_callback = stage_callback # Called with the report record of every cleaning function
+        self.report = None # CleaningReport of the last clean() or clean_csv(), None if the last clean() was not measured
+        self.typed = typed # Whether the cleaned dataset is converted to the dtypes of TYPED_SCHEMA
+        self.exchange_rates = read_exchange_rates(exchange_rates) if exchange_rates is not None else None # Prices are converted at the rates of their month
+        self.checkpoint_dir = checkpoint_dir # Directory the frame is saved to while clean() runs, so that it can be resumed
+        self.checkpoint_every = checkpoint_every # Number of cleaning functions between checkpoints, every one pickles the whole frame
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.quarantine = quarantine # Whether the values an extractor fails on are quarantined instead of stopping clean()
+        self.quarantined = [] # Records of the values quarantined by the last clean(), see quarantine_table
+        self.running_stage = None # Name of the cleaning function running, for the quarantine records
+        self.cleaning_functions =[self.drop_columns, self.fix_network_technology, self.fix_announced, self.fix_brand,
+                                  self.fix_dimensions, self.fix_weight, self.fix_Build, self.fix_SIM, self.fix_IP_Rating, self.fix_Display_Type,
+                                  self.fix_Display_Size, self.fix_Display_Resolution, self.fix_Display_Protection, self.fix_Operating_Software, 
+                                  self.fix_Chipset, self.fix_CPU, self.fix_SD_Card_Slot, self.fix_Number_of_Rear_Cameras, self.fix_Camera,
+                                  self.fix_Camera_Features, self.fix_Rear_Video, self.fix_Number_of_Selfie_Cameras, self.fix_Selfie_Video,
+                                  self.fix_Headphone_Jack, self.fix_WLAN_Technology, self.fix_Bluetooth, self.fix_NFC, self.fix_Radio, self.fix_USB,
+                                  self.fix_Sensors, self.fix_UWB, self.fix_Battery, self.fix_Charging, self.fix_Colors, self.fix_Battery_Life,
+                                  self.fix_Internal_Storage, self.fix_Storage_Type, self.fix_Loudspeaker, self.fix_price_and_approx_price]
+
+
+
+    def apply_unique(self, series, func, key, vectorized_func=None):
+
+        """""
+        This function is the memoized replacement for series.apply(func) used by all the fix_* functions.
+        func is only called once per distinct value of the column, and its results are kept in the cleaner's cache under key
+        so that values already seen in a previous clean() call are not parsed again.
+        If the cleaner is vectorized and vectorized_func is given, it is used instead of func on all the distinct values at once.
+        Both give the same results, so they share the cache.
+
+        """""
+
+        vectorized = self.vectorized and vectorized_func is not None
+        func = vectorized_func if vectorized else func
+        try:
+            return map_unique(series, func, self.cache, key, vectorized)
+        except Exception:
+            if not self.quarantine:
+                raise
+        return map_unique(series, self.guarded(func, vectorized, series.name, np.nan)) # Only runs if a value failed
+
+    def apply_unique_fields(self, series, func, key, vectorized_func=None):
+
+        """""
+        This function is apply_unique for the parsers that return a tuple of fields per value. It returns one Series per field.
+
+        """""
+
+        vectorized = self.vectorized and vectorized_func is not None
+        func = vectorized_func if vectorized else func
+        try:
+            return map_unique_fields(series, func, self.cache, key, vectorized)
+        except Exception:
+            if not self.quarantine:
+                raise
+        null = (np.nan,) * len(call_extractor(func, [np.nan], vectorized)[0]) # Every field of a quarantined value is missing
+        return map_unique_fields(series, self.guarded(func, vectorized, series.name, null)) # Only runs if a value failed
+
+    def apply_unique_months(self, series, func, key):
+
+        """""
+        This function is apply_unique for the date parsers, which return a tuple of month ordinals per value (see map_unique_months).
+
+        """""
+
+        try:
+            return map_unique_months(series, func, self.cache, key)
+        except Exception:
+            if not self.quarantine:
+                raise
+        null = (NAT_ORDINAL,) * len(func(np.nan)) # Every month of a quarantined value is not known
+        return map_unique_months(series, self.guarded(func, False, series.name, null)) # Only runs if a value failed
+
+    def guarded(self, func, vectorized, column, null):
+
+        """""
+        This function returns func as a per-value function that quarantines the values it fails on: the value, the column it is in,
+        the running cleaning function and the traceback are recorded in self.quarantined, and null is returned instead.
+        apply_unique only calls it, value by value and without the cache, once func failed on the distinct values of a column,
+        so clean() runs at full speed until a value fails and the quarantined values are recorded on every run.
+
+        """""
+
+        def guarded_func(value):
+            try:
+                return call_extractor(func, [value], vectorized)[0]
+            except Exception:
+                self.quarantined.append({'stage': self.running_stage, 'column': column, 'value': value, 'error': traceback.format_exc()})
+                return null
+
+        return guarded_func
+
+    def take_quarantined(self):
+
+        """""
+        This function returns the records of the quarantined values and starts a new list.
+
+        """""
+
+        quarantined, self.quarantined = self.quarantined, []
+        return quarantined
+
+    def quarantine_table(self):
+
+        """""
+        This function returns the values quarantined by the last clean() as a DataFrame, with the cleaning function (stage),
+        the column, the value the extractor failed on and the traceback of the error, one row per distinct value of every column
+        and stage, even if several extractors of the stage (e.g. the 2 classifiers of fix_USB), partitions or chunks failed on it.
+        The cells of these values are NaN in the cleaned dataset, which apply_typed_schema turns into the nulls of their dtypes.
+
+        """""
+
+        records = {}
+        for record in self.quarantined:
+            records.setdefault((record['stage'], record['column'], repr(record['value'])), record) # Keeps the first record of every value
+        return pd.DataFrame(list(records.values()), columns=QUARANTINE_COLUMNS)
+
+    def video_specs(self, series):
+
+        """""
+        This function parses a raw Rear Video or Selfie Video column with parse_video_spec and returns the result as a DataFrame,
+        with the Resolution, Framerate, Modes, HDR, Gyro_EIS and Ten_Bit columns. Modes lists every (resolution, framerates) pair
+        of the row, not only the highest one. Every distinct value is only parsed once, and the results are kept in the cleaner's cache,
+        so the video stages and this function share them.
+        clean() only keeps the Resolution and Framerate columns, so this function is the only way to get the Modes, HDR,
+        Gyro_EIS and Ten_Bit columns, e.g. cleaner.video_specs(raw["Rear Video"]) on the raw dataset given to the cleaner.
+
+        """""
+
+        fields = self.apply_unique_fields(series, parse_video_spec, "{} (spec)".format(series.name))
+        return pd.concat(fields, axis=1, keys=['Resolution', 'Framerate', 'Modes', 'HDR', 'Gyro_EIS', 'Ten_Bit'])
+
+    def cpu_topology(self, series):
+
+        """""
+        This function parses a raw CPU column with parse_cpu and returns the result as a DataFrame, with the Cores, Max_Frequency,
+        Min_Frequency, Clusters and Core_GHz columns. cluster_array(topology["Clusters"]) gives the clusters as a fixed-width array.
+        Every distinct value is only parsed once, and the results are kept in the cleaner's cache, so fix_CPU and this function share them.
+
+        """""
+
+        fields = self.apply_unique_fields(series, parse_cpu, "{} (topology)".format(series.name))
+        return pd.concat(fields, axis=1, keys=['Cores', 'Max_Frequency', 'Min_Frequency', 'Clusters', 'Core_GHz'])
+
+    @cleaning_stage(drops=['Brands-href', 'Model', 'Models-href', 'Pages', 'Pages-href', 'web-scraper-order', 'web-scraper-start-url', 'GPU', 'Selfie Features'],
+                    renames={'Models': 'Model'})
+    def drop_columns(self, df):
+
+        """""
+        This function drops the columns that are redundant or otherwise not needed for the analysis.
+        These columns were created during the scraping process and are not needed for the analysis.
+        The columns are dropped, and Models renamed to Model, by the layout declared in its cleaning_stage.
+        """""
+
+        return df
+
+    @cleaning_stage(consumes=['Network Technology'], produces=['Network Technology'], renames={'Network Technology': 'Highest_Network_Technology'})
+    def fix_network_technology(self, df):
+    
+        """""
+        This function fixes the network technology column. It removes the extra information from the column and
+        makes it easier to analyze. It takes only the highest network technology and removes the rest.
+        """""
+            
+        df['Network Technology'] = df['Network Technology'].str.split('/').str.get(-1) # Splits the column and takes the last element
+        df['Network Technology'] = self.apply_unique(df['Network Technology'], lambda x: x.strip(), 'Network Technology') # Removes the extra spaces
+        return df
+
+    @cleaning_stage(consumes=['Announced', 'Status'], produces=['Released', 'Announced', 'Status'], position=4, moves=['Released'])
+    def fix_announced(self, df):
+    
+        """""
+        This function fixes the Announced and Status columns. It splits the information in the Announced column into 2 columns:
+        Announced and Released, the months the phone was announced and released (see parse_announced), as monthly periods.
+        Some release dates are not available in the Announced column and are instead in the Status column (see parse_status),
+        so these replace the ones of the Announced column. The Status column then only keeps the status.
+        Every distinct string is only parsed once, and the dates that are not known are NaT.
+        """""
+
+        announced, released = self.apply_unique_months(df['Announced'], parse_announced, 'Announced (months)') # Parses the Announced column
+        status_released, = self.apply_unique_months(df['Status'], parse_status, 'Status (months)') # Parses the release dates of the Status column
+
+        df['Released'] = pd.arrays.PeriodArray(np.where(status_released != NAT_ORDINAL, status_released, released), freq='M') # Release dates of the Status column first
+        df['Announced'] = pd.arrays.PeriodArray(announced, freq='M')
+        df['Status'] = df['Status'].str.split('.').str.get(0) # Takes the status without the release date
+
+        return df
+
+
+    @cleaning_stage(consumes=['Brands'], produces=['Brands'], renames={'Brands': 'Brand'})
+    def fix_brand(self, df):
+        """""
+        this function fixes the brand column. It removes the extra information from the column,
+        leaving only the brand name.
+
+        """""
+        df['Brands'] = df['Brands'].str.split("\n").str.get(0)
+        df['Brands'] = df['Brands'].str.strip()
+        return df
+
+
+    @cleaning_stage(consumes=['Dimensions'], produces=['Length', 'Width', 'Thickness'], position=6, moves=['Length', 'Width', 'Thickness'], drops=['Dimensions'])
+    def fix_dimensions(self, df):
+        """""
+        This function fixes the dimensions column. It splits the column into 3 columns: Height, Width and Thickness.
+        It then converts these to float objects for easier analysis.
+        Finally it drops the original Dimensions column
+
+        """""
+
+        df['Dimensions'] = df['Dimensions'].str.replace(r'mm\s*\([^)]*\)', '') # removes the dimensions in inches
+
+        df['Length'] = df['Dimensions'].str.split('x').str.get(0) # Splits the column and takes the first element - Length
+        df['Width'] = df['Dimensions'].str.split('x').str.get(1) # Splits the column and takes the second element - Width
+        df['Thickness'] = df['Dimensions'].str.split('x').str.get(2) # Splits the column and takes the third element - Thickness
+
+        df['Length'] = pd.to_numeric(df['Length'], errors='coerce') # Converts the Length column to float
+        df['Width'] = pd.to_numeric(df['Width'], errors='coerce') # Converts the Width column to float
+        df['Thickness'] = pd.to_numeric(df['Thickness'], errors='coerce') # Converts the Thickness column to float
+
+        df[['Length', 'Width', 'Thickness']] = df[['Length', 'Width', 'Thickness']].fillna("Not Measured") # Fills the missing values with 'Not Measured'
+
+        return df
+
+
+    @cleaning_stage(consumes=['Weight'], produces=['Weight'])
+    def fix_weight(self, df):
+        """""
+        This function fixes the weight column. removes the weight in oz and converts the column to float objects for easier analysis.
+        It then  fills the missing values with 'Not Measured'
+
+        """""
+        df['Weight'] = df['Weight'].str.replace(r'g\s*\([^)]*\)', '') # removes the weight in ounces
+        df['Weight'] = pd.to_numeric(df['Weight'], errors='coerce') # Converts the Weight column to float
+        df['Weight'] = df['Weight'].fillna("Not Measured") # Fills the missing values with 'Not Measured'
+        return df
+
+
+    @cleaning_stage(consumes=['Build'], produces=['Front', 'Back', 'Frame'], position=10, moves=['Front', 'Back', 'Frame'], drops=['Build'])
+    def fix_Build(self, df):
+
+
+        """""
+        This function fixes the BUILD column. It creates 3 new columns for Front, Back and Frame and extracts that information from
+        the BUILD column.
+        It then  drops the original BUILD column
+
+        """""
+
+
+        df['Front'], df['Back'], df['Frame'] = self.apply_unique_fields(df['Build'], parse_build, 'Build (parts)') # Parses every distinct build once
+
+        return df
+
+
+    @cleaning_stage(consumes=['SIM'], produces=['Number_of_SIMs', 'Type_of_SIM'], position=13, moves=['Number_of_SIMs', 'Type_of_SIM'], drops=['SIM'])
+    def fix_SIM(self, df):
+
+        """""
+        This function fixes the SIM column. It creates two columns for Number of SIMs and Type of SIM.
+        It utilizes the SIM_NUMBERS and SIM_TYPES dictionaries to map the characteristics of the SIM to the categorical values.
+        It then  drops the original SIM column
+
+        """""
+
+        df['Number_of_SIMs'], df['Type_of_SIM'] = self.apply_unique_fields(df['SIM'], parse_sim, 'SIM (parts)') # Parses every distinct SIM once
+
+        return df
+
+
+    @cleaning_stage(consumes=['IP Rating'], produces=['IP_Rating'], drops=['IP Rating'])
+    def fix_IP_Rating(self, df):
+
+        """""
+        This function fixes the IP Rating column. It eplaces it with a new IP Rating column.
+        It looks for key substrings to identify the type of IP Rating a phone has.
+        It reports the type of IP Rating a phone has.
+
+        """""
+
+        df["IP_Rating"] = self.apply_unique(df["IP Rating"], lambda x: 
+            next((x for x in x.split() if x.startswith("IP")), "water/dust resistant") if not pd.isnull(x) and any(y in x for y in ["proof", "resistant", "repellant", "protection"]) else 
+            "Military-Grade Certification" if not pd.isnull(x) and any(y in x for y in ["MIL"]) else
+            "Weather-Sealed Ports" if not pd.isnull(x) and "sealed" in x else 
+            "Self-Healing Capability" if not pd.isnull(x) and "healing" in x else
+            "No Resistance",
+        "IP_Rating") # Creates the IP Rating column by looking for key substrings and categorizing them
+
+        return df
+
+    @cleaning_stage(consumes=['Display Type'], produces=['Display_HDR_Capability', 'Display_Brightness', 'Display_Type'], position=16,
+                    moves=['Display_Type', 'Display_Brightness', 'Display_HDR_Capability'], drops=['Display Type'])
+    def fix_Display_Type(self, df):
+        """""
+        This function fixes the Display Type column. It creates two new columns for Display Brightness and HDR Capability.
+        It combs through the information in the original Display Type column and extracts the relevant information for 
+        Type, Brightness, and HDR Capability
+
+        """""
+
+        # creating HDR Capability Column
+        df["Display_HDR_Capability"] = KeywordClassifier([
+            ("HDR10+", "hdr10+"),
+            ("HDR10", "hdr10"),
+            ("HDR", "hdr"),
+        ], default="No HDR")(df["Display Type"], self.apply_unique) # creates the HDR capability column by finding the key substrings "hdr", "hdr10", and "hdr10+"
+
+
+        # creating Display Brightness column
+        df["Display_Brightness"] = self.apply_unique(df["Display Type"], lambda x:
+            next((substring for i, substring in enumerate(str(x).split()) if substring.isnumeric() and x.split()[i+1] == "nits"), "Not Specified") if x is not None else "Not specified",
+        "Display_Brightness") # creates the Display Brightness column by looking for the number of nits in the Display Type column
+
+        df["Display_Brightness"] = df["Display_Brightness"].replace("Not Specified", np.nan) # replaces the "Not Specified" with NaNs
+        df["Display_Brightness"] = df["Display_Brightness"].astype(float) # converts the column to float
+        df["Display_Brightness"] = df["Display_Brightness"].fillna("Not Specified") # replaces the NaNs with "Not Specified"
+
+            
+        # updating the Display Type column
+        df["Display_Type"] = KeywordClassifier([
+            ("CSTN", "cstn"),
+            ("TFT", "tft"),
+            ("Foldable LTPO AMOLED", "foldable ltpo amoled"),
+            ("Foldable AMOLED", "foldable amoled"),
+            ("LTPO AMOLED", "ltpo amoled"),
+            ("LTPO2 AMOLED", "ltpo2 amoled"),
+            ("LTPO3 AMOLED", "ltpo3 amoled"),
+            ("LTPO4 AMOLED", "ltpo4 amoled"),
+            ("Super AMOLED", "super amoled"),
+            ("Dynamic AMOLED", "dynamic amoled"),
+            ("AMOLED", "amoled"),
+            ("OLED", "oled"),
+            ("STN", "stn"),
+            ("TFD", "tfd"),
+            ("LCD", "lcd"),
+            ("IPS LCD", "ips"),
+            ("IGZO", "igzo"),
+            ("CGS", "CGS"),
+            ("Monochrome", "monochrome"),
+            ("TN", "tn"),
+        ], default="Not Specified")(df["Display Type"], self.apply_unique) # creates the Display Type column by looking for the key substrings "cstn", "tft", "ltpo", "amoled", "oled", "stn", "tfd", "lcd", "ips", "igzo", "cgs", "monochrome", and "tn"
+
+        return df
+
+    @cleaning_stage(consumes=['Display Size'], produces=['Screen_To_Body_Ratio_(%)', 'Display_Size_(inches)'], position=19,
+                    moves=['Display_Size_(inches)', 'Screen_To_Body_Ratio_(%)'], drops=['Display Size'])
+    def fix_Display_Size(self, df):
+        """""
+        This function fixes the Display Size Column. It extracts the most important information from this column
+        and creates 2 new columns with it - Screen to body ratio and Display size in inches
+        Finally, it drops the original Display Size Column
+
+        """""
+
+        df["Screen_To_Body_Ratio_(%)"] = self.apply_unique(df["Display Size"], lambda x: float(re.findall(r'~(.*?)%', x)[0]) 
+        if not pd.isnull(x) and str(x).strip() != "" and re.findall(r'~(.*?)%', x) else "Not Measured", "Screen_To_Body_Ratio_(%)") # creates screen to body ratio column by finding the number between the ~ and % signs
+        df["Display_Size_(inches)"] = self.apply_unique(df["Display Size"], lambda x: float(x[:x.find(" inches")].strip().split()[-1])
+        if x is not None and str(x).strip() != "" and str(x).find(" inches") != -1 else "Not Measured", "Display_Size_(inches)") # creates the Display size column by finding the number before the "inches" substring
+
+        return df
+
+    @cleaning_stage(consumes=['Display Resolution'], produces=['Display_Aspect_Ratio', 'Pixel_Density'], position=21,
+                    moves=['Display_Aspect_Ratio', 'Pixel_Density'], drops=['Display Resolution'])
+    def fix_Display_Resolution(self, df):
+
+        """""
+        This function fixes the Display Resolution column. It extracts the most important information and creates 2 new columns with 
+        it - Aspect Ratio and Pixel Density. Finally, it drops the original Display Resolution column
+
+        """"" 
+
+        df["Display_Aspect_Ratio"] = self.apply_unique(df["Display Resolution"], lambda x: x[:x.find(" ratio")].strip().split()[-1]
+        if x is not None and str(x).strip() != "" and str(x).find(" ratio") != -1 else "Not Measured", "Display_Aspect_Ratio") # creates the Aspect Ratio column by finding the number before the "ratio" substring
+
+        df["Pixel_Density"] = self.apply_unique(df["Display Resolution"], lambda x: x[:x.find(" ppi")].strip().split()[-1]
+        if x is not None and str(x).strip() != "" and str(x).find(" ppi") != -1 else "Not Measured", "Pixel_Density") # creates the Pixel Density column by finding the number before the "ppi" substring
+        df["Pixel_Density"] = self.apply_unique(df["Pixel_Density"], lambda x: int(x.replace("(~",'')) if x != "Not Measured" and "~" in x else x, "Pixel_Density (~)") # removes the (~ from the Pixel Density column
+
+        return df
+
+    @cleaning_stage(consumes=['Display Protection'], produces=['Display_Protection'], position=23, moves=['Display_Protection'], drops=['Display Protection'])
+    def fix_Display_Protection(self, df):
+        """""
+        This function fixes the Display Protection column. It extracts the most display protective glass information and creates a new column with 
+        it - Display_Protection. Finally, it drops the original Display Protection column
+
+        """""
+
+
+        df["Display_Protection"] = KeywordClassifier([
+            # gorilla glasses
+            ("Corning Gorilla Glass 1", "gorilla glass 1"),
+            ("Corning Gorilla Glass 2", "gorilla glass 2"),
+            ("Corning Gorilla Glass 3", "gorilla glass 3"),
+            ("Corning Gorilla Glass 3+", "gorilla glass 3+"),
+            ("Corning Gorilla Glass 4", "gorilla glass 4"),
+            ("Corning Gorilla Glass 5", "gorilla glass 5"),
+            ("Corning Gorilla Glass 6", "gorilla glass 6"),
+            ("Corning Gorilla Glass Victus+", "gorilla glass victus+"),
+            ("Corning Gorilla Glass Victus", "gorilla glass victus"),
+            ("Corning Gorilla Glass DX", "gorilla glass dx"),
+            ("Corning Gorilla Glass DX+", "gorilla glass dx+"),
+            ("Corning Gorilla Glass (unspecified)", "gorilla glass"),
+
+            # dragontrail
+            ("Asahi Dragontail Glass Pro", "dragontail glass pro"),
+            ("Asahi Dragontail Glass", "dragontail"),
+
+            # sapphire
+            ("Sapphire Crystal Glass", "sapphire"),
+
+            # Huawei
+            ("Huawei Kunlun Glass", "huawei"),
+
+            ("Rainbow Glass", "rainbow"),
+            ("Innolux Glass", "innolux"),
+
+            ("Ceramic Shield Glass", "ceramic"),
+            ("Yes (unspecified)", "yes"),
+            ("AGC Glass", "agc"),
+            ("Panda Glass", "panda"),
+
+            ("Schott UTG Glass", "schott utg"),
+            ("Schott Xensation Glass", "schott"),
+            ("NEG Dinorex T2X-1 Glass", ("dino", "t2x", "neg")),
+            ("Ion-strengthened Glass", ("ion", "strength")),
+        ], default="no special protection")(df["Display Protection"], self.apply_unique) # creates the Display Protection column by looking for the key substrings of the protective glass makers
+
+        return df
+
+    @cleaning_stage(consumes=['Operating Software'], produces=['Mobile_OS', 'Mobile_OS_Version'], position=24, moves=['Mobile_OS', 'Mobile_OS_Version'],
+                    drops=['Operating Software'])
+    def fix_Operating_Software(self, df):
+        """""
+        This function fixes the Operating Software column. It extracts the most common operating system information and creates a new column with
+        it - Mobile_OS. It retains the original information in the Mobile_OS_Version column.
+        Finally, it drops the original Operating Software column
+
+        """""
+
+
+        df["Mobile_OS"] = KeywordClassifier([
+            # Android
+            ("Android", "android"),
+
+            # Apple
+            ("iOS", "ios"),
+            ("iPad OS", "ipad"),
+            ("watchOS", "watchos"),
+
+            # Blackerry
+            ("Blackberry Tablet OS", "blackberry tablet"),
+            ("Blackberry OS", "blackberry"),
+
+            # Huawei
+            ("HarmonyOS", "harmony"),
+            ("Huawei Lite OS", "huawei lite"),
+            ("EMUI", "emui"),
+
+            # Microsoft
+            ("Microsoft Windows Mobile", "microsoft windows mobile"),
+            ("Microsoft Windows Phone", "microsoft windows phone"),
+            ("Microsoft Windows PocketPC", "microsoft windows pocketpc"),
+            ("Microsoft Smartphone", "microsoft smartphone"),
+            ("Microsoft Windows", ("microsoft windows", "wince")),
+
+            # Nokia
+            ("Symbian", "symbian"),
+            ("Nokia Asha Software Platform", "nokia asha"),
+            ("Internet Tablet OS", "internet tablet"),
+
+            # Samsung
+            ("Bada OS", "bada"),
+            ("Tizen OS", "tizen"),
+            ("Touchwiz Lite UI", "touchwiz lite ui"),
+
+            # Others
+            ("Firefox OS", "firefox"),
+            ("Proprietary OS", "proprietary"),
+            ("Linux", "linux"),
+            ("LiMo OS", "limo"),
+            ("Danger", "danger"),
+            ("Sonim OS", "sonim"),
+            ("Palm OS", "palm"),
+            ("KaiOS", "kai"),
+            ("Maemo OS", "maemo"),
+            ("MeeGo", "meego"),
+            ("Sailfish OS", "sailfish"),
+            ("Ubuntu Touch", "ubuntu touch"),
+            ("Ubuntu", "ubuntu"),
+            ("WebOS", "webos"),
+            ("Flyme OS", "flyme"),
+            ("Moto Watch OS", "moto watch"),
+            ("Chrome OS", "chrome"),
+        ], default="unspecified")(df["Operating Software"], self.apply_unique) # creates the Mobile OS column by looking for the key substrings of the operating systems
+
+        df["Mobile_OS_Version"] = df["Operating Software"].str.strip()
+        df['Mobile_OS_Version'] = df['Mobile_OS_Version'].fillna('unspecified') # Fills the missing values with 'unspecified'
+
+        return df
+
+
+    @cleaning_stage(consumes=['Chipset'], produces=['Chipset_Maker', 'Fabrication_Process'], position=26, moves=['Chipset_Maker', 'Fabrication_Process'], drops=['Chipset'])
+    def fix_Chipset(self, df):
+        """""
+        This function fixes the Chipset column. It extracts the Chipset maker information and creates a new column with
+        it - Chipset_Maker. It then extracts the fabrication process information and forms a new column of integers
+        with it - 'Fabrication_Process'.
+        Finally, it drops the original Chipset column
+
+        """""
+
+
+        df["Chipset_Maker"] = KeywordClassifier([
+            ("Qualcomm", "qualcomm"),
+            ("MediaTek", ("mediatek", "mt")),
+            ("NVIDIA", "nvidia"),
+            ("Marvell", "marvell"),
+            ("Intel", "intel"),
+            ("Qualcomm", "msm"),
+            ("UNISOC", ("spreadtrum", "unisoc", "sc")),
+            ("Allwinner", "allwinner"),
+            ("Broadcom", ("bcm", "broadcom")),
+            ("Xiaomi", "xiaomi"),
+            ("Leadcore", "leadcore"),
+            ("JLQ", "jlq"),
+            ("Rockchip", ("rockchip", "rochip")),
+            ("Exynos", "exynos"),
+            ("TI", "ti"),
+            ("Hummingbird", "hummingbird"),
+            ("Apple", "apple"),
+            ("NovaThor", "novathor"),
+            ("Philips", "philips"),
+            ("Pega-Dual", "pega"),
+            ("LG", "lg"),
+            ("Vivante", "vivante"),
+            ("Huawei", "huawei"),
+            ("Kirin", "kirin"),
+            ("ATI", "ati"),
+            ("HiSilicon", "hisilicon"),
+            ("Google", "google"),
+            ("Infineon", "infineon"),
+            ("Nordic Semiconductor", "nrf"),
+            ("RDA", "rda"),
+            ("VIA", "via"),
+            ("STM", "st"),
+            ("Qualcomm", ("snapdragon", "qm")),
+        ], default="unspecified")(df["Chipset"], self.apply_unique) # creates the Chipset Maker column by looking for the key substrings of the chipset makers
+
+        df['Fabrication_Process'] = df['Chipset'].str.extract("\(([^)]+)\)", expand=False).str.replace("nm", "") # Extracts the fabrication process from the Chipset column and removes the "nm" from the end of the string
+        df['Fabrication_Process'] = df['Fabrication_Process'].where(df['Chipset'].str.contains("\("), "unspecified") # If the Chipset column does not contain "(", then the fabrication process is unspecified
+        df['Fabrication_Process'] = pd.to_numeric(df['Fabrication_Process'], errors='coerce').fillna(0).astype(int) # Converts the fabrication process to an integer
+
+        return df
+
+    @cleaning_stage(consumes=['CPU'], produces=['Number_of_CPU_Cores', 'CPU_Performance_Core_Frequency', 'CPU_Efficiency_Core_Frequency'], position=28,
+                    moves=['Number_of_CPU_Cores', 'CPU_Performance_Core_Frequency', 'CPU_Efficiency_Core_Frequency'], drops=['CPU'])
+    def fix_CPU(self, df):
+
+        """""
+        This function fixes the CPU column by extracting the CPU speed and the number of cores from the CPU column.
+        It creates three new columns: Number_of_CPU_Cores CPU_Perfomance_Core_Frequency and CPU_Perfomance_Core_Frequency.
+        It also drops the original CPU column.
+
+        """""
+
+
+        topology = self.cpu_topology(df["CPU"]) # Parses every distinct CPU string once
+        df["Number_of_CPU_Cores"] = topology["Cores"] # The number of cores, assuming 1 core if none is found
+        df['CPU_Performance_Core_Frequency'] = topology["Max_Frequency"].fillna("unspecified") # The maximum processor frequency, in GHz
+        df['CPU_Efficiency_Core_Frequency'] = topology["Min_Frequency"].fillna("unspecified") # The minimum processor frequency, in GHz
+
+        return df
+
+    @cleaning_stage(consumes=['SD Card Slot'], produces=['SD Card Slot'])
+    def fix_SD_Card_Slot(self, df):
+        """""
+        This function fixes the SD Card Slot column. It specifies the type of SD Card Slot. Unless "no" is pecified, it is assumed that the phone has an SD Card Slot.
+
+        """""
+
+
+        df["SD Card Slot"] = KeywordClassifier([
+            ("No", "no"),
+            ("microSDHC", "microsdhc"),
+            ("microSDXC", "microsdxc"),
+            ("microSD", "microsd"),
+            ("miniSD", "minisd"),
+            ("SDHC", "sdhc"),
+            ("SDXC", "sdxc"),
+            ("SD", "sd"),
+            ("Memory Stick Duo Pro", "memory stick duo pro"),
+            ("Memory Stick Duo", "memory stick duo"),
+            ("Memory Stick", "memory stick"),
+        ], default="Yes")(df["SD Card Slot"], self.apply_unique) # specifies the type of SD Card Slot, assuming yes if none of the key substrings is found
+
+        return df
+
+
+        
+    @cleaning_stage(consumes=['Camera', 'Number of Rear Cameras'], produces=['Number_of_Rear_Cameras'], position=33, moves=['Number_of_Rear_Cameras'],
+                    drops=['Number of Rear Cameras'])
+    def fix_Number_of_Rear_Cameras(self, df):
+        """""
+        This function fixes the Number of Rear Cameras column. It specifies the number of rear cameras. Unless "no" is pecified,
+        It is assumed that the phone has a rear camera. The number of rear cameras is implied from the string eg. "Penta" implies 5 rear cameras.
+        If both the Numner of Rear Cameras and the Camera column are null, then the number of rear cameras is assumed to be 0.
+        if the Number of Rear Cameras column is null, but the Camera column is not null, then the number of rear cameras is assumed to be 1.
+
+        """""
+
+        has_camera_or_not = KeywordClassifier([
+            (0, "no"),
+        ], default=np.nan, null=0) # If the value is null or the string in the Camera column contains "no", then the phone has no camera (0), NaN otherwise
+
+        get_num_cameras = KeywordClassifier([
+            (5, ("penta", "five")),
+            (4, "quad"),
+            (3, "triple"),
+            (2, "dual"),
+            (1, "single"),
+        ], default=None, null=1) # The number of cameras implied by the string in the Number of Rear Cameras column, 1 by default for all rows with a camera
+
+        df["Number_of_Rear_Cameras"] = has_camera_or_not(df["Camera"], self.apply_unique) # Creates a new column with the results of the has_camera_or_not classifier
+        
+        df["Number_of_Rear_Cameras"] = df["Number_of_Rear_Cameras"].fillna(get_num_cameras(df["Number of Rear Cameras"], self.apply_unique)) # Fills the NaN values with the results of the get_num_cameras classifier
+
+        return df
+
+    @cleaning_stage(consumes=['Camera'], produces=['Highest_Camera_Resolution'], position=34, moves=['Highest_Camera_Resolution'], drops=['Camera'])
+    def fix_Camera(self, df):
+
+        """""
+        This function fixes the Camera column. It extracts the highest camera resolution from the string in the Camera column.
+        If the string contains "VGA", then the highest camera resolution is assumed to be VGA.
+        If the string contains "no", "no camera" is returned.
+        The highest camera resolution is assumed to be the maximum value in the string that appears before "MP".
+        It is returned as an integer and the original Camera column is dropped.
+
+        """""
+
+        def extract_highest_camera_resolution(val): # Extracts the highest camera resolution from the string in the Camera column
+            if pd.isna(val): # If the value is null, then return "no camera"
+                return "no camera"
+            elif "VGA" in val: # If the string contains "VGA", then return "VGA"
+                return "VGA"
+            else:
+                pattern = r"\b(\d+\.\d+|\d+)\b MP" # Regex pattern to extract the highest camera resolution
+                resolutions = re.findall(pattern, val) # Finds all the matches in the string
+                try:
+                    return int(max(resolutions, key=float)) # Returns the maximum value in the string that appears before "MP"
+                except ValueError: # If the string does not contain any numbers, then
+                    return "no camera" # Returns "no camera" if the string does not contain any numbers
+
+        df["Highest_Camera_Resolution"] = self.apply_unique(df["Camera"], extract_highest_camera_resolution, "Highest_Camera_Resolution",
+                                                            vectorized_camera_resolution) # Creates a new column with the results of the extract_highest_camera_resolution function
+
+        return df
+
+    @cleaning_stage(consumes=['Camera Features'], produces=['HDR'], position=35, moves=['HDR'], drops=['Camera Features'])
+    def fix_Camera_Features(self, df):
+        """""
+        This function fixes the Camera Features column. Essentially, it looks at whether a camera has HDR or not.
+        If the string contains "HDR", then it is assumed that the camera has HDR.
+
+        """""
+
+
+        df["HDR"] = KeywordClassifier([
+            ("HDR", "hdr"),
+        ], default="no HDR")(df["Camera Features"], self.apply_unique) # If the string contains "HDR", then return "HDR", "no HDR" for all other rows
+
+        return df
+
+    @cleaning_stage(consumes=['Rear Video'], produces=['Rear_Video_Resolution', 'Rear_Video_Framerate'], position=36,
+                    moves=['Rear_Video_Resolution', 'Rear_Video_Framerate'], drops=['Rear Video'])
+    def fix_Rear_Video(self, df):
+        """""
+        This function fixes the Rear Video column. Essentially, it extracts the highest video recording resolution and the frame rate at that resolution
+        It also drops the original Rear Video column. Phones without a value record no video.
+        The other video modes and the HDR, gyro-EIS and 10-bit flags are not in the cleaned dataset, they are only available
+        through video_specs(), called on the raw Rear Video column.
+
+        """""
+
+        specs = self.video_specs(df["Rear Video"]) # Parses every distinct video spec once
+        df["Rear_Video_Resolution"] = specs["Resolution"].fillna("no video") # The highest video recording resolution
+        df["Rear_Video_Framerate"] = specs["Framerate"].fillna("no video") # The frame rate at the highest resolution
+
+        return df
+
+
+    @cleaning_stage(consumes=['Number of Selfie Cameras'], produces=['Number_of_Selfie_Cameras'], position=39, moves=['Number_of_Selfie_Cameras'],
+                    drops=['Number of Selfie Cameras'])
+    def fix_Number_of_Selfie_Cameras(self, df):
+        """""
+        This function fixes the Number of Selfie Cameras column.
+        It extracts the number of selfie cameras from the string in the Number of Selfie Cameras column.
+        After extracting the number of selfie cameras, it drops the original Number of Selfie Cameras column.
+
+        """""
+
+
+        df["Number_of_Selfie_Cameras"] = KeywordClassifier([
+            (3, "triple"),
+            (2, "dual"),
+            (1, "single"),
+        ], default=0)(df["Number of Selfie Cameras"], self.apply_unique) # The number of selfie cameras implied by the string, 0 for all other rows
+
+        return df
+
+    @cleaning_stage(consumes=['Selfie Video'], produces=['Selfie_Video_Resolution', 'Selfie_Video_Framerate'], position=40,
+                    moves=['Selfie_Video_Resolution', 'Selfie_Video_Framerate'], drops=['Selfie Video'])
+    def fix_Selfie_Video(self, df):
+        """""
+        This function fixes the Selfie Video column. Essentially, it extracts the highest video recording resolution and the frame rate at that resolution
+        It also drops the original Selfie Video column. Phones without a value have an unspecified selfie video.
+        As with fix_Rear_Video, the other video modes and the HDR, gyro-EIS and 10-bit flags are only available through video_specs().
+
+        """""
+
+        specs = self.video_specs(df["Selfie Video"]) # Parses every distinct video spec once
+        df["Selfie_Video_Resolution"] = specs["Resolution"].fillna("unspecified") # The highest video recording resolution
+        df["Selfie_Video_Framerate"] = specs["Framerate"].fillna("unspecified") # The frame rate at the highest resolution
+
+        return df
+
+    @cleaning_stage(consumes=['Headphone Jack'], produces=['Headphone_Jack'], position=42, moves=['Headphone_Jack'], drops=['Headphone Jack'])
+    def fix_Headphone_Jack(self, df):
+        """""
+        This function extracts the headphone jack type from the string in the Headphone Jack column.
+        It extracts the headphone jack information from the string.
+
+        """""
+
+
+        df["Headphone_Jack"] = KeywordClassifier([
+            ("No", ("no", "nO")),
+            ("Yes", "yes"),
+        ], default="unspecified")(df["Headphone Jack"], self.apply_unique) # Extracts the headphone jack information, "unspecified" for all other rows
+
+        return df
+
+
+    @cleaning_stage(consumes=['WLAN Technology'], produces=['WI-FI'], position=43, moves=['WI-FI'], drops=['WLAN Technology'])
+    def fix_WLAN_Technology(self, df):
+        """""
+        This function extracts from the string in the WLAN Technology column.
+        It creates a new column called WI-FI that contains information if the phone has Wi-Fi or not.
+        It drops the original WLAN Technology column.
+
+        """""
+
+
+        df["WI-FI"] = KeywordClassifier([
+            ("No", "no"),
+            ("Yes", ("wi-fi", "yes")),
+            ("Optional", "optional"),
+        ], default="unspecified")(df["WLAN Technology"], self.apply_unique) # Extracts whether the phone has Wi-Fi, "unspecified" for all other rows
+
+        return df
+
+    @cleaning_stage(consumes=['Bluetooth'], produces=['Bluetooth'])
+    def fix_Bluetooth(self, df):
+        """""
+        This function extracts the bluetooth version from the string in the Bluetooth column.
+        It replaces the original Bluetooth column with the new Bluetooth column.
+
+        """""
+
+
+        df["Bluetooth"] = KeywordClassifier([
+            ("5.3", "5.3"),
+            ("5.2", "5.2"),
+            ("5.1", "5.0"),
+            ("5.0", "5.0"),
+            ("4.2", "4.2"),
+            ("4.1", "4.1"),
+            ("4.0", "4.0"),
+            ("3.0", "3.0"),
+            ("2.1", "2.1"),
+            ("2.0", "2.0"),
+            ("1.2", "1.2"),
+            ("1.1", "1.1"),
+            ("1.0", "1.0"),
+
+            ("Yes, unspecified", ("yes", "bluetooth")),
+            ("No", "no"),
+        ], default="No")(df["Bluetooth"], self.apply_unique) # Extracts the bluetooth version, "No" for all other rows
+
+        return df
+
+
+    @cleaning_stage(consumes=['NFC'], produces=['NFC'])
+    def fix_NFC(self, df):
+        """""
+        This function extracts whther NFC is present or not from the string in the NFC column.
+        It differentiates between "Yes (Market/Model/Use Case Dependent)" and "Yes".
+        It replaces the original NFC column with the new NFC column.
+
+        """""
+
+
+        df["NFC"] = KeywordClassifier([
+            ("Yes (Market/Model/Use Case Dependent)", ("optional", "option", "only", "dependent", "specific", "model", "excl")),
+
+            ("Yes", ("yes", "nfc")),
+            ("No", "no"),
+            ("unspecified", "unspecified"),
+        ], default="No")(df["NFC"], self.apply_unique) # Extracts whether NFC is present, "No" for all other rows
+
+        return df
+
+        
+    @cleaning_stage(consumes=['Radio'], produces=['Radio'])
+    def fix_Radio(self, df):
+        """""
+        This function extracts whther Radio is present or not from the string in the Radio column.
+        It differentiates between "Yes (Market/Model/Software Dependent)" and "Yes".
+
+        """""
+
+
+        df["Radio"] = KeywordClassifier([
+            ("Yes (Market/Model/Software Dependent)", ("optional", "only", "markets", "dependent", "specific", "software")),
+
+            ("Yes", ("yes", "fm", "radio", "stereo")),
+
+            ("No", "no"),
+            ("unspecified", "unspecified"),
+        ], default="No")(df["Radio"], self.apply_unique) # Extracts whether Radio is present, "No" for all other rows
+
+        return df
+
+    @cleaning_stage(consumes=['USB'], produces=['USB_Connector', 'USB_Version'], position=47, moves=['USB_Connector', 'USB_Version'], drops=['USB'])
+    def fix_USB(self, df):
+        """""
+        This function extracts the USB connector type from the string in the USB column.
+        It also extracts the usb version from the string in the USB column.
+        It returns this information in two separate columns.
+        It drops the USB column.
+
+        """""
+
+
+        df["USB_Connector"] = KeywordClassifier([
+            ("Type-C", ("type-c", "usb-c")),
+            ("miniUSB", "mini"),
+            ("microUSB", "micro"),
+            ("Pop-Port", ("pop-port", "pop")),
+            ("USB", "usb"),
+            ("Proprietary", "proprietary"),
+
+            ("No", "no"),
+
+            ("unspecified", ("yes", "unspecified")),
+        ], default="unspecified")(df["USB"], self.apply_unique) # Extracts the USB connector type, "unspecified" for all other rows
+
+        df["USB_Version"] = KeywordClassifier([
+            ("1.1", "1.1"),
+            ("2.0", "2.0"),
+            ("3.0", "3.0"),
+            ("3.1", "3.1"),
+            ("3.2", "3.2"),
+            ("4.0", "4"),
+            ("4.1", "4.1"),
+            ("4.2", "4.2"),
+
+            ("No", "no"),
+
+            ("unspecified", ("yes", "unspecified")),
+        ], default="unspecified")(df["USB"], self.apply_unique) # Extracts the USB version, "unspecified" for all other rows
+
+        return df
+
+
+    @cleaning_stage(consumes=['Sensors'], produces=['Biometric_Sensor', 'Biometric_Sensor_Type', 'Biometric_Sensor_Technology', 'Biometric_Sensor_Location'], position=49,
+                    moves=['Biometric_Sensor', 'Biometric_Sensor_Type', 'Biometric_Sensor_Technology', 'Biometric_Sensor_Location'], drops=['Sensors'])
+    def fix_Sensors(self, df):
+        """""
+        This function fixes the Sensors column. It establishes whether or not a phone has a biometric sensor and what type of sensor it is.
+        It also extracts the information about the sensor technology and its placement.
+        It returns this information in 4 new columns and drops the original Sensors column.
+
+        """""
+
+
+        df["Biometric_Sensor"] = KeywordClassifier([
+            ("Yes", ("fingerprint", "iris", "face")),
+            ("No", "no"),
+
+            ("unspecified", "yes"),
+        ], default="No")(df["Sensors"], self.apply_unique) # Establishes whether the phone has a biometric sensor, "No" for all other rows
+
+        df["Biometric_Sensor_Type"] = KeywordClassifier([
+            ("Fingerprint", "fingerprint"),
+            ("Iris", "iris"),
+            ("Face", "face"),
+
+            ("No", "no"),
+            ("unspecified", "yes"),
+        ], default="No")(df["Sensors"], self.apply_unique) # Extracts the type of biometric sensor, "No" for all other rows
+
+        df["Biometric_Sensor_Technology"] = KeywordClassifier([
+            ("Infrared", "infrared"),
+            ("Optical", "optical"),
+            ("Ultrasonic", "ultrasonic"),
+            ("RFID", "rfid"),
+            ("Capacitive", "capacitive"),
+
+            ("No", "no"),
+            ("unspecified", "yes"),
+        ], default="No")(df["Sensors"], self.apply_unique) # Extracts the biometric sensor technology, "No" for all other rows
+
+        df["Biometric_Sensor_Location"] = KeywordClassifier([
+            ("Top-mounted", "top-mounted"),
+            ("Side-mounted", "side-mounted"),
+            ("Rear-mounted", "rear-mounted"),
+            ("Front-mounted", "front-mounted"),
+            ("Under-display", "under display"),
+            ("Front-facing", "face"),
+            ("No", "no"),
+            ("unspecified", "yes"),
+        ], default="No")(df["Sensors"], self.apply_unique) # Extracts the placement of the biometric sensor, "No" for all other rows
+
+        return df
+
+
+    @cleaning_stage(consumes=['UWB'], produces=['UWB'])
+    def fix_UWB(self, df):
+        """""
+        This function fixes the UWB column. It checks if the string contains "uwb" and returns "Yes" if it does, and "No" if it doesn't.
+        It replaces the original UWB column with the new one that shows "Yes" or "No" for each row.
+
+        """""
+
+
+        df["UWB"] = KeywordClassifier([
+            ("Yes", "uwb"),
+        ], default="No")(df["UWB"], self.apply_unique) # If the string contains "uwb", then return "Yes", "No" for all other rows
+        return df
+
+
+    @cleaning_stage(consumes=['Battery'], produces=['Removable', 'Battery_Type', 'Battery_Capacity'], position=55, moves=['Removable', 'Battery_Type', 'Battery_Capacity'],
+                    drops=['Battery'])
+    def fix_Battery(self, df):
+
+        """""
+        This function fixes the Battery column. It checks if the string contains "non-removable" and returns "No" if it does, and "Yes" if it doesn't.
+        It also extracts the battery size from the string and returns it as an integer.
+        It also extracts the battery type from the string and returns it as a string.
+        It drops the original Battery column and replaces it with the new columns.
+
+        """""
+        
+
+        def extract_battery_size(battery_string):
+            battery_string = str(battery_string)
+            match = re.search(r'\b\d+\b', battery_string)
+            if match:
+                return int(match.group(0))
+            else:
+                return 'unspecified'
+
+
+        df["Removable"] = KeywordClassifier([
+            ("No", "non-removable"),
+            ("Yes", "removable"),
+        ], default="unspecified")(df["Battery"], self.apply_unique) # Creates a new column called "Removable", "unspecified" for all other rows
+
+        df["Battery_Type"] = KeywordClassifier([
+            ("Li-Ion", "li-ion"),
+            ("Li-Po", ("li-po", "li-polymer")),
+        ], default="unspecified")(df["Battery"], self.apply_unique) # Creates a new column called "Battery_Type", "unspecified" for all other rows
+
+        df["Battery_Capacity"] = self.apply_unique(df["Battery"], extract_battery_size, "Battery_Capacity",
+                                                   lambda values: vectorized_first_integer(values, 'unspecified')) # Creates a new column called "Battery_Capacity"
+
+        return df
+
+    @cleaning_stage(consumes=['Charging'], produces=['Wireless_Charging', 'Reverse_Charging', 'Charging_Speed'], position=58,
+                    moves=['Charging_Speed', 'Wireless_Charging', 'Reverse_Charging'], drops=['Charging'])
+    def fix_Charging(self, df):
+
+        """""
+        This function fixes the Charging column. It checks if the string contains "wireless" and returns "Yes" if it does, and "No" if it doesn't.
+        It also extracts the charging speed from the string and returns it as an integer.
+        It also extracts the reverse charging speed from the string and returns it as an integer.
+        It drops the original Charging column and replaces it with the new columns.
+
+        """""
+        def extract_charging_speed(charging_string):
+            """""
+
+
+            """""
+
+            if pd.isnull(charging_string):
+                return 'unspecified'
+            match = re.findall(r'\b\d+W', charging_string)
+            if match:
+                return max(int(x.strip("W")) for x in match)
+            else:
+                return 'unspecified'
+
+        df["Wireless_Charging"] = KeywordClassifier([
+            ("Yes", "wireless"),
+        ], default="unspecified")(df["Charging"], self.apply_unique) # Creates a new column called "Wireless_Charging", "unspecified" for all other rows
+
+        df["Reverse_Charging"] = KeywordClassifier([
+            ("Yes", "reverse"),
+        ], default="unspecified")(df["Charging"], self.apply_unique) # Creates a new column called "Reverse_Charging", "unspecified" for all other rows
+
+        df["Charging_Speed"] = self.apply_unique(df["Charging"], extract_charging_speed, "Charging_Speed",
+                                                 lambda values: vectorized_max_integer(values, r'\b(\d+)W', 'unspecified')) # Creates a new column called "Charging_Speed"
+
+        return df
+
+    @cleaning_stage(consumes=['Colors'], produces=['Colors'])
+    def fix_Colors(self, df):
+
+        """""
+        This function fixes the Colors column. It counts the number of color options in the string and returns it as an integer.
+
+        """""
+
+
+        def count_color_options(colors): # Counts the number of color options in the string and returns it as an integer.
+            if pd.isna(colors): # If the string is empty,
+                return 0 # Return 0
+            return len(colors.split(",")) # Otherwise, return the number of color options
+
+
+        df['Colors'] = self.apply_unique(df['Colors'], count_color_options, 'Colors') # Applies the count_color_options function to the Colors column
+
+        return df
+
+
+    @cleaning_stage(consumes=['Battery Life'], produces=['Battery_Life'], position=63, moves=['Battery_Life'], drops=['Battery Life'])
+    def fix_Battery_Life(self, df):
 
-    def fix_Selfie_Video(self, df):
         """""
-        This function fixes the Rear Video column. Essentially, it extracts the highest video recording resolution and the frame rate at that resolution
-        It also drops the original Rear Video column.
+        This function fixes the Battery Life column. It extracts the endurance from the string and returns it as an integer.
+        It drops the original Battery Life column and replaces it with the new column.
+
+        """"" 
+
+        def extract_endurance(charging_string):
+            """""
+            This function extracts the endurance from the string and returns it as an integer.
+            It uses pattern matching to find the endurance in the string.
+
+            """""
+
+            if pd.isnull(charging_string): # If the string is empty,
+                return 'untested'
+            match = re.findall(r'\b\d+h', charging_string) # Finds the endurance in the string
+            if match: # If the string contains the endurance,
+                return max(int(x.strip("h")) for x in match) # Return the endurance
+            else:
+                return 'untested' # Otherwise, return "untested"
+
+        df["Battery_Life"] = self.apply_unique(df["Battery Life"], extract_endurance, "Battery_Life",
+                                               lambda values: vectorized_max_integer(values, r'\b(\d+)h', 'untested')) # Creates a new column called "Battery_Life" and applies the extract_endurance function to it
+
+        return df
+
+
+    @cleaning_stage(consumes=['Internal Storage'], produces=['ROM', 'RAM'], position=33, moves=['ROM', 'RAM'], drops=['Internal Storage'])
+    def fix_Internal_Storage(self, df):
+
+        """""
+        This function fixes the Internal Storage column. It extracts the storage capacity (ROM) and the RAM from the string.
+        It returns these as integers in GB in their own respective columns.
+        This function's logic is based on the logic that the vast majority of phones have a higher storage capacity than RAM.
+        It therefore extracts the higher of the two values and returns it as the storage capacity, and the lower of the two values as the RAM.
+        NB: there are some fringe cases where this logic does not work (more RAM than ROM) giving wrong values, but these are very rare
+        Work can be done to improve this function to fix these cases.
 
         """""
-        def get_video_resolution(x):
+
+        def extract_storage(internal_storage_string):
 
             """""
-            This function extracts the highest video recording resolution from the string in the Rear Video column.
-            If the string contains "no", then "no video" is returned.
-            It uses matching to extract the highest video recording resolution.
+
+            This function extracts the storage capacity (ROM) from the string.
+            It takes the highest value after pattern matching
 
             """""
-            if str(x).lower().strip() == "no": # If the value is null or contains "no", then return "no video"
-                return "no video"
 
-            if pd.isnull(x): # If the value is null, then return "unspecified"
-                return "unspecified"
+            if pd.isnull(internal_storage_string): # If the string is empty,
+                return 'unspecified'
             
-            x = x.split(",")[0] # Splits the string at the comma and takes the first element, highest resolution
+            internal_storage_string = re.sub(r'\([^)]*\)', '', internal_storage_string) # remove anything inside brackets
+            match = re.findall(r'\b\d+GB', internal_storage_string) + re.findall(r'\b\d+MB', internal_storage_string) # Finds the capacity in the string
+            if match: # If the string contains the capacity,
+                match = [int(x.strip("GB")) if "GB" in x else int(x.strip("MB"))/1000 for x in match] # Convert the capacity to GB
+                if len(match) > 1:
+                    return max(match) # Return the max capacity
+                else:
+                    return match[0] # Otherwise, return the capacity
+            else:
+                return 'unspecified' # Otherwise, return "unspecified"
 
-            if x.find("8K") != -1: # If the string contains "8K", then return "8K"
-                return "8K"
-            
-            if x.find("4K") != -1: # If the string contains "4K", then return "4K"
-                return "4K"
+        def extract_ram(internal_storage_string):
 
-            if x.lower().find("1440p") != -1: # If the string contains "1440p", then return "1440p"
-                return "1440p"
-            
-            if x.lower().find("1080p") != -1: # If the string contains "1080p", then return "1080p"
-                return "1080p"
+            """""
+
+            This function extracts the storage capacity (ROM) from the string.
+            It takes the highest value after pattern matching
 
-            if x.lower().find("1152p") != -1: # If the string contains "1152p", then return "1152p"
-                return "1152p"
+            """""
+        
+            if pd.isnull(internal_storage_string): # If the string is empty,
+                return 'unspecified'
             
-            if x.lower().find("720p") != -1: # If the string contains "720p", then return "720p"
-                return "720p"
+            match = re.findall(r'\b\d+GB', internal_storage_string) + re.findall(r'\b\d+MB', internal_storage_string) # Finds the capacity in the string
+            if match: # If the string contains the capacity,
+                match = [int(x.strip("GB")) if "GB" in x else int(x.strip("MB"))/1000 for x in match] # Convert the capacity to GB
+                if len(match) > 1:
+                    return min(match) # Return the min capacity
+                else:
+                    return 'unspecified'
+            else:
+                return 'unspecified' # Otherwise, return "unspecified"
+
+
+        df["ROM"] = self.apply_unique(df["Internal Storage"], extract_storage, "ROM", lambda values: vectorized_capacity(values, highest=True)) # Creates a new column called "Internal_Storage" and applies the extract_storage function to it
+        df["RAM"] = self.apply_unique(df["Internal Storage"], extract_ram, "RAM", lambda values: vectorized_capacity(values, highest=False)) # Creates a new column called "RAM" and applies the extract_ram function to it
+
+        return df
+
+
+    @cleaning_stage(consumes=['Storage Type'], produces=['Storage_Type_Version', 'Storage_Type'], position=35, moves=['Storage_Type_Version', 'Storage_Type'],
+                    drops=['Storage Type'])
+    def fix_Storage_Type(self, df):
+        """""
+        This function fixes the Storage Type column. It extracts the storage type (UFS or eMMC) from the string.
+        It also returns the Version of the storage type as a float.
+        It drops the original Storage Type column.
 
-            if x.lower().find("480p") != -1: # If the string contains "480p", then return "480p"
-                return "480p"
+        """""
 
-            if x.lower().find("360p") != -1: # If the string contains "360p", then return "360p"
-                return "360p"
+        def extract_UFS_eMMC(x): # Extracts the storage type from the string
+            if pd.notnull(x): # If the string is not empty,
+                match = re.findall(r'\b(UFS|eMMC)\s(\d+\.\d+)', str(x)) # Finds the storage type and version in the string
+                if match: # If the string contains the storage type and version,
+                    return match[0][1] # Return the version
+            return 'unspecified' # Otherwise, return "unspecified"
 
-            if x.lower().find("240p") != -1: # If the string contains "240p", then return "240p"
-                return "240p"
 
-            if x.lower().find("320p") != -1: # If the string contains "320p", then return "320p"
-                return "320p"
+        df["Storage_Type_Version"] = self.apply_unique(df['Storage Type'], extract_UFS_eMMC, 'Storage_Type_Version') # Creates a new column called "Storage_Type_Version" and applies the extract_UFS_eMMC function to it
 
-            if x.lower().find("288p") != -1: # If the string contains "288p", then return "288p"
-                return "288p"
+        df["Storage_Type"] = KeywordClassifier([
+            ("eMMC", "emmc"),
+            ("UFS", "ufs"),
+        ], default="unspecified")(df["Storage Type"], self.apply_unique) # Creates a new column called "Storage_Type", "unspecified" for all other rows
 
-            if x.lower().find("144p") != -1: # If the string contains "144p", then return "144p"
-                return "144p"
+        return df
 
-            if x.lower().find("120p") != -1: # If the string contains "120p", then return "120p"
-                return "120p"
 
-            if x.lower().find("qcif") != -1: # If the string contains "qcif", then return "qcif"
-                return "QCIF"
+        
+    @cleaning_stage(consumes=['Loudspeaker'], produces=['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring'], position=64,
+                    moves=['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring'], drops=['Loudspeaker'])
+    def fix_Loudspeaker(self, df):
 
-            if x.lower().find("176x144") != -1: # If the string contains "176x144", then return "176x144"
-                return "QCIF"
+        """""
 
-            if x.lower().find("cif") != -1: # If the string contains "cif", then return "cif"
-                return "CIF"
 
-            if x.lower().find("352x288") != -1: # If the string contains "352x288", then return "352x288"
-                return "CIF"
+        This function fixes the Loudspeaker column. It extracts the 3 values of dB for Voice, Noise and Ring.
+        It returns the values as floats, and denotes "untested" to the values that are not available.
+        A value without "/" (e.g. "Voice 66dB") has no Noise part, so Noise is "untested" and the whole value is
+        read as Voice and Ring; before this it raised an IndexError and stopped the cleaning.
+        It drops the original Loudspeaker column.
 
-            if x.lower().find("qvga") != -1: # If the string contains "qvga", then return "qvga"
-                return "QVGA"
-            
-            if x.find("vga") != -1: # If the string contains "vga", then return "vga"
-                return "VGA"
-            
-            res = [i for i in x.split(" ") if i[-2:] == "p@"] # Extracts the highest resolution from the string
-            if len(res) > 0: # If the length of the list is greater than 0, then return the highest resolution
-                return res[0][:-2] + "p" # Returns the highest resolution
-            
-            return "unspecified" # Returns "unspecified" for all other rows
-            
-        def get_video_framerate(x):
+        """""
+
+
+        extract_num = lambda x: int(re.findall(r'\d+', x)[0]) if re.search(r'\d+', x) else None # Extracts the number from the string
+
+        def extract_loudspeaker(value): # Extracts the numbers of the voice, noise and ring parts of the string
+            if pd.isnull(value) or 'LUFS' in value: # Values in LUFS are not in dB
+                return None, None, None
+            parts = value.split('/') # Splits the string into 3 parts
+            return extract_num(parts[0]), extract_num(parts[1] if len(parts) > 1 else ''), extract_num(parts[-1]) # No "/" gives no Noise
+
+        voice, noise, ring = self.apply_unique_fields(df['Loudspeaker'], extract_loudspeaker, 'Loudspeaker (parts)', vectorized_loudspeaker) # Parses every distinct value once
+
+        df['Loudspeaker_Voice'] = voice.fillna('untested') # Replaces the NaN values with "untested"
+        df['Loudspeaker_Noise'] = noise.fillna('untested')
+        df['Loudspeaker_Ring'] = ring.fillna('untested')
+
+        return df
+
+    @cleaning_stage(consumes=['Price', 'Approx Price', 'Released', 'Announced'], produces=['Price'], position=68, moves=['Price'], drops=['Approx Price'])
+    def fix_price_and_approx_price(self, df):
+
+        """""
+        This function fixes the Price and Approx Price columns. It extracts the price from the string and converts it to float.
+        It returns the values as rounded floats, and denotes "unspecified" to the values that are not available.
+        It gives the value in EUR and converts other currencies to EUR using the exchange rate on 08/02/2023.
+        If the cleaner has exchange rates, every price is converted at the rates of the month the phone was released
+        (or announced) instead, see convert_prices_asof.
+
+        """""
+
+        if self.exchange_rates is not None:
+            approx_currency, approx_amount = self.apply_unique_fields(df["Approx Price"], parse_approx_price, "Approx Price (amount)",
+                                                                      vectorized_approx_price_amounts) # Currency and amount of every price
+            currency, amount = self.apply_unique_fields(df['Price'], parse_price, 'Price (amount)', vectorized_price_amounts)
+
+            released = df['Released'].array.asi8
+            months = np.where(released != NAT_ORDINAL, released, df['Announced'].array.asi8) # Month of every phone
+            approx = convert_prices_asof(approx_currency, approx_amount, months, self.exchange_rates)
+            price = convert_prices_asof(currency, amount, months, self.exchange_rates)
+
+            df['Price'] = pd.Series(np.where(np.isnan(approx), price, approx), index=df.index).fillna("unspecified") # The approximate price comes first
+            return df
+
+        def extract_from_approx_price(price):
 
             """""
-            This function extracts the frame rate at the highest video recording resolution from the string in the Rear Video column.
-            If the string contains "no", then "no video" is returned.
-            It extracts the framerate before the fps substring.
+            This function extracts the price from the Approx Price column.
+            It uses pattern matching to extract the price from the string.
+            It returns the values as rounded floats, and denotes nan to the values that are not available.
+            It gives the value in EUR and converts other currencies to EUR using the exchange rate on 08/02/2023.
             """""
 
-            if str(x).lower().strip() == "no": # If the value is null or contains "no", then
-                return "no video"
+            pattern = r"About (\d+\.\d+|\d+) EUR" # Pattern to match
+            match = re.search(pattern, price) # Searches for the pattern in the string
+            if match: # If the pattern is found, returns the value
+                return round(float(match.group(1))) # Returns the value as rounded float, "About 250.5 EUR" has decimals
+            pattern = r"About (\d+\.\d+|\d+) INR" # Pattern to match
+            match = re.search(pattern, price) # Searches for the pattern in the string
+            if match: # If the pattern is found, returns the value
+                return round(float(match.group(1)) * CURRENCY_RATES['₹']) # Returns the value as rounded float
+            return None # If the pattern is not found, returns None
 
-            if pd.isnull(x): # If the value is null, then return "unspecified"
-                return "unspecified"
-            
-            x = x.split(",")[0] # Splits the string at the comma and takes the first element, highest resolution
-            
-            fps = [i for i in x.split("@") if i[-3:] == "fps" or i[-4:] == "fps."] # Extracts the frame rate from the string
-            if len(fps) > 0: # If the length of the list is greater than 0, then return the frame rate
-                return (fps[0][:-3] if fps[0][-3:] == "fps" else fps[0][:-4]) # Returns the frame rate
-            
-            return "unspecified"    # Returns "unspecified" for all other rows
-        
-        df["Selfie_Video_Resolution"] = df["Selfie Video"].apply(lambda x: get_video_resolution(x)) # Applies the get_video_resolution function to the Rear Video column
-        df["Selfie_Video_Framerate"] = df["Selfie Video"].apply(lambda x: get_video_framerate(x))    # Applies the get_video_framerate function to the Rear Video column
 
-        columns_to_move = ['Selfie_Video_Resolution',"Selfie_Video_Framerate" ] # Columns to move
-        for i, col in enumerate(columns_to_move, start=40): # Iterates through the columns to move and moves them to the 40th and 41st position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        def extract_from_price(price_str):
+
+            """""
+            This function extracts the price from the Price column.
+            It uses pattern matching to extract the price from the string.
+            It returns the values as rounded floats, and denotes nan to the values that are not available.
+            It gives the value in EUR and converts other currencies to EUR using the exchange rate on 08/02/2023.
+
+            """""
+
+            if not isinstance(price_str, str): # If the value is not a string, returns nan
+                return price_str # Returns nan
+            euros = re.findall(r'€\s*(\d+(?:\.\d+)?)', price_str) # Finds the pattern in the string
+            if euros: # If the pattern is found, returns the value
+                return round(float(euros[0])) # Returns the value as rounded float
+            dollars = re.findall(r'\$\s*(\d+(?:\.\d+)?)', price_str) # Finds the pattern in the string
+            if dollars: # If the pattern is found, returns the value
+                return round(float(dollars[0]) * CURRENCY_RATES['$']) # Returns the value as rounded float
+            inr = re.findall(r'₹\s*(\d+(?:,\d+)?)', price_str) # Finds the pattern in the string
+            if inr: # If the pattern is found, returns the value
+                return round(float(inr[0].replace(',', '')) * CURRENCY_RATES['₹']) # Returns the value as rounded float
+            pounds = re.findall(r'£\s*(\d+(?:\.\d+)?)', price_str) # Finds the pattern in the string
+            if pounds: # If the pattern is found, returns the value
+                return round(float(pounds[0]) * CURRENCY_RATES['£']) # Returns the value as rounded float
+            return float('nan') # If the pattern is not found, returns nan
+
+
+        df["Approx Price"] = self.apply_unique(df["Approx Price"], lambda x: extract_from_approx_price(x) if pd.notna(x) else None, "Approx Price",
+                                               vectorized_approx_price) # Extracts the price from the string and converts it to float
+        df['Price'] = self.apply_unique(df['Price'], extract_from_price, 'Price', vectorized_price) # Extracts the price from the string and converts it to float
+
+        df['Price'] = df['Approx Price'].combine_first(df['Price']) # Combines the two columns
+        df['Price'] = df['Price'].fillna("unspecified") # Replaces the NaN values with "unspecified"
 
-        df = df.drop(columns=["Selfie Video"]) # Drops the original Selfie Video column
-        
         return df
 
-    def fix_Headphone_Jack(self, df):
+
+    def input_columns(self):
+
         """""
-        This function extracts the headphone jack type from the string in the Headphone Jack column.
-        It extracts the headphone jack information from the string.
+        This function returns the columns of the raw dataset the cleaning functions read, in the order they are read,
+        and the set of raw columns they drop without reading them.
 
         """""
 
+        required = []
+        created = set() # Columns created by the cleaning functions so far
+        for func in self.cleaning_functions:
+            stage = func.stage
+            required += [col for col in dict.fromkeys(stage.consumes + list(stage.renames)) if col not in created and col not in required]
+            created |= set(stage.produces) | set(stage.renames.values())
+        skipped = {col for func in self.cleaning_functions for col in func.stage.drops} - set(required)
 
-        df["Headphone_Jack"] = df["Headphone Jack"].apply(lambda x: 
-            # checks
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "No" if not pd.isnull(x) and x.lower().find("nO") != -1 else # If the string contains "nO", then return "no"
-            "Yes" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "unspecified" # Returns "unspecified" for all other rows
+        return required, skipped
 
-        )
+    def worker_config(self):
+        exchange_rates = tuple(self.exchange_rates.itertuples(index=False, name=None)) if self.exchange_rates is not None else None # Hashable records
+        return {'cache_size': self.cache.maxsize, 'vectorized': self.vectorized, 'exchange_rates': exchange_rates,
+                'quarantine': self.quarantine} # Options of the cleaners of the worker processes
 
-        columns_to_move = ['Headphone_Jack'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=42): # Iterates through the columns to move and moves them to the 42nd position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    def stage_levels(self):
 
-        df = df.drop(columns=["Headphone Jack"]) # Drops the original Camera Features column
+        """""
+        This function groups the cleaning functions into levels that can run at the same time.
+        Every function goes one level after the last earlier function it depends on, so the functions of a level
+        never read or change the columns changed by each other.
 
-        return df
+        """""
 
+        levels = []
+        level_of = [] # Level of every cleaning function
+        for i, func in enumerate(self.cleaning_functions):
+            level = max((level_of[j] + 1 for j in range(i) if func.stage.depends_on(self.cleaning_functions[j].stage)), default=0)
+            level_of.append(level)
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(i)
+
+        return levels
+
+    def clean_in_parallel(self, df, stage_workers):
 
-    def fix_WLAN_Technology(self, df):
         """""
-        This function extracts from the string in the WLAN Technology column.
-        It creates a new column called WI-FI that contains information if the phone has Wi-Fi or not.
-        It drops the original WLAN Technology column.
+        This function runs the cleaning functions of every level in a pool of stage_workers processes.
+        Each function is only sent the columns it consumes, and the columns it produces are merged back.
+        The layouts of the functions are then replayed in their original order, so the columns end up in the same order as in clean().
 
         """""
 
+        raw_columns = list(df.columns)
+        df = df.copy(deep=False) # Leaves the original frame untouched
+        new_columns = {} # Columns created by every cleaning function, in the order they were created
+        config = self.worker_config()
 
-        df["WI-FI"] = df["WLAN Technology"].apply(lambda x: 
-            # checks
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "Yes" if not pd.isnull(x) and x.lower().find("wi-fi") != -1 else # If the string contains "yes", then return "yes"
-            "Yes" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "Optional" if not pd.isnull(x) and x.lower().find("optional") != -1 else # If the string contains "optional", then return "optional"
-            "unspecified" # Returns "unspecified" for all other rows
+        with ProcessPoolExecutor(max_workers=stage_workers) as executor:
+            for level in self.stage_levels():
+                stages = [self.cleaning_functions[i].stage for i in level]
+                futures = [executor.submit(run_stage_in_worker, stage.name, as_object_strings(df[stage.consumes], stage.consumes), config) if stage.produces else None
+                           for stage in stages] # Sends every function of the level the columns it consumes
 
-        )
+                for i, stage, future in zip(level, stages, futures):
+                    if future is not None:
+                        result, quarantined = future.result()
+                        self.quarantined += quarantined
+                        for col in result.columns: # Merges the produced columns back
+                            df[col] = result[col].values
+                        new_columns[i] = list(result.columns)
+                    df = stage.rename_columns(as_object_strings(df, list(stage.renames))) # The drops are left to the final reindex
 
-        columns_to_move = ['WI-FI'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=43): # Iterates through the columns to move and moves them to the 43rd position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        columns = raw_columns
+        for i, func in enumerate(self.cleaning_functions): # Replays the layouts in order
+            columns = func.stage.plan_layout(columns, new_columns.get(i, []))
 
-        df = df.drop(columns=["WLAN Technology"]) # Drops the original Camera Features column
+        return df.reindex(columns=columns)
 
-        return df
+    def clean_in_partitions(self, df, n_jobs):
 
-    def fix_Bluetooth(self, df):
         """""
-        This function extracts the bluetooth version from the string in the Bluetooth column.
-        It replaces the original Bluetooth column with the new Bluetooth column.
+        This function splits the rows of the dataset into n_jobs partitions and runs all the cleaning functions on every
+        partition in its own process. The cleaned partitions are put back together in the original order of the rows.
+        As with clean_csv, the result is the same as clean() as long as the partitions are big enough to infer the same dtypes.
+        An empty dataset has no partition, so it is cleaned in this process.
 
         """""
 
+        if len(df) == 0:
+            return self.run_cleaning_functions(df)
+        bounds = np.linspace(0, len(df), n_jobs + 1).astype(int) # Boundaries of the partitions
+        partitions = [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
 
-        df["Bluetooth"] = df["Bluetooth"].apply(lambda x: 
-            # checks
-            
-            
-            "5.3" if not pd.isnull(x) and x.lower().find("5.3") != -1 else # If the string contains "5.3", then return "5.3"
-            "5.2" if not pd.isnull(x) and x.lower().find("5.2") != -1 else # If the string contains "5.0", then return "5.0"
-            "5.1" if not pd.isnull(x) and x.lower().find("5.0") != -1 else # If the string contains "5.1", then return "5.0"
-            "5.0" if not pd.isnull(x) and x.lower().find("5.0") != -1 else # If the string contains "5.0", then return "5.0"
-            "4.2" if not pd.isnull(x) and x.lower().find("4.2") != -1 else # If the string contains "4.2", then return "4.2"
-            "4.1" if not pd.isnull(x) and x.lower().find("4.1") != -1 else # If the string contains "4.1", then return "4.1"
-            "4.0" if not pd.isnull(x) and x.lower().find("4.0") != -1 else # If the string contains "4.0", then return "4.0"
-            "3.0" if not pd.isnull(x) and x.lower().find("3.0") != -1 else # If the string contains "3.0", then return "3.0"
-            "2.1" if not pd.isnull(x) and x.lower().find("2.1") != -1 else # If the string contains "2.1", then return "2.1"
-            "2.0" if not pd.isnull(x) and x.lower().find("2.0") != -1 else # If the string contains "2.0", then return "2.0"
-            "1.2" if not pd.isnull(x) and x.lower().find("1.2") != -1 else # If the string contains "1.2", then return "1.2"
-            "1.1" if not pd.isnull(x) and x.lower().find("1.1") != -1 else # If the string contains "1.1", then return "1.1"
-            "1.0" if not pd.isnull(x) and x.lower().find("1.0") != -1 else # If the string contains "1.0", then return "1.0"
-
-            "Yes, unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes, unspecified"
-            "Yes, unspecified" if not pd.isnull(x) and x.lower().find("bluetooth") != -1 else # If the string contains "bluetooth", then return "yes, unspecified"
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "No" # Returns "No" for all other rows
-
-        )
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            names = [func.__name__ for func in self.cleaning_functions]
+            results = list(executor.map(clean_partition_in_worker, partitions, [self.worker_config()] * len(partitions),
+                                        [names] * len(partitions)))
 
-        return df
+        for _, quarantined in results:
+            self.quarantined += quarantined
+        return pd.concat([partition for partition, _ in results]) # Keeps the order and the index of the rows
 
+    def run_cleaning_functions(self, df, report=None, checkpoint=False, resume=False, **fields):
 
-    def fix_NFC(self, df):
         """""
-        This function extracts whther NFC is present or not from the string in the NFC column.
-        It differentiates between "Yes (Market/Model/Use Case Dependent)" and "Yes".
-        It replaces the original NFC column with the new NFC column.
+        This function runs all the cleaning functions on df, one after the other, and applies their layouts.
+        The layouts are only planned on the column names while the functions run, and applied by a single reindex at the end,
+        so the columns are not copied by every move and drop.
+        If a report is given, every cleaning function is measured in it, with fields added to its record.
+        If checkpoint is True and the cleaner has a checkpoint_dir, the frame is saved there every checkpoint_every functions,
+        and if resume is True the run starts after the last function of a checkpoint of the same run (see load_checkpoint).
 
         """""
 
+        df = df.copy(deep=False) # The functions add columns to df, this leaves the original frame untouched
+        columns = list(df.columns) # Planned columns of df
+        start = 0 # Number of cleaning functions already run
+        checkpoint = checkpoint and self.checkpoint_dir is not None
+        if checkpoint:
+            fingerprint = self.checkpoint_fingerprint(df)
+            if resume:
+                start, df, columns = self.load_checkpoint(fingerprint, df, columns)
 
-        df["NFC"] = df["NFC"].apply(lambda x: 
-            # checks
-            
-            
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("optional") != -1 else # If the string contains "optional", then return "Yes (Market/Model/Use Case Dependent)"
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("option") != -1 else # If the string contains "option", then return "Yes (Market/Model/Use Case Dependent)"
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("only") != -1 else # If the string contains "only", then return "Yes (Market/Model/Use Case Dependent)"
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("dependent") != -1 else # If the string contains "dependent", then return "Yes (Market/Model/Use Case Dependent)"
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("specific") != -1 else # If the string contains "specific", then return "Yes (Market/Model/Use Case Dependent)"
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("model") != -1 else # If the string contains "model", then return "Yes (Market/Model/Use Case Dependent)"
-            "Yes (Market/Model/Use Case Dependent)" if not pd.isnull(x) and x.lower().find("excl") != -1 else # If the string contains "excl", then return "Yes (Market/Model/Use Case Dependent)"
-
-            "Yes" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "Yes" if not pd.isnull(x) and x.lower().find("nfc") != -1 else # If the string contains "nfc", then return "Yes, unspecified"
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "unspecified" if not pd.isnull(x) and x.lower().find("unspecified") != -1 else # If the string contains "unspecified", then return "unspecified"
-            "No" # Returns "No" for all other rowss
-
-        )
+        for i, func in enumerate(self.cleaning_functions[start:], start=start + 1):
+            self.running_stage = func.__name__
+            df, columns = report.measure(func, df, columns, **fields) if report is not None else run_stage(func, df, columns)
+            if checkpoint and i % self.checkpoint_every == 0 and i < len(self.cleaning_functions):
+                self.save_checkpoint(fingerprint, i, df, columns)
+
+        if checkpoint: # The run is complete, there is nothing left to resume
+            self.remove_checkpoint()
+        return df.reindex(columns=columns) # Applies the layouts of all the functions at once
+
+    def checkpoint_path(self):
+        return os.path.join(self.checkpoint_dir, 'checkpoint.pkl')
+
+    def checkpoint_fingerprint(self, df):
+
+        """""
+        This function returns a hash of a run of the cleaning functions on df: the raw rows and index of df, and everything
+        their cleaning depends on but the cleaning rules (see cleaning_fingerprint). A checkpoint is only resumed by a run
+        with the same fingerprint. The rules are checked per cleaning function instead (see stage_fingerprints).
+
+        """""
+
+        digest = hashlib.sha256(self.cleaning_fingerprint(df, rules=False).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()) # Hash of the raw values and index of every row
+        return digest.hexdigest()
+
+    def stage_fingerprints(self):
+
+        """""
+        This function returns a hash of the source code of every cleaning function. A checkpoint is resumed as long as the functions
+        it ran did not change, so that a crash can be fixed in a later function and the run resumed. Changes to the helpers
+        the functions call are not seen.
+
+        """""
+
+        return [hashlib.sha256(inspect.getsource(func).encode()).hexdigest() for func in self.cleaning_functions]
+
+    def save_checkpoint(self, fingerprint, done, df, columns):
+
+        """""
+        This function saves the frame and its planned columns after the first done cleaning functions to the checkpoint directory.
+        The checkpoint only replaces the previous one once it is completely written, so a crash never leaves a broken checkpoint.
+        The frame holds columns of mixed types (numbers and labels), so it is pickled, which keeps them exactly.
+
+        """""
+
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        temporary_path = self.checkpoint_path() + '.tmp'
+        pd.to_pickle({'fingerprint': fingerprint, 'done': done, 'stages': self.stage_fingerprints()[:done], 'columns': columns, 'frame': df,
+                      'quarantined': self.quarantined}, temporary_path)
+        os.replace(temporary_path, self.checkpoint_path())
+
+    def load_checkpoint(self, fingerprint, df, columns):
+
+        """""
+        This function returns the number of cleaning functions already run, the frame and its planned columns from the checkpoint
+        of the run with fingerprint, if the functions it ran did not change since. Otherwise, the run starts from the beginning with df and columns.
+
+        """""
+
+        if os.path.exists(self.checkpoint_path()):
+            stored = pd.read_pickle(self.checkpoint_path())
+            if stored['fingerprint'] == fingerprint and stored['stages'] == self.stage_fingerprints()[:stored['done']]:
+                self.quarantined = stored['quarantined'] + self.quarantined # Values quarantined before the checkpoint
+                return stored['done'], stored['frame'], stored['columns']
+        return 0, df, columns
+
+    def remove_checkpoint(self):
+        if os.path.exists(self.checkpoint_path()):
+            os.remove(self.checkpoint_path())
+
+    def clean_rows(self, df, stage_workers=None, n_jobs=None, resume=False):
+
+        """""
+        This function runs all the cleaning functions on df, in the mode chosen by stage_workers and n_jobs (see clean()).
+        Only the sequential mode saves checkpoints and resumes them.
+
+        """""
+
+        if n_jobs is not None and n_jobs > 1:
+            return self.clean_in_partitions(df, n_jobs)
+        if stage_workers is not None and stage_workers > 1:
+            return self.clean_in_parallel(df, stage_workers)
+
+        self.report = CleaningReport(self.trace_memory, self.stage_callback)
+        return self.run_cleaning_functions(df, self.report, checkpoint=True, resume=resume)
+
+    def rules_fingerprint(self):
+
+        """""
+        This function returns a hash of the source code of the modules of the cleaner's class and its base classes,
+        which changes whenever a cleaning rule changes.
+
+        """""
+
+        digest = hashlib.sha256()
+        for module in dict.fromkeys(sys.modules[cls.__module__] for cls in type(self).__mro__ if cls is not object):
+            digest.update(inspect.getsource(module).encode())
+        return digest.hexdigest()
+
+    def cleaning_fingerprint(self, df, rules=True):
+
+        """""
+        This function returns a hash of everything the cleaning of the rows of df depends on besides their values:
+        the cleaning rules (see rules_fingerprint, left out if rules is False), the cleaning functions (see clean(columns=...)),
+        the raw columns and the exchange rates.
+
+        """""
+
+        names = [func.__name__ for func in self.cleaning_functions]
+        exchange_rates = self.exchange_rates.to_json(date_format='iso') if self.exchange_rates is not None else None
+        rules = self.rules_fingerprint() if rules else None
+        return hashlib.sha256(json.dumps([rules, names, list(df.columns), exchange_rates]).encode()).hexdigest()
 
-        return df
+    def clean_incrementally(self, store, stage_workers=None, n_jobs=None, resume=False):
 
-        
-    def fix_Radio(self, df):
         """""
-        This function extracts whther Radio is present or not from the string in the Radio column.
-        It differentiates between "Yes (Market/Model/Software Dependent)" and "Yes".
+        This function only cleans the rows of the dataset that are not in store, the path of a file holding the cleaned rows
+        of a previous run, keyed by a hash of their raw values. The other rows are taken from the store, which is then
+        replaced with the cleaned rows of this dataset.
+        The store is ignored, and the whole dataset cleaned again, if it was written with other cleaning rules, cleaning functions,
+        raw columns or exchange rates (see cleaning_fingerprint).
+        The new rows are cleaned like in clean(). As with clean_in_partitions, the result is the same as clean() as long as
+        the new rows infer the same dtypes.
 
         """""
 
+        df = self.df
+        if len(df) == 0:
+            return self.clean_rows(df, stage_workers, n_jobs, resume)
 
-        df["Radio"] = df["Radio"].apply(lambda x: 
-            # checks
-            
-            
-            "Yes (Market/Model/Software Dependent)" if not pd.isnull(x) and x.lower().find("optional") != -1 else # If the string contains "optional", then return "Yes (Market/Model/Software Dependent)"
-            "Yes (Market/Model/Software Dependent)" if not pd.isnull(x) and x.lower().find("only") != -1 else # If the string contains "only", then return "Yes (Market/Model/Software Dependent)"
-            "Yes (Market/Model/Software Dependent)" if not pd.isnull(x) and x.lower().find("markets") != -1 else # If the string contains "markets", then return "Yes (Market/Model/Software Dependent)"
-            "Yes (Market/Model/Software Dependent)" if not pd.isnull(x) and x.lower().find("dependent") != -1 else # If the string contains "dependent", then return "Yes (Market/Model/Software Dependent)"
-            "Yes (Market/Model/Software Dependent)" if not pd.isnull(x) and x.lower().find("specific") != -1 else # If the string contains "specific", then return "Yes (Market/Model/Software Dependent)"
-            "Yes (Market/Model/Software Dependent)" if not pd.isnull(x) and x.lower().find("software") != -1 else # If the string contains "software", then return "Yes (Market/Model/Software Dependent)"
+        fingerprint = self.cleaning_fingerprint(df)
+        hashes = pd.util.hash_pandas_object(df, index=False).to_numpy() # Hash of the raw values of every row
 
-            "Yes" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "Yes" if not pd.isnull(x) and x.lower().find("fm") != -1 else # If the string contains "nfc", then return "Yes, unspecified"
-            "Yes" if not pd.isnull(x) and x.lower().find("radio") != -1 else # If the string contains "nfc", then return "Yes, unspecified"
-            "Yes" if not pd.isnull(x) and x.lower().find("stereo") != -1 else # If the string contains "nfc", then return "Yes, unspecified"
+        stored_rows = None
+        if os.path.exists(store):
+            stored = pd.read_pickle(store)
+            if stored['fingerprint'] == fingerprint: # Written with the same rules and columns
+                stored_rows = stored['rows']
+        known = np.isin(hashes, stored_rows.index) if stored_rows is not None else np.zeros(len(df), dtype=bool)
 
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "unspecified" if not pd.isnull(x) and x.lower().find("unspecified") != -1 else # If the string contains "unspecified", then return "unspecified"
-            "No" # Returns "No" for all other rowss
+        parts = []
+        if known.any():
+            parts.append(stored_rows.reindex(hashes[known]).set_axis(np.flatnonzero(known), axis=0)) # Indexed by row position
+        if not known.all():
+            new_rows = self.clean_rows(df[~known], stage_workers, n_jobs, resume)
+            parts.append(new_rows.set_axis(np.flatnonzero(~known), axis=0))
+        cleaned = pd.concat(parts).sort_index() # Back in the order of the rows
 
-        )
+        rows = cleaned.set_axis(hashes, axis=0)
+        rows = rows[~rows.index.duplicated()] # Identical rows are stored once
+        temporary_store = os.fspath(store) + '.tmp'
+        pd.to_pickle({'fingerprint': fingerprint, 'rows': rows}, temporary_store)
+        os.replace(temporary_store, store) # Replaces the store only once it is completely written
 
-        return df
+        cleaned.index = df.index
+        return cleaned
 
-    def fix_USB(self, df):
-        """""
-        This function extracts the USB connector type from the string in the USB column.
-        It also extracts the usb version from the string in the USB column.
-        It returns this information in two separate columns.
-        It drops the USB column.
+    def plan_cleaning_functions(self, columns):
 
         """""
+        This function returns the cleaning functions needed to clean the columns, in the order they run: the ones that write
+        one of the columns, the ones that write a column those read, and so on.
+        It raises a ValueError for the columns that are not in the cleaned dataset.
 
+        """""
 
-        df["USB_Connector"] = df["USB"].apply(lambda x: 
-            # checks
-            
-            
-            "Type-C" if not pd.isnull(x) and x.lower().find("type-c") != -1 else # if the string contains "type-c", then return "type-c"
-            "Type-C" if not pd.isnull(x) and x.lower().find("usb-c") != -1 else # if the string contains "usb-c", then return "type-c"
-            "miniUSB" if not pd.isnull(x) and x.lower().find("mini") != -1 else # if the string contains "mini", then return "miniUSB"
-            "microUSB" if not pd.isnull(x) and x.lower().find("micro") != -1 else # if the string contains "micro", then return "microUSB"
-            "Pop-Port" if not pd.isnull(x) and x.lower().find("pop-port") != -1 else # if the string contains "pop", then return "Pop-Port"
-            "Pop-Port" if not pd.isnull(x) and x.lower().find("pop") != -1 else # if the string contains "pop", then return "Pop-Port"
-            "USB" if not pd.isnull(x) and x.lower().find("usb") != -1 else # if the string contains "usb", then return "USB"
-            "Proprietary" if not pd.isnull(x) and x.lower().find("proprietary") != -1 else # if the string contains "proprietary", then return "Proprietary"
+        planned = list(self.df.columns) # Columns of the cleaned dataset
+        for func in self.cleaning_functions:
+            planned = func.stage.plan_layout(planned, func.stage.produces)
+        unknown = [col for col in columns if col not in planned]
+        if unknown:
+            raise ValueError("The cleaned dataset has no columns {}".format(unknown))
+
+        needed = set(columns)
+        functions = []
+        for func in reversed(self.cleaning_functions): # Finds the last function that writes every needed column
+            stage = func.stage
+            if needed & (set(stage.produces) | set(stage.renames.values())):
+                functions.append(func)
+                needed |= set(stage.consumes) | set(stage.renames)
+
+        return functions[::-1]
+
+    def clean(self, stage_workers=None, n_jobs=None, store=None, columns=None, resume=False):
+
+        """""
+        This function runs all the cleaning functions on the dataset and returns the cleaned dataset.
+        If stage_workers is more than 1, the cleaning functions that do not depend on each other run in parallel
+        in that many processes, giving the same result.
+        If n_jobs is more than 1, the rows are instead split into n_jobs partitions that are cleaned in parallel processes.
+        Sequential runs are measured in self.report (see CleaningReport), the parallel ones are not and leave it None,
+        as do the runs with a store that had all the rows.
+        If store is given, only the rows that changed since the last run with the same store are cleaned (see clean_incrementally).
+        If columns are given, only those columns are returned, and only the cleaning functions they need run (see plan_cleaning_functions).
+        If the cleaner is typed, the cleaned dataset is converted to the dtypes of TYPED_SCHEMA (see apply_typed_schema).
+        If the cleaner has a checkpoint_dir, sequential runs save the frame there every checkpoint_every cleaning functions (10 by default,
+        as every checkpoint pickles the whole frame; 1 loses the least work after a crash but is the slowest),
+        and if resume is True a run that crashed is resumed after the last cleaning function saved, instead of starting over.
+        If the cleaner quarantines, the values an extractor fails on are set to NaN instead of stopping the run (see quarantine_table).
+
+        """""
+
+        self.quarantined = []
+        self.report = None # Only set if the cleaning functions run sequentially
+        all_functions = self.cleaning_functions
+        if columns is not None:
+            self.cleaning_functions = self.plan_cleaning_functions(columns)
+        try:
+            if store is not None:
+                df = self.clean_incrementally(store, stage_workers, n_jobs, resume)
+            else:
+                df = self.clean_rows(self.df, stage_workers, n_jobs, resume)
+        finally:
+            self.cleaning_functions = all_functions
 
-            
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
+        if columns is not None:
+            df = df[list(columns)]
+        return apply_typed_schema(df) if self.typed else df
 
-            "unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "unspecified"
-            "unspecified" if not pd.isnull(x) and x.lower().find("unspecified") != -1 else # If the string contains "unspecified", then return "unspecified"
-            "unspecified" # Returns "unspecified" for all other rows
+    def write_dataset(self, path, **kwargs):
 
-        )
+        """""
+        This function cleans the dataset and writes it to path as a Parquet dataset, so that it can be read without cleaning it again.
+        The dataset is converted to the dtypes of TYPED_SCHEMA, and partitioned into one directory per Brand and Release_Year,
+        the year of Released (Release_Year=__HIVE_DEFAULT_PARTITION__ for the phones not released yet).
+        The columns are dictionary encoded. A dataset already in path is replaced as a whole, so no partition of it is left:
+        the new dataset is written next to it and only swapped in once it is completely written.
+        kwargs are passed to clean(), e.g. n_jobs or store. It returns the number of rows written.
 
-        df["USB_Version"] = df["USB"].apply(lambda x: 
-            # checks
-            
-            
-            "1.1" if not pd.isnull(x) and x.lower().find("1.1") != -1 else # if the string contains "1.1", then return "1.1"
-            "2.0" if not pd.isnull(x) and x.lower().find("2.0") != -1 else # if the string contains "2.0", then return "2.0"
-            "3.0" if not pd.isnull(x) and x.lower().find("3.0") != -1 else # if the string contains "3.0", then return "3.0"
-            "3.1" if not pd.isnull(x) and x.lower().find("3.1") != -1 else # if the string contains "3.1", then return "3.1"
-            "3.2" if not pd.isnull(x) and x.lower().find("3.2") != -1 else # if the string contains "3.2", then return "3.2
-            "4.0" if not pd.isnull(x) and x.lower().find("4") != -1 else # if the string contains "4.0", then return "4.0"
-            "4.1" if not pd.isnull(x) and x.lower().find("4.1") != -1 else # if the string contains "4.1", then return "4.1"
-            "4.2" if not pd.isnull(x) and x.lower().find("4.2") != -1 else # if the string contains "4.2", then return "4.2"
+        """""
 
-            
-        
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
+        if pyarrow is None:
+            raise ImportError("write_dataset() requires pyarrow")
 
-            "unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "unspecified" if not pd.isnull(x) and x.lower().find("unspecified") != -1 else # If the string contains "unspecified", then return "unspecified"
-            
-            "unspecified" #  Returns "unspecified" for all other rowss
+        df = self.clean(**kwargs)
+        if not self.typed:
+            df = apply_typed_schema(df)
+        df['Release_Year'] = df['Released'].dt.year.where(df['Released'].notna()).astype('Int32') # The year of NaT is -1
 
-        )
+        path = os.fspath(path)
+        temporary_path, previous_path = path + '.tmp', path + '.old'
+        for leftover in (temporary_path, previous_path): # Left by a write that crashed
+            shutil.rmtree(leftover, ignore_errors=True)
 
-        columns_to_move = ['USB_Connector', 'USB_Version'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=47): # Iterates through the columns to move and moves them to the 47th and 48th positions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        pyarrow.dataset.write_dataset(table, temporary_path, format='parquet', partitioning=dataset_partitioning(),
+                                      file_options=pyarrow.dataset.ParquetFileFormat().make_write_options(use_dictionary=True),
+                                      max_partitions=len(df) + 1)
+        if os.path.exists(path):
+            os.replace(path, previous_path) # Directories cannot replace each other, so the previous dataset is moved away first
+        os.replace(temporary_path, path)
+        shutil.rmtree(previous_path, ignore_errors=True)
+        return len(df)
 
-        df = df.drop(columns=["USB"]) # Drops the original USB column
+    @staticmethod
+    def read_dataset(path, columns=None, filters=None):
 
-        return df
+        """""
+        This function reads a Parquet dataset written by write_dataset().
+        columns are the only columns read, and filters are the rows read, as a list of (column, operator, value) tuples
+        (see pyarrow.parquet.read_table). Filters on Brand and Release_Year skip whole directories, and the other ones
+        skip the row groups whose statistics rule them out, e.g. the Samsung phones released from 2020 to 2022:
 
+            read_dataset(path, columns=['Model', 'Battery_Capacity', 'Price'],
+                         filters=[('Brand', '=', 'Samsung'), ('Release_Year', '>=', 2020), ('Release_Year', '<=', 2022)])
 
-    def fix_Sensors(self, df):
         """""
-        This function fixes the Sensors column. It establishes whether or not a phone has a biometric sensor and what type of sensor it is.
-        It also extracts the information about the sensor technology and its placement.
-        It returns this information in 4 new columns and drops the original Sensors column.
 
-        """""
+        if pyarrow is None:
+            raise ImportError("read_dataset() requires pyarrow")
 
+        df = pyarrow.parquet.read_table(path, columns=columns, filters=filters, partitioning=dataset_partitioning()).to_pandas()
+        if 'Brand' in df.columns:
+            df['Brand'] = df['Brand'].astype('category') # Partition columns are read as strings
+        if columns is None:
+            df = df[['Brand'] + [col for col in df.columns if col not in PARTITION_COLUMNS] + ['Release_Year']] # Brand back in front
+        return df
 
-        df["Biometric_Sensor"] = df["Sensors"].apply(lambda x: 
-            # checks
-            
-            
-            "Yes" if not pd.isnull(x) and x.lower().find("fingerprint") != -1 else # if the string contains "fingerprint", then return "Yes"
-            "Yes" if not pd.isnull(x) and x.lower().find("iris") != -1 else # if the string contains "iris", then return "Yes"
-            "Yes" if not pd.isnull(x) and x.lower().find("face") != -1 else # if the string contains "face", then return "Yes"
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
+    @classmethod
+    def from_csv(cls, path, **kwargs):
+
+        """""
+        This function reads a scraped CSV file into a new cleaner, kwargs being passed to the cleaner.
+        Only the columns that are used are read: the ones the cleaning functions drop without reading them (the links,
+        the web scraper columns, GPU, ...) are skipped. With pyarrow, the file is parsed by the pyarrow CSV reader and the columns
+        read by the cleaning functions are stored as string[pyarrow], a fraction of the memory of object columns.
+        They are only converted to object columns when a cleaning function reads them, and give the same result.
+        Without pyarrow, they are read as object strings.
+        It raises a ValueError listing the columns read by the cleaning functions that are missing from the file.
+
+        """""
+
+        cleaner = cls(None, **kwargs)
+        required, skipped = cleaner.input_columns()
+        header = list(pd.read_csv(path, nrows=0).columns)
+        missing = [col for col in required if col not in header]
+        if missing:
+            raise ValueError("{} is missing the columns {}".format(path, missing))
+        usecols = [col for col in header if col not in skipped]
+
+        if pyarrow is None:
+            cleaner.df = pd.read_csv(path, usecols=usecols, dtype={col: str for col in required})
+        else:
+            table = pyarrow.csv.read_csv(path, parse_options=pyarrow.csv.ParseOptions(newlines_in_values=True), # Brands values span two lines
+                                         convert_options=pyarrow.csv.ConvertOptions(include_columns=usecols, strings_can_be_null=True,
+                                                                                    column_types={col: pyarrow.string() for col in required}))
+            cleaner.df = table.to_pandas(types_mapper={pyarrow.string(): pd.StringDtype('pyarrow')}.get)
+
+        return cleaner
+
+    @classmethod
+    def clean_csv(cls, path, output, chunksize=10000, quarantine_output=None, **kwargs):
+
+        """""
+        This function cleans a scraped CSV file that does not fit in memory, chunksize rows at a time.
+        Every chunk goes through all the cleaning functions and is written to output before the next one is read,
+        so memory is bounded by the chunk size (and the size of the cache, which is shared by all the chunks).
+        output is a path or buffer for to_csv, or a function that is called with every cleaned chunk.
+        kwargs are passed to the cleaner, e.g. cache_size or vectorized. Every cleaning function of every chunk is measured,
+        and stage_callback, if given, is called with its record, which has the number of the chunk.
+        The file is the same as clean().to_csv(output, index=False) on the whole dataset, as long as every chunk is big enough
+        to infer the same dtypes (a chunk where ROM never is "unspecified" gets a float column, for example).
+        With typed=True, every chunk is converted to the dtypes of TYPED_SCHEMA, with the categories found in that chunk.
+        With quarantine=True, the quarantined values of all the chunks are written to quarantine_output, if given, as a CSV file.
+        It returns the number of rows written.
+
+        """""
+
+        cleaner = cls(None, **kwargs) # A single cleaner so that the cache is reused by all the chunks
+        cleaner.report = CleaningReport(cleaner.trace_memory, cleaner.stage_callback) # Measures the cleaning functions of all the chunks
+        rows = 0
+        for i, chunk in enumerate(pd.read_csv(path, chunksize=chunksize, dtype=str)): # Reads everything as strings, so that a chunk of missing values is not read as floats
+            cleaner.df = chunk
+            cleaned_chunk = cleaner.run_cleaning_functions(chunk, cleaner.report, chunk=i)
+            if cleaner.typed:
+                cleaned_chunk = apply_typed_schema(cleaned_chunk)
+            if callable(output):
+                output(cleaned_chunk)
+            else:
+                cleaned_chunk.to_csv(output, mode='w' if rows == 0 else 'a', header=rows == 0, index=False) # Only the first chunk writes the header
+            rows += len(cleaned_chunk)
 
-            "unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "unspecified"
-            
-            "No" # Returns "No" for all other rows
+        cleaner.df = None
+        if quarantine_output is not None:
+            cleaner.quarantine_table().to_csv(quarantine_output, index=False)
+        return rows
+        
 
-        )
 
-        df["Biometric_Sensor_Type"] = df["Sensors"].apply(lambda x: 
-            # checks
-            
-            
-            "Fingerprint" if not pd.isnull(x) and x.lower().find("fingerprint") != -1 else # if the string contains "fingerprint", then return "Fingerprint"
-            "Iris" if not pd.isnull(x) and x.lower().find("iris") != -1 else # if the string contains "iris", then return "Iris"
-            "Face" if not pd.isnull(x) and x.lower().find("face") != -1 else # if the string contains "face", then return "Face"
+def column_version(series):
 
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            
-            "No" #  Returns "unspecified" for all other rowss
-
-        )
-
-        df["Biometric_Sensor_Technology"] = df["Sensors"].apply(lambda x:
-            # checks
-            "Infrared" if not pd.isnull(x) and x.lower().find("infrared") != -1 else # if the string contains "infrared", then return "Infrared"
-            "Optical" if not pd.isnull(x) and x.lower().find("optical") != -1 else # if the string contains "optical", then return "Optical"
-            "Ultrasonic" if not pd.isnull(x) and x.lower().find("ultrasonic") != -1 else # if the string contains "ultrasonic", then return "Ultrasonic"
-            "RFID" if not pd.isnull(x) and x.lower().find("rfid") != -1 else # if the string contains "rfid", then return "RFID"
-            "Capacitive" if not pd.isnull(x) and x.lower().find("capacitive") != -1 else # if the string contains "capacitive", then return "Capacitive"
-
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "No"
-        )
-
-        df["Biometric_Sensor_Location"] = df["Sensors"].apply(lambda x:
-            # checks
-            "Top-mounted" if not pd.isnull(x) and x.lower().find("top-mounted") != -1 else # if the string contains "top", then return "Top-mounted"
-            "Side-mounted" if not pd.isnull(x) and x.lower().find("side-mounted") != -1 else # if the string contains "side", then return "Side-mounted"
-            "Rear-mounted" if not pd.isnull(x) and x.lower().find("rear-mounted") != -1 else # if the string contains "rear", then return "Rear-mounted"
-            "Front-mounted" if not pd.isnull(x) and x.lower().find("front-mounted") != -1 else # if the string contains "front", then return "Front-mounted"
-            "Under-display" if not pd.isnull(x) and x.lower().find("under display") != -1 else # if the string contains "under-display", then return "Under-display"
-            "Front-facing" if not pd.isnull(x) and x.lower().find("face") != -1 else # if the string contains "front-facing", then return "Front-facing"
-            "No" if not pd.isnull(x) and x.lower().find("no") != -1 else # If the string contains "no", then return "no"
-            "unspecified" if not pd.isnull(x) and x.lower().find("yes") != -1 else # If the string contains "yes", then return "yes"
-            "No"
-        )
+    """""
+    This function returns a checksum of the values of a column, which changes whenever the column is modified, even in place.
+    Columns of objects are checksummed through the addresses of their values, since a value set in place is a new object.
+    It reads the buffers of the column without converting them, so it costs a fraction of recomputing a view of the column.
 
-        
-        columns_to_move = ['Biometric_Sensor', 'Biometric_Sensor_Type', 'Biometric_Sensor_Technology', 'Biometric_Sensor_Location'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=49): # Iterates through the columns to move and moves them to the 49th to the 52nd positions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    """""
 
-        df = df.drop(columns=["Sensors"]) # Drops the original Sensors column
-        
-        return df
+    if isinstance(series.dtype, pd.PeriodDtype):
+        data = series.array.asi8 # Ordinals of the periods, NaT included
+    elif isinstance(series.dtype, np.dtype):
+        data = series.to_numpy()
+    else:
+        data = pd.util.hash_pandas_object(series, index=False).to_numpy() # Categories, nullable and pyarrow columns
+    return zlib.crc32(np.ascontiguousarray(data))
 
 
-    def fix_UWB(self, df):
-        """""
-        This function fixes the UWB column. It checks if the string contains "uwb" and returns "Yes" if it does, and "No" if it doesn't.
-        It replaces the original UWB column with the new one that shows "Yes" or "No" for each row.
+@pd.api.extensions.register_dataframe_accessor("gsm")
+class GSMArenaAccessor:
 
-        """""
+    """""
+    This class is the df.gsm accessor of cleaned datasets, registered when cleaners is imported. It gives vectorized views
+    of the columns that the analysis keeps deriving: the release year, the measures as numbers and the masks of the
+    released and measured phones, e.g. the average thickness per year of the measured phones:
 
+        df.gsm.measure('Thickness').groupby(df.gsm.release_year).mean()
 
-        df["UWB"] = df["UWB"].apply(lambda x: 
-            # checks
-            
-            "Yes" if not pd.isnull(x) and x.lower().find("uwb") != -1 else # if the string contains "uwb", then return "Yes"
-            "No" # Returns "No" for all other rows
+    Every view is computed once and cached on the accessor, which pandas keeps on the frame. A cached view is only reused
+    while the columns it was computed from and the index are unchanged (see column_version), so a frame modified
+    in place or with new columns gets new views. The views are shared by every caller and must not be modified.
+    It works on the cleaned datasets of clean(), with or without typed=True, and on the ones read by read_dataset().
 
-        )
-        return df
+    """""
 
+    def __init__(self, df):
+        self.df = df
+        self.views = {} # Cached views by name, with the versions of the columns they were computed from
 
-    def fix_Battery(self, df):
+    def cached(self, name, columns, func):
 
         """""
-        This function fixes the Battery column. It checks if the string contains "non-removable" and returns "No" if it does, and "Yes" if it doesn't.
-        It also extracts the battery size from the string and returns it as an integer.
-        It also extracts the battery type from the string and returns it as a string.
-        It drops the original Battery column and replaces it with the new columns.
+        This function returns the view name computed by func from columns, computing it only if the columns changed since it was cached.
 
         """""
-        
-
-        def extract_battery_size(battery_string):
-            battery_string = str(battery_string)
-            match = re.search(r'\b\d+\b', battery_string)
-            if match:
-                return int(match.group(0))
-            else:
-                return 'unspecified'
 
+        version = (id(self.df.index), len(self.df), [column_version(self.df[col]) for col in columns])
+        if name not in self.views or self.views[name][0] != version:
+            self.views[name] = (version, func())
+        return self.views[name][1]
 
-        df["Removable"] = df["Battery"].apply(lambda x:  # Creates a new column called "Removable"
-            # checks
-            "No" if not pd.isnull(x) and x.lower().find("non-removable") != -1 else # if the string contains "non-removable", then return "No"
-            "Yes" if not pd.isnull(x) and x.lower().find("removable") != -1 else # if the string contains "uwb", then return "Yes"
-            "unspecified" # Returns "No" for all other rows
+    def invalidate(self):
+        self.views.clear()
 
-        )
+    @property
+    def release_year(self):
 
-        df["Battery_Type"] = df["Battery"].apply(lambda x:
-            # checks
-            "Li-Ion" if not pd.isnull(x) and x.lower().find("li-ion") != -1 else # if the string contains "li-ion", then return "Li-Ion"
-            "Li-Po" if not pd.isnull(x) and x.lower().find("li-po") != -1 else # if the string contains "li-po", then return "Li-Po"
-            "Li-Po" if not pd.isnull(x) and x.lower().find("li-polymer") != -1 else # if the string contains "li-polymer", then return "Li-Polymer"
-            "unspecified" # Returns "No" for all other rows
+        """""
+        The year of Released as an Int32 Series, missing for the phones not released yet.
+        Frames read by read_dataset() without Released use their Release_Year column.
 
-        )
+        """""
 
-        df["Battery_Capacity"] = df["Battery"].apply(extract_battery_size)
+        if 'Released' not in self.df.columns and 'Release_Year' in self.df.columns:
+            return self.df['Release_Year']
 
-        columns_to_move = ['Removable', 'Battery_Type', 'Battery_Capacity'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=55): # Iterates through the columns to move and moves them to the 55th to the 57th positions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        def release_year():
+            released = self.df['Released']
+            if released.dtype == 'period[M]':
+                years = released.array.asi8 // 12 + 1970 # Months are counted from January 1970
+            else:
+                years = released.dt.year.to_numpy()
+            years = pd.arrays.IntegerArray(years.astype('int32'), released.isna().to_numpy()) # The year of NaT is missing
+            return pd.Series(years, index=released.index, name='Release_Year')
 
-        df = df.drop(columns=["Battery"]) # Drops the original Battery column
-        
-        return df
+        return self.cached('release_year', ['Released'], release_year)
 
-    def fix_Charging(self, df):
+    @property
+    def released(self):
 
         """""
-        This function fixes the Charging column. It checks if the string contains "wireless" and returns "Yes" if it does, and "No" if it doesn't.
-        It also extracts the charging speed from the string and returns it as an integer.
-        It also extracts the reverse charging speed from the string and returns it as an integer.
-        It drops the original Charging column and replaces it with the new columns.
+        A boolean mask of the phones released (with a known Released month).
 
         """""
-        def extract_charging_speed(charging_string):
-            """""
 
+        return self.cached('released', ['Released'], lambda: self.df['Released'].notna())
 
-            """""
+    def measure(self, col):
 
-            if pd.isnull(charging_string):
-                return 'unspecified'
-            match = re.findall(r'\b\d+W', charging_string)
-            if match:
-                return max(int(x.strip("W")) for x in match)
-            else:
-                return 'unspecified'
+        """""
+        This function returns the measure col (one of MEASURE_COLUMNS) as a float Series, the labels of the missing values
+        ("Not Measured", "Not Specified", ...) and values that are not numbers being NaN.
 
-        df["Wireless_Charging"] = df["Charging"].apply(lambda x:  # Creates a new column called "Removable"
-            # checks
-            "Yes" if not pd.isnull(x) and x.lower().find("wireless") != -1 else # if the string contains "non-removable", then return "No"
-            "unspecified" # Returns "No" for all other rows
+        """""
 
-        )
+        if col not in MEASURE_COLUMNS:
+            raise ValueError("{} is not a measure, the measures are {}".format(col, MEASURE_COLUMNS))
 
-        df["Reverse_Charging"] = df["Charging"].apply(lambda x:
-            # checks
-            "Yes" if not pd.isnull(x) and x.lower().find("reverse") != -1 else # if the string contains "li-ion", then return "Li-Ion"
-            "unspecified" # Returns "No" for all other rows
+        def measure():
+            series = self.df[col]
+            labels = TYPED_SCHEMA[col][1]
+            if series.dtype != object:
+                labels = [label for label in labels if not isinstance(label, str)] # Only numbers can be in a numeric column
+            values = series.mask(series.isin(labels)) if labels else series # Missing values instead of the labels
+            return pd.to_numeric(values, errors='coerce').astype('float64') # Nullable columns get NaN for their missing values
 
-        )
+        return self.cached(('measure', col), [col], measure)
 
-        df["Charging_Speed"] = df["Charging"].apply(extract_charging_speed)
+    def measured(self, col):
 
-        columns_to_move = ['Charging_Speed', 'Wireless_Charging', 'Reverse_Charging'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=58): # Iterates through the columns to move and moves them to the 58th to the 60th positions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        """""
+        This function returns a boolean mask of the phones with a value for the measure col.
 
-        df = df.drop(columns=["Charging"]) # Drops the original Battery column
-        
-        return df
+        """""
 
-    def fix_Colors(self, df):
+        return self.cached(('measured', col), [col], lambda: self.measure(col).notna())
+
+    def measures(self, columns=None):
 
         """""
-        This function fixes the Colors column. It counts the number of color options in the string and returns it as an integer.
+        This function returns a frame of the measures columns as floats (see measure), all the measures of the frame by default.
 
         """""
 
+        if columns is None:
+            columns = [col for col in MEASURE_COLUMNS if col in self.df.columns]
+        return pd.DataFrame({col: self.measure(col) for col in columns}, index=self.df.index)
 
-        def count_color_options(colors): # Counts the number of color options in the string and returns it as an integer.
-            if pd.isna(colors): # If the string is empty,
-                return 0 # Return 0
-            return len(colors.split(",")) # Otherwise, return the number of color options
+    def spec_index(self, specs=None):
 
+        """""
+        This function returns a SpecIndex of the frame for the measures specs (all the measures of the frame by default),
+        built again only once the frame changed.
 
-        df['Colors'] = df['Colors'].apply(count_color_options) # Applies the count_color_options function to the Colors column
+        """""
 
-        return df
+        if specs is None:
+            specs = [col for col in MEASURE_COLUMNS if col in self.df.columns]
+        released = 'Released' if 'Released' in self.df.columns else 'Release_Year' # Column release_year is read from
+        columns = list(specs) + [col if col != 'Release_Year' else released for col in SPEC_INDEX_DIMENSIONS]
+        return self.cached(('spec_index', tuple(specs)), columns, lambda: SpecIndex(self.df, specs))
 
 
-    def fix_Battery_Life(self, df):
+class AggregateCube:
 
-        """""
-        This function fixes the Battery Life column. It extracts the endurance from the string and returns it as an integer.
-        It drops the original Battery Life column and replaces it with the new column.
+    """""
+    This class is a materialized aggregate of cleaned datasets per cell of its dimensions, Brand x Release_Year by default
+    ('Mobile_OS' and 'Chipset_Maker' can be added). Every cell holds its number of phones and, for every measure,
+    the count, sum, min and max of its values and a quantile sketch. The sketch counts the values in logarithmic buckets,
+    so a quantile is found within relative_accuracy of its value (1% by default), whatever the number of phones.
+    All of them are merged by adding (or taking the min or max of) the cells, so the cube is updated with new rows
+    without going back to the rows it already holds, and the queries roll the cells up instead of grouping the rows:
 
-        """"" 
+        cube = AggregateCube().update(df)
+        cube.count(by=['Brand', 'Release_Year']).unstack(fill_value=0) # Phones of every brand per year
+        cube.mean('Thickness', by=['Release_Year'], where={'Brand': ['Samsung', 'Apple']})
+        cube.quantile('Weight', 0.9, by=['Release_Year'])
 
-        def extract_endurance(charging_string):
-            """""
-            This function extracts the endurance from the string and returns it as an integer.
-            It uses pattern matching to find the endurance in the string.
+    Cleaned chunks are added as they are cleaned, e.g. GSMArena_Dataset_Cleaner.clean_csv(path, cube.update).
+    The measures are read as numbers by the df.gsm accessor and Release_Year is df.gsm.release_year.
+    The phones not released yet are in the cells with a missing Release_Year.
 
-            """""
+    """""
 
-            if pd.isnull(charging_string): # If the string is empty,
-                return 'untested'
-            match = re.findall(r'\b\d+h', charging_string) # Finds the endurance in the string
-            if match: # If the string contains the endurance,
-                return max(int(x.strip("h")) for x in match) # Return the endurance
-            else:
-                return 'untested' # Otherwise, return "untested"
+    def __init__(self, dimensions=CUBE_DIMENSIONS, measures=('Thickness', 'Weight', 'Display_Brightness'), relative_accuracy=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1, not {}".format(relative_accuracy))
+        self.dimensions = list(dimensions)
+        self.measures = list(measures)
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy) # Ratio of the bounds of a bucket of the sketches
+        self.rows = None # Number of phones per cell
+        self.stats = None # Count, sum, min and max of every measure per cell, with (measure, statistic) columns
+        self.sketches = None # Number of values per cell, measure and bucket of the sketches
 
-        df["Battery_Life"] = df["Battery Life"].apply(extract_endurance) # Creates a new column called "Battery_Life" and applies the extract_endurance function to it
+    def bucket_keys(self, values):
 
-        columns_to_move = ['Battery_Life'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=63): # Iterates through the columns to move and moves them to the 63rd position
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        """""
+        This function returns the sketch bucket of every value: the bucket k holds the values from gamma^(k-1) to gamma^k.
 
-        df = df.drop(columns=["Battery Life"]) # Drops the original Battery column
+        """""
 
-        return df
+        keys = np.full(len(values), SKETCH_ZERO_KEY, dtype=np.int32)
+        positive = values > 0
+        keys[positive] = np.ceil(np.log(values[positive]) / np.log(self.gamma))
+        return keys
 
+    def bucket_values(self, keys):
 
-    def fix_Internal_Storage(self, df):
+        """""
+        This function returns the value estimated for every sketch bucket, the one within relative_accuracy of all its values.
 
         """""
-        This function fixes the Internal Storage column. It extracts the storage capacity (ROM) and the RAM from the string.
-        It returns these as integers in GB in their own respective columns.
-        This function's logic is based on the logic that the vast majority of phones have a higher storage capacity than RAM.
-        It therefore extracts the higher of the two values and returns it as the storage capacity, and the lower of the two values as the RAM.
-        NB: there are some fringe cases where this logic does not work (more RAM than ROM) giving wrong values, but these are very rare
-        Work can be done to improve this function to fix these cases.
+
+        keys = np.asarray(keys)
+        return np.where(keys == SKETCH_ZERO_KEY, 0.0, 2 * self.gamma ** keys.astype(float) / (self.gamma + 1))
+
+    def aggregate(self, df):
 
         """""
+        This function returns the number of phones, the statistics and the sketches of every cell of the rows of df.
 
-        def extract_storage(internal_storage_string):
+        """""
 
-            """""
+        keys = {}
+        for dim in self.dimensions:
+            values = df.gsm.release_year if dim == 'Release_Year' else df[dim]
+            keys[dim] = values.astype(object) if isinstance(values.dtype, pd.CategoricalDtype) else values # Only the categories found get a cell
+        keys = pd.DataFrame(keys, index=df.index)
+        measures = df.gsm.measures(self.measures)
+        groups = [keys[dim] for dim in self.dimensions]
 
-            This function extracts the storage capacity (ROM) from the string.
-            It takes the highest value after pattern matching
+        rows = keys.groupby(groups, dropna=False).size()
+        stats = measures.groupby(groups, dropna=False).agg(list(CUBE_STATS))
 
-            """""
+        parts = []
+        for measure in self.measures: # Bucket of every value of every measure
+            values = measures[measure]
+            measured = values.notna().to_numpy()
+            parts.append(keys[measured].assign(Measure=measure, Key=self.bucket_keys(values.to_numpy()[measured])))
+        sketches = pd.concat(parts).groupby(self.dimensions + ['Measure', 'Key'], dropna=False).size()
 
-            if pd.isnull(internal_storage_string): # If the string is empty,
-                return 'unspecified'
-            
-            internal_storage_string = re.sub(r'\([^)]*\)', '', internal_storage_string) # remove anything inside brackets
-            match = re.findall(r'\b\d+GB', internal_storage_string) + re.findall(r'\b\d+MB', internal_storage_string) # Finds the capacity in the string
-            if match: # If the string contains the capacity,
-                match = [int(x.strip("GB")) if "GB" in x else int(x.strip("MB"))/1000 for x in match] # Convert the capacity to GB
-                if len(match) > 1:
-                    return max(match) # Return the max capacity
-                else:
-                    return match[0] # Otherwise, return the capacity
-            else:
-                return 'unspecified' # Otherwise, return "unspecified"
+        return rows, stats, sketches
 
-        def extract_ram(internal_storage_string):
+    def merge_tables(self, rows, stats, sketches):
 
-            """""
+        """""
+        This function merges the number of phones, the statistics and the sketches of other rows into the cube.
 
-            This function extracts the storage capacity (ROM) from the string.
-            It takes the highest value after pattern matching
+        """""
 
-            """""
-        
-            if pd.isnull(internal_storage_string): # If the string is empty,
-                return 'unspecified'
-            
-            match = re.findall(r'\b\d+GB', internal_storage_string) + re.findall(r'\b\d+MB', internal_storage_string) # Finds the capacity in the string
-            if match: # If the string contains the capacity,
-                match = [int(x.strip("GB")) if "GB" in x else int(x.strip("MB"))/1000 for x in match] # Convert the capacity to GB
-                if len(match) > 1:
-                    return min(match) # Return the min capacity
-                else:
-                    return 'unspecified'
-            else:
-                return 'unspecified' # Otherwise, return "unspecified"
+        if self.rows is not None:
+            levels = list(range(len(self.dimensions)))
+            rows = pd.concat([self.rows, rows]).groupby(level=levels, dropna=False).sum()
+            stats = pd.concat([self.stats, stats]).groupby(level=levels, dropna=False).agg({col: CUBE_STATS[col[1]] for col in stats.columns})
+            sketches = pd.concat([self.sketches, sketches]).groupby(level=levels + [len(levels), len(levels) + 1], dropna=False).sum()
+        self.rows, self.stats, self.sketches = rows, stats, sketches
 
+    def update(self, df):
 
-        df["ROM"] = df["Internal Storage"].apply(extract_storage) # Creates a new column called "Internal_Storage" and applies the extract_storage function to it
-        df["RAM"] = df["Internal Storage"].apply(extract_ram) # Creates a new column called "RAM" and applies the extract_ram function to it
+        """""
+        This function adds the rows of the cleaned dataset df to the cube, and returns the cube.
 
-        columns_to_move = ['ROM', 'RAM'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=33): # Iterates through the columns to move and moves them to the 33rd and 34th positions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        """""
 
-        df = df.drop(columns=["Internal Storage"]) # Drops the original Internal Storage column
+        self.merge_tables(*self.aggregate(df))
+        return self
 
-        return df
+    def merge(self, other):
 
+        """""
+        This function adds the rows of the cube other, built with the same dimensions, measures and accuracy, to the cube,
+        and returns the cube. Cubes of the parts of a dataset can be built in parallel and merged.
 
-    def fix_Storage_Type(self, df):
         """""
-        This function fixes the Storage Type column. It extracts the storage type (UFS or eMMC) from the string.
-        It also returns the Version of the storage type as a float.
-        It drops the original Storage Type column.
+
+        if (other.dimensions, other.measures, other.relative_accuracy) != (self.dimensions, self.measures, self.relative_accuracy):
+            raise ValueError("Only cubes with the same dimensions, measures and accuracy can be merged")
+        if other.rows is not None:
+            self.merge_tables(other.rows, other.stats, other.sketches)
+        return self
+
+    def select(self, table, where):
 
         """""
+        This function returns the cells of table whose dimensions have the values of where, a dict of a value or a list of values per dimension.
 
-        def extract_UFS_eMMC(x): # Extracts the storage type from the string
-            if pd.notnull(x): # If the string is not empty,
-                match = re.findall(r'\b(UFS|eMMC)\s(\d+\.\d+)', str(x)) # Finds the storage type and version in the string
-                if match: # If the string contains the storage type and version,
-                    return match[0][1] # Return the version
-            return 'unspecified' # Otherwise, return "unspecified"
+        """""
 
+        if not where:
+            return table
+        selected = np.ones(len(table), dtype=bool)
+        for dim, values in where.items():
+            values = values if isinstance(values, (list, tuple, set, pd.Index, np.ndarray)) else [values]
+            selected &= np.asarray(table.index.get_level_values(dim).isin(values), dtype=bool) # Missing values are never selected
+        return table[selected]
 
-        df["Storage_Type_Version"] = df['Storage Type'].apply(extract_UFS_eMMC) # Creates a new column called "Storage_Type_Version" and applies the extract_UFS_eMMC function to it
+    def roll_up(self, table, by, where, func):
+        if self.rows is None:
+            raise ValueError("The cube is empty, add rows to it with update()")
+        table = self.select(table, where)
+        by = self.dimensions if by is None else list(by)
+        if not by:
+            return table.agg(func) # A single value for all the cells
+        return table.groupby(level=by, dropna=False).agg(func)
 
-        df["Storage_Type"] = df["Storage Type"].apply(lambda x: # Creates a new column called "Storage_Type" and applies the following lambda function to it
-            # checks
-            "eMMC" if not pd.isnull(x) and x.lower().find("emmc") != -1 else # If the string contains "eMMC", return "eMMC"
-            "UFS" if not pd.isnull(x) and x.lower().find("ufs") != -1 else # If the string contains "UFS", return "UFS"
-            "unspecified" # Otherwise, return "unspecified"
-        )
+    def count(self, by=None, where=None):
 
-        columns_to_move = ['Storage_Type_Version', 'Storage_Type'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=35): # Iterates through the columns to move and moves them to the 35th and 36th positions
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        """""
+        This function returns the number of phones per value of the dimensions by (all the dimensions of the cube by default,
+        none of them for a single number), of the cells selected by where (see select).
 
-        df = df.drop(columns=["Storage Type"]) # Drops the original Storage Type column
+        """""
 
-        return df
+        return self.roll_up(self.rows, by, where, 'sum')
 
+    def stat(self, measure, stat, by=None, where=None):
 
-        
-    def fix_Loudspeaker(self, df):
+        """""
+        This function returns the statistic stat ('count', 'sum', 'min', 'max' or 'mean') of the values of measure
+        per value of the dimensions by, of the cells selected by where (see count).
 
         """""
 
+        if measure not in self.measures:
+            raise ValueError("{} is not a measure of the cube, its measures are {}".format(measure, self.measures))
+        if stat == 'mean':
+            count = self.stat(measure, 'count', by, where) # A Series, or a single number without by
+            return self.stat(measure, 'sum', by, where) / np.where(count > 0, count, np.nan) # No mean without values
+        if stat not in CUBE_STATS:
+            raise ValueError("stat must be one of {} or 'mean', not {}".format(list(CUBE_STATS), stat))
+        return self.roll_up(self.stats[(measure, stat)], by, where, CUBE_STATS[stat])
 
-        This function fixes the Loudspeaker column. It extracts the 3 values of dB for Voice, Noise and Ring.
-        It returns the values as floats, and denotes "untested" to the values that are not available.
-        It drops the original Loudspeaker column.
+    def mean(self, measure, by=None, where=None):
+        return self.stat(measure, 'mean', by, where)
+
+    def quantile(self, measure, q, by=None, where=None):
 
         """""
+        This function returns the q quantile (0.5 for the median) of the values of measure per value of the dimensions by,
+        of the cells selected by where (see count), within relative_accuracy of the exact quantile.
+        Values of the dimensions without values of measure get no quantile.
 
+        """""
 
-        extract_num = lambda x: int(re.findall(r'\d+', x)[0]) if re.search(r'\d+', x) else None # Extracts the number from the string
+        if measure not in self.measures:
+            raise ValueError("{} is not a measure of the cube, its measures are {}".format(measure, self.measures))
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1, not {}".format(q))
+        by = self.dimensions if by is None else list(by)
+        sketches = self.sketches[self.sketches.index.get_level_values('Measure') == measure].droplevel('Measure')
+        buckets = self.roll_up(sketches, by + ['Key'], where, 'sum') # Sorted by bucket
 
-        df['Loudspeaker'] = df['Loudspeaker'].apply(lambda x: np.nan if 'LUFS' in str(x) else x) # Replaces the values with "LUFS" with NaN
+        groups = buckets.groupby(level=by, dropna=False) if by else buckets.groupby(np.zeros(len(buckets)))
+        reached = (groups.cumsum() > q * (groups.transform('sum') - 1)).to_numpy() # Buckets past the rank of the quantile
+        first = buckets[reached].groupby(level=by, dropna=False).head(1) if by else buckets[reached].head(1) # Bucket of the quantile
+        keys = first.index.get_level_values('Key')
+        if not by:
+            return self.bucket_values(keys)[0] if len(keys) else np.nan
+        return pd.Series(self.bucket_values(keys), index=first.index.droplevel('Key'), name=measure)
 
-        df['Loudspeaker_Voice'] = df['Loudspeaker'].apply(lambda x: x.split('/')[0] if pd.notnull(x) else x) # Splits the string into 3 parts and extracts the first part
-        df['Loudspeaker_Noise'] = df['Loudspeaker'].apply(lambda x: x.split('/')[1] if pd.notnull(x) else x) # Splits the string into 3 parts and extracts the second part
-        df['Loudspeaker_Ring'] = df['Loudspeaker'].apply(lambda x: x.split('/')[-1] if pd.notnull(x) else x) # Splits the string into 3 parts and extracts the third part
 
-        df['Loudspeaker_Voice'] = df['Loudspeaker_Voice'].astype(str).apply(extract_num) # extracts the values and converts them to float
-        df['Loudspeaker_Noise'] = df['Loudspeaker_Noise'].astype(str).apply(extract_num) # extracts the values and converts them to float
-        df['Loudspeaker_Ring'] = df['Loudspeaker_Ring'].astype(str).apply(extract_num) # extracts the values and converts them to float
+class SpecIndex:
 
-        df[['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring']] = df[['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring']].fillna('untested') # Replaces the NaN values with "untested"
+    """""
+    This class indexes the measures specs of a cleaned dataset (all the measures of df by default) for top-k and range queries,
+    e.g. the thinnest phones, the heaviest Samsung phones of 2020 or the phones with a brightness from 1000 to 1500 nits:
 
-        columns_to_move = ['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=64): # Iterates through the columns to move and moves them to the 64th, 65th and 66th positions
+        index = SpecIndex(df) # or df.gsm.spec_index()
+        index.top('Thickness', 10, largest=False, columns=['Brand', 'Model', 'Released', 'Weight', 'Thickness'])
+        index.top('Weight', 5, where={'Brand': 'Samsung', 'Release_Year': 2020})
+        index.between('Display_Brightness', 1000, 1500, where={'Mobile_OS': ['Android', 'iOS']})
 
-            df.insert(i, col, df.pop(col)) # Moves the columns
+    Every measure is read as numbers by the df.gsm accessor and its measured phones are sorted once in each direction,
+    so a top-k query reads k phones and a range query finds its bounds by binary search. Phones with the same value come
+    in the order of the rows, like with nlargest() and nsmallest(). The phones of every value of SPEC_INDEX_DIMENSIONS
+    are kept as bitmaps of the rows, selected by where (a dict of a value or a list of values per dimension).
+    A filtered query only checks the bits of the phones it reads, in order, until it has k of them, so it never goes
+    through all the rows.
+    The queries return the rows of df, which must not be changed while the index is used.
 
-        df = df.drop(columns=["Loudspeaker"]) # Drops the original Loudspeaker column
+    """""
 
-        
-        return df
+    def __init__(self, df, specs=None):
+        if specs is None:
+            specs = [col for col in MEASURE_COLUMNS if col in df.columns]
+        self.df = df
+        self.specs = list(specs)
+        self.orders = {} # Positions of the measured rows of every spec, by increasing value
+        self.descending_orders = {} # Positions of the measured rows of every spec, by decreasing value
+        self.values = {} # Values of every spec, sorted
+        for spec in self.specs:
+            values = df.gsm.measure(spec).to_numpy()
+            positions = np.flatnonzero(~np.isnan(values)).astype(np.int32 if len(df) < 2**31 else np.int64)
+            order = np.argsort(values[positions], kind='stable') # Equal values stay in the order of the rows
+            self.orders[spec] = positions[order]
+            self.descending_orders[spec] = positions[np.argsort(-values[positions], kind='stable')]
+            self.values[spec] = values[positions][order]
 
-    def fix_price_and_approx_price(self, df):
+        self.bitmaps = {} # Bitmap of the rows of every value of every dimension, 8 rows per byte
+        for dim in SPEC_INDEX_DIMENSIONS:
+            codes, uniques = pd.factorize(df.gsm.release_year if dim == 'Release_Year' else df[dim]) # Missing values are in no bitmap
+            self.bitmaps[dim] = {value: np.packbits(codes == i, bitorder='little') for i, value in enumerate(uniques)}
+
+    def where_bitmaps(self, where):
 
         """""
-        This function fixes the Price and Approx Price columns. It extracts the price from the string and converts it to float.
-        It returns the values as rounded floats, and denotes "unspecified" to the values that are not available.
-        It gives the value in EUR and converts other currencies to EUR using the exchange rate on 08/02/2023.
+        This function returns the bitmaps of the values of where, as a list with the bitmaps of every dimension.
+        Values that no phone has have no bitmap, so a dimension can have none.
 
         """""
 
-        def extract_from_approx_price(price):
+        bitmaps = []
+        for dim, values in where.items():
+            if dim not in self.bitmaps:
+                raise ValueError("{} is not indexed, the indexed dimensions are {}".format(dim, SPEC_INDEX_DIMENSIONS))
+            values = values if isinstance(values, (list, tuple, set, pd.Index, np.ndarray)) else [values]
+            bitmaps.append([self.bitmaps[dim][value] for value in values if value in self.bitmaps[dim]])
+        return bitmaps
 
-            """""
-            This function extracts the price from the Approx Price column.
-            It uses pattern matching to extract the price from the string.
-            It returns the values as rounded floats, and denotes nan to the values that are not available.
-            It gives the value in EUR and converts other currencies to EUR using the exchange rate on 08/02/2023.
-            """""
+    def selected(self, positions, bitmaps):
 
-            pattern = r"About (\d+\.\d+|\d+) EUR" # Pattern to match
-            match = re.search(pattern, price) # Searches for the pattern in the string
-            if match: # If the pattern is found, returns the value
-                return round(int(match.group(1))) # Returns the value as rounded float
-            pattern = r"About (\d+\.\d+|\d+) INR" # Pattern to match
-            match = re.search(pattern, price) # Searches for the pattern in the string
-            if match: # If the pattern is found, returns the value
-                return round(int(match.group(1)) * 0.011) # Returns the value as rounded float
-            return None # If the pattern is not found, returns None
+        """""
+        This function returns whether every one of positions is selected by bitmaps (see where_bitmaps): if its bit is set
+        in a bitmap of every dimension. Only the bits of positions are read.
 
+        """""
 
-        def extract_from_price(price_str):
+        byte, bit = positions >> 3, (positions & 7).astype(np.uint8) # Where the bit of every position is
+        selected = np.ones(len(positions), dtype=bool)
+        for dimension_bitmaps in bitmaps:
+            in_dimension = np.zeros(len(positions), dtype=bool)
+            for bitmap in dimension_bitmaps:
+                in_dimension |= (bitmap[byte] >> bit) & 1 == 1
+            selected &= in_dimension
+        return selected
 
-            """""
-            This function extracts the price from the Price column.
-            It uses pattern matching to extract the price from the string.
-            It returns the values as rounded floats, and denotes nan to the values that are not available.
-            It gives the value in EUR and converts other currencies to EUR using the exchange rate on 08/02/2023.
+    def filter_positions(self, positions, where, k=None):
 
-            """""
+        """""
+        This function returns the positions, in order, selected by where, only the first k of them if k is given.
+        Positions are read in chunks that double in size, so a query selecting few rows does not check all of them.
 
-            if not isinstance(price_str, str): # If the value is not a string, returns nan
-                return price_str # Returns nan
-            euros = re.findall(r'€\s*(\d+(?:\.\d+)?)', price_str) # Finds the pattern in the string
-            if euros: # If the pattern is found, returns the value
-                return round(float(euros[0])) # Returns the value as rounded float
-            dollars = re.findall(r'\$\s*(\d+(?:\.\d+)?)', price_str) # Finds the pattern in the string
-            if dollars: # If the pattern is found, returns the value
-                return round(float(dollars[0]) * 0.93) # Returns the value as rounded float
-            inr = re.findall(r'₹\s*(\d+(?:,\d+)?)', price_str) # Finds the pattern in the string
-            if inr: # If the pattern is found, returns the value
-                return round(float(inr[0].replace(',', '')) * 0.011) # Returns the value as rounded float
-            pounds = re.findall(r'£\s*(\d+(?:\.\d+)?)', price_str) # Finds the pattern in the string
-            if pounds: # If the pattern is found, returns the value
-                return round(float(pounds[0]) * 1.13) # Returns the value as rounded float
-            return float('nan') # If the pattern is not found, returns nan
+        """""
 
+        if not where:
+            return positions[:k]
+        bitmaps = self.where_bitmaps(where)
+        if k is None:
+            return positions[self.selected(positions, bitmaps)]
+        found = []
+        start, n_found, size = 0, 0, max(k, 64)
+        while n_found < k and start < len(positions):
+            chunk = positions[start:start + size]
+            hits = chunk[self.selected(chunk, bitmaps)]
+            found.append(hits)
+            n_found += len(hits)
+            start += size
+            size *= 2
+        return np.concatenate(found)[:k] if found else positions[:0]
 
-        df["Approx Price"] = df["Approx Price"].apply(lambda x: extract_from_approx_price(x) if pd.notna(x) else None) # Extracts the price from the string and converts it to float
-        df['Price'] = df['Price'].apply(extract_from_price) # Extracts the price from the string and converts it to float
+    def rows(self, positions, columns):
+        rows = self.df.iloc[positions]
+        return rows if columns is None else rows[list(columns)]
 
-        df['Price'] = df['Approx Price'].combine_first(df['Price']) # Combines the two columns
-        df['Price'] = df['Price'].fillna("unspecified") # Replaces the NaN values with "unspecified"
+    def check_spec(self, spec):
+        if spec not in self.orders:
+            raise ValueError("{} is not indexed, the indexed specs are {}".format(spec, self.specs))
 
-        columns_to_move = ['Price'] # Columns to move
-        for i, col in enumerate(columns_to_move, start=68): # Iterates through the columns to move and moves them to the 67th position
+    def top(self, spec, k=10, largest=True, where=None, columns=None):
 
-            df.insert(i, col, df.pop(col)) # Moves the columns
+        """""
+        This function returns the rows of the k phones with the largest values of spec (the smallest ones if largest is False),
+        among the phones selected by where (see where_bitmaps), in order. Phones without a value of spec are left out.
+        columns are the columns of the rows returned, all of them by default.
 
-        df = df.drop(columns=["Approx Price"]) # Drops the original Price and Approx Price columns
+        """""
 
-        return df
+        self.check_spec(spec)
+        order = self.descending_orders[spec] if largest else self.orders[spec]
+        return self.rows(self.filter_positions(order, where, k), columns)
 
+    def between(self, spec, low=None, high=None, where=None, columns=None):
 
-    def clean(self):
+        """""
+        This function returns the rows of the phones with a value of spec from low to high, both included, by increasing value,
+        among the phones selected by where (see where_bitmaps). A bound that is None is not checked.
 
-        cleaned_df = self.df
-        for func in self.cleaning_functions:
-            cleaned_df = func(cleaned_df)
+        """""
 
-        return cleaned_df
-        
\ No newline at end of file
+        self.check_spec(spec)
+        values = self.values[spec]
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        end = len(values) if high is None else np.searchsorted(values, high, side='right')
+        return self.rows(self.filter_positions(self.orders[spec][start:end], where), columns)
@@ -0,0 +1,273 @@
+"""""
+This module generates synthetic GSMArena scrapes for benchmarking the cleaners, since the real GSMArena.csv is not in the repository.
+Every column reproduces the string formats found on the website (e.g. "Li-Ion 4500 mAh, non-removable", "About 250 EUR",
+"Octa-core (2x2.8 GHz Cortex-A76 & 6x1.8 GHz Cortex-A55)"), and the data is fully determined by the seed.
+
+"""""
+
+import numpy as np
+import pandas as pd
+
+
+BRANDS = ['Samsung', 'Apple', 'Xiaomi', 'Nokia', 'Motorola', 'Huawei', 'Sony', 'LG', 'Oppo', 'vivo', 'Realme', 'Google', 'OnePlus', 'Alcatel', 'BlackBerry']
+
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+
+
+def fake_announced(rng): # Announced column, e.g. "2021, March 15. Released 2021, March 26"
+    year = rng.randint(1995, 2024)
+    month = MONTHS[rng.randint(12)]
+    shape = rng.randint(7)
+    if shape == 0:
+        return str(year)
+    if shape == 1:
+        return "{}, {}".format(year, month)
+    if shape == 2:
+        return "{}, Q{}".format(year, rng.randint(1, 5))
+    if shape == 3:
+        return "Not officially announced yet"
+    if shape == 4:
+        return "{}, {} {}. Released {}, {} {}".format(year, month, rng.randint(1, 29), year, MONTHS[rng.randint(12)], rng.randint(1, 29))
+    return "{}, {} {}".format(year, month, rng.randint(1, 29))
+
+
+def fake_status(rng): # Status column, e.g. "Available. Released 2021, March 26"
+    shape = rng.randint(6)
+    if shape == 0:
+        return "Available. Released {}, {} {}".format(rng.randint(1995, 2024), MONTHS[rng.randint(12)], rng.randint(1, 29))
+    if shape == 1:
+        return "Coming soon. Exp. release {}, Q{}".format(rng.randint(2023, 2025), rng.randint(1, 5))
+    if shape == 2:
+        return "Cancelled"
+    if shape == 3:
+        return "Available. Released {}, {}".format(rng.randint(1995, 2024), MONTHS[rng.randint(12)])
+    return "Discontinued"
+
+
+def fake_dimensions(rng): # Dimensions column, e.g. "146.7 x 71.5 x 7.7 mm (5.78 x 2.81 x 0.30 in)"
+    length, width, thickness = rng.uniform(100, 170), rng.uniform(45, 80), rng.uniform(5, 25)
+    return "{:.1f} x {:.1f} x {:.1f} mm ({:.2f} x {:.2f} x {:.2f} in)".format(length, width, thickness, length / 25.4, width / 25.4, thickness / 25.4)
+
+
+def fake_weight(rng): # Weight column, e.g. "174 g (6.14 oz)"
+    grams = rng.randint(60, 300)
+    return "{} g ({:.2f} oz)".format(grams, grams / 28.35)
+
+
+def fake_display_type(rng): # Display Type column, e.g. "Super AMOLED, 120Hz, HDR10+, 1200 nits (HBM)"
+    panel = rng.choice(['Dynamic AMOLED 2X', 'Super AMOLED', 'IPS LCD', 'TFT, 256K colors', 'OLED', 'LTPO AMOLED', 'Foldable Dynamic AMOLED 2X',
+                        'CSTN, 65K colors', 'Monochrome graphic', 'TFT', 'P-OLED', 'LTPO2 AMOLED', 'STN'])
+    extras = []
+    if rng.rand() < 0.5:
+        extras.append("{}Hz".format(rng.choice([60, 90, 120, 144])))
+    if rng.rand() < 0.4:
+        extras.append(rng.choice(['HDR10+', 'HDR10', 'HDR', 'Dolby Vision']))
+    if rng.rand() < 0.6:
+        extras.append("{} nits ({})".format(rng.randint(3, 25) * 100, rng.choice(['peak', 'HBM', 'typ'])))
+    return ", ".join([panel] + extras)
+
+
+def fake_display_size(rng): # Display Size column, e.g. "6.1 inches, 90.2 cm2 (~86.0% screen-to-body ratio)"
+    inches = rng.uniform(1.4, 7.6)
+    shape = rng.randint(3)
+    if shape == 0:
+        return "{:.1f} inches".format(inches)
+    return "{:.1f} inches, {:.1f} cm2 (~{:.1f}% screen-to-body ratio)".format(inches, inches * 14.2, rng.uniform(25, 93))
+
+
+def fake_display_resolution(rng): # Display Resolution column, e.g. "1080 x 2400 pixels, 20:9 ratio (~405 ppi density)"
+    width, height = [(240, 320), (720, 1600), (1080, 2400), (1440, 3200), (128, 160), (1170, 2532)][rng.randint(6)]
+    shape = rng.randint(3)
+    if shape == 0:
+        return "{} x {} pixels".format(width, height)
+    if shape == 1:
+        return "{} x {} pixels (~{} ppi density)".format(width, height, rng.randint(100, 560))
+    return "{} x {} pixels, {} ratio (~{} ppi density)".format(width, height, rng.choice(['20:9', '19.5:9', '16:9', '4:3']), rng.randint(100, 560))
+
+
+def fake_cpu(rng): # CPU column, e.g. "Octa-core (2x2.2 GHz Cortex-A76 & 6x1.8 GHz Cortex-A55)"
+    shape = rng.randint(6)
+    if shape == 0:
+        return "Octa-core (1x{:.2f} GHz Cortex-X3 & 2x2.8 GHz Cortex-A715 & 2x2.8 GHz Cortex-A710 & 3x2.0 GHz Cortex-A510)".format(rng.uniform(2.8, 3.4))
+    if shape == 1:
+        return "Octa-core (2x{:.1f} GHz Cortex-A76 & 6x{:.1f} GHz Cortex-A55)".format(rng.uniform(2.0, 2.6), rng.uniform(1.6, 2.0))
+    if shape == 2:
+        return "Quad-core {:.1f} GHz Cortex-A7".format(rng.uniform(1.0, 1.6))
+    if shape == 3:
+        return "Hexa-core (2x3.46 GHz Everest + 4x2.02 GHz Sawtooth)"
+    if shape == 4:
+        return "{} MHz ARM 11".format(rng.choice([369, 434, 600, 624]))
+    return "Dual-core {:.1f} GHz".format(rng.uniform(1.0, 1.5))
+
+
+def fake_internal_storage(rng): # Internal Storage column, e.g. "128GB 8GB RAM, 256GB 8GB RAM"
+    shape = rng.randint(5)
+    if shape == 0:
+        return ", ".join("{}GB {}GB RAM".format(rom, ram) for rom, ram in [(128, 8), (256, 8), (256, 12)][:rng.randint(1, 4)])
+    if shape == 1:
+        return "{}GB {}GB RAM".format(rng.choice([16, 32, 64]), rng.choice([1, 2, 3, 4]))
+    if shape == 2:
+        return "{}MB".format(rng.choice([4, 16, 32, 100]))
+    if shape == 3:
+        return "{}MB {}MB RAM".format(rng.choice([128, 256, 512]), rng.choice([32, 64]))
+    return "{}GB (UFS) {}GB RAM".format(rng.choice([64, 128]), rng.choice([4, 6]))
+
+
+def fake_camera(rng): # Camera column, e.g. "50 MP, f/1.8 (wide)"
+    shape = rng.randint(5)
+    if shape == 0:
+        return "{} MP, f/1.8, 24mm (wide), PDAF, OIS\n{} MP, f/2.2, 13mm, 120˚ (ultrawide)".format(rng.choice([12, 48, 50, 108, 200]), rng.choice([8, 12]))
+    if shape == 1:
+        return "{} MP, f/1.8 (wide)".format(rng.choice([2, 5, 8, 12, 13]))
+    if shape == 2:
+        return "VGA"
+    if shape == 3:
+        return "{:.1f} MP".format(rng.choice([1.3, 3.2]))
+    return "No"
+
+
+def fake_video(rng, rear): # Rear Video and Selfie Video columns, e.g. "4K@30/60fps, 1080p@30/60fps, gyro-EIS"
+    shape = rng.randint(7)
+    if shape == 0:
+        return "8K@24/30fps, 4K@30/60fps, 1080p@30/60/240fps, HDR10+, gyro-EIS" if rear else "4K@30/60fps, 1080p@30/60fps, gyro-EIS"
+    if shape == 1:
+        return "4K@24/30/60fps, 1080p@30/60/120/240fps, 10-bit HDR, gyro-EIS"
+    if shape == 2:
+        return "{}@{}fps".format(rng.choice(['1080p', '720p', '480p', 'VGA', 'CIF', 'QVGA', 'QCIF']), rng.choice([15, 24, 30]))
+    if shape == 3:
+        return "Yes"
+    if shape == 4:
+        return "No"
+    if shape == 5:
+        return "1080p@30fps, 720p@120fps"
+    return np.nan
+
+
+def fake_price(rng): # Price column, e.g. "€ 899.99 / $ 971.99 / £ 791.00 / ₹ 80910"
+    eur = rng.randint(50, 1400)
+    shape = rng.randint(6)
+    if shape == 0:
+        return "€ {}.99 / $ {}.99 / £ {}.00 / ₹ {}".format(eur, int(eur * 1.08), int(eur * 0.88), int(eur * 90))
+    if shape == 1:
+        return "$ {}.99 / € {}.00".format(int(eur * 1.08), eur)
+    if shape == 2:
+        return "₹ {:,}".format(int(eur * 90))
+    if shape == 3:
+        return "£ {}.00".format(int(eur * 0.88))
+    if shape == 4:
+        return "€ {:.2f}".format(eur + 0.99)
+    return np.nan
+
+
+CHOICES = { # Real values of the columns with few distinct values
+    'Network Technology': ['GSM / HSPA / LTE / 5G', 'GSM', 'GSM / CDMA / HSPA / LTE', 'GSM / HSPA', 'GSM / HSPA / LTE', 'No cellular connectivity'],
+    'Build': ['Glass front (Gorilla Glass 5), glass back (Gorilla Glass 5), aluminum frame', 'Plastic front, plastic back, plastic frame',
+              'Glass front, plastic back, plastic frame', 'Glass front (Gorilla Glass Victus+), glass back (Gorilla Glass Victus+), aluminum frame',
+              'Glass front, aluminum back, aluminum frame', np.nan],
+    'SIM': ['Nano-SIM', 'Dual SIM (Nano-SIM, dual stand-by)', 'Single SIM (Nano-SIM and/or eSIM)', 'Mini-SIM', 'Micro-SIM',
+            'Dual SIM (Micro-SIM, dual stand-by)', 'Yes', 'No', np.nan],
+    'IP Rating': ['IP68 dust/water resistant (up to 1.5m for 30 mins)', 'IP67 dust/water resistant (up to 1m for 30 mins)', 'Splash resistant',
+                  'MIL-STD-810H compliant', 'Weather-sealed ports', np.nan, np.nan],
+    'Display Protection': ['Corning Gorilla Glass Victus+', 'Corning Gorilla Glass 5', 'Corning Gorilla Glass 3', 'Asahi Dragontrail Glass', 'Sapphire crystal glass',
+                           'Yes', 'Panda Glass', 'Schott Xensation UP', 'Ion-strengthened glass, oleophobic coating', 'Huawei Kunlun Glass', np.nan, np.nan],
+    'Operating Software': ['Android 13, One UI 5.1', 'Android 11, MIUI 12.5', 'iOS 16, upgradable to iOS 17', 'Symbian 9.4, Series 60 rel. 5',
+                           'Microsoft Windows Phone 8', 'BlackBerry OS 7.1', 'Tizen 2.3', 'KaiOS 2.5', 'HarmonyOS 3.0', np.nan],
+    'Chipset': ['Qualcomm SM8550-AB Snapdragon 8 Gen 2 (4 nm)', 'Mediatek Helio G99 (6 nm)', 'Exynos 2200 (4 nm)', 'Apple A16 Bionic (4 nm)',
+                'Unisoc T606 (12 nm)', 'Google Tensor G2 (5 nm)', 'Kirin 9000 5G (5 nm)', 'Qualcomm MSM8916 Snapdragon 410', np.nan],
+    'SD Card Slot': ['microSDXC (dedicated slot)', 'microSDXC (uses shared SIM slot)', 'No', 'microSD, up to 32 GB', 'miniSD', 'microSDHC', np.nan],
+    'Storage Type': ['UFS 4.0', 'UFS 3.1', 'eMMC 5.1', 'UFS 2.1', np.nan],
+    'Number of Rear Cameras': ['Triple', 'Dual', 'Quad', 'Single', 'Penta', np.nan],
+    'Camera Features': ['LED flash, HDR, panorama', 'LED flash', 'Dual-LED flash, HDR, panorama', 'Zeiss optics, LED flash', np.nan],
+    'Number of Selfie Cameras': ['Single', 'Dual', 'Triple', np.nan],
+    'Headphone Jack': ['Yes', 'No', np.nan],
+    'WLAN Technology': ['Wi-Fi 802.11 a/b/g/n/ac/6e, dual-band, hotspot', 'Wi-Fi 802.11 b/g/n, hotspot', 'No', 'Yes', np.nan],
+    'Bluetooth': ['5.3, A2DP, LE', '5.0, A2DP, LE, aptX HD', '4.2, A2DP, LE', '2.1, A2DP, EDR', '5.2, A2DP, LE', 'Yes', 'No', np.nan],
+    'NFC': ['Yes', 'No', 'Yes (market/region dependent)', 'Optional', np.nan],
+    'Radio': ['FM radio', 'No', 'Stereo FM radio, RDS, recording', 'FM radio (market dependent)', 'Unspecified', np.nan],
+    'USB': ['USB Type-C 3.2, DisplayPort 1.2, OTG', 'USB Type-C 2.0, OTG', 'microUSB 2.0', 'miniUSB 1.1', 'Proprietary', 'Pop-Port', 'No',
+            'Lightning, USB 2.0', np.nan],
+    'Sensors': ['Fingerprint (under display, ultrasonic), accelerometer, gyro, proximity, compass, barometer',
+                'Fingerprint (side-mounted), accelerometer, proximity, compass', 'Fingerprint (rear-mounted), accelerometer, gyro',
+                'Face ID, accelerometer, gyro, proximity, compass, barometer', 'Accelerometer, proximity',
+                'Iris scanner, fingerprint (rear-mounted), accelerometer', 'Fingerprint (under display, optical), accelerometer', np.nan],
+    'UWB': ['Ultra Wideband (UWB) support', np.nan, np.nan],
+    'Colors': ['Black, White, Blue', 'Phantom Black', 'Graphite, Silver, Gold, Sierra Blue', np.nan],
+    'Loudspeaker': ['Voice 66dB / Noise 70dB / Ring 78dB', 'Voice 70dB / Noise 66dB / Ring 80dB', 'Voice 75dB / Noise 66dB / Ring 75dB',
+                    '-24.5 LUFS (Very good)', np.nan],
+    'Approx Price': ['About 250 EUR', 'About 15000 INR', 'About 180 EUR', 'About 90 EUR', np.nan, np.nan, np.nan, np.nan],
+}
+
+
+def fake_battery(rng): # Battery column, e.g. "Li-Ion 4500 mAh, non-removable"
+    mah = rng.randint(800, 6000)
+    shape = rng.randint(5)
+    if shape == 0:
+        return "Li-Ion {} mAh, non-removable".format(mah)
+    if shape == 1:
+        return "Li-Po {} mAh, non-removable".format(mah)
+    if shape == 2:
+        return "Removable Li-Ion {} mAh battery".format(mah)
+    if shape == 3:
+        return "Non-removable Li-Po {} mAh battery ({:.2f} Wh)".format(mah, mah / 260)
+    return "Removable Li-Polymer {} mAh battery".format(mah)
+
+
+def fake_charging(rng): # Charging column, e.g. "25W wired"
+    watts = rng.choice([10, 15, 18, 25, 33, 45, 67, 120])
+    shape = rng.randint(4)
+    if shape == 0:
+        return "{}W wired, PD3.0, 50% in 30 min (advertised)\n15W wireless (Qi/PMA)\n4.5W reverse wireless".format(watts)
+    if shape == 1:
+        return "{}W wired".format(watts)
+    if shape == 2:
+        return "Fast charging {}W".format(watts)
+    return np.nan
+
+
+def fake_battery_life(rng): # Battery Life column, e.g. "Endurance rating 98h"
+    if rng.rand() < 0.5:
+        return np.nan
+    return "Endurance rating {}h".format(rng.randint(40, 140))
+
+
+GENERATORS = { # Functions returning a random string of the columns with many distinct values
+    'Announced': fake_announced, 'Status': fake_status, 'Dimensions': fake_dimensions, 'Weight': fake_weight, 'Display Type': fake_display_type,
+    'Display Size': fake_display_size, 'Display Resolution': fake_display_resolution, 'CPU': fake_cpu, 'Internal Storage': fake_internal_storage,
+    'Camera': fake_camera, 'Rear Video': lambda rng: fake_video(rng, True), 'Selfie Video': lambda rng: fake_video(rng, False), 'Battery': fake_battery,
+    'Charging': fake_charging, 'Battery Life': fake_battery_life, 'Price': fake_price,
+}
+
+COLUMNS = ['web-scraper-order', 'web-scraper-start-url', 'Brands', 'Brands-href', 'Models', 'Models-href', 'Pages', 'Pages-href', 'Model',
+           'Network Technology', 'Announced', 'Status', 'Dimensions', 'Weight', 'Build', 'SIM', 'IP Rating', 'Display Type', 'Display Size',
+           'Display Resolution', 'Display Protection', 'Operating Software', 'Chipset', 'CPU', 'GPU', 'SD Card Slot', 'Internal Storage',
+           'Storage Type', 'Number of Rear Cameras', 'Camera', 'Camera Features', 'Rear Video', 'Number of Selfie Cameras', 'Selfie Features',
+           'Selfie Video', 'Loudspeaker', 'Headphone Jack', 'WLAN Technology', 'Bluetooth', 'NFC', 'Radio', 'USB', 'Sensors', 'UWB', 'Battery',
+           'Charging', 'Colors', 'Battery Life', 'Price', 'Approx Price'] # Columns of the scraper, in order
+
+
+def generate_gsmarena(n_rows, seed=0, n_unique=2000):
+
+    """""
+    This function returns a raw GSMArena scrape of n_rows rows, with the columns of the scraper in their original order.
+    Every generated column draws its rows from a pool of n_unique strings, as real phones share most of their specifications.
+
+    """""
+
+    rng = np.random.RandomState(seed)
+    pool = {col: [generate(rng) for _ in range(n_unique)] for col, generate in GENERATORS.items()} # Distinct strings of every generated column
+
+    data = {}
+    for col in COLUMNS:
+        if col in pool or col in CHOICES:
+            values = np.array(pool[col] if col in pool else CHOICES[col], dtype=object)
+            data[col] = values[rng.randint(len(values), size=n_rows)] # Draws the rows from the distinct strings
+
+    brands = rng.choice(BRANDS, size=n_rows)
+    data['Brands'] = np.array(["{}\n{} devices".format(brand, 100 + len(brand)) for brand in brands], dtype=object)
+    data['Models'] = np.array(["{} Model {}".format(brand, i % 997) for i, brand in enumerate(brands)], dtype=object)
+    data['Model'] = data['Models']
+    data['web-scraper-order'] = np.array(["1672-{}".format(i) for i in range(n_rows)], dtype=object)
+    for col in ['web-scraper-start-url', 'Brands-href', 'Models-href', 'Pages', 'Pages-href', 'GPU', 'Selfie Features']: # Columns dropped by the cleaner
+        data[col] = np.full(n_rows, 'x', dtype=object)
+
+    return pd.DataFrame(data, columns=COLUMNS)
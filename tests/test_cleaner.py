@@ -0,0 +1,26 @@
+"""""
+These tests check the options of clean(): the quarantine of the values an extractor fails on, and the partitions of n_jobs.
+
+"""""
+
+import pandas as pd
+from cleaners import GSMArena_Dataset_Cleaner
+from synthetic_data import generate_gsmarena
+
+
+def test_quarantine_one_row_per_value():
+    raw = generate_gsmarena(400, seed=4)
+    raw['USB'] = raw['USB'].astype(object)
+    raw.loc[[0, 399], 'USB'] = 5 # Not a string, so both classifiers of fix_USB fail on it, in both partitions
+    cleaner = GSMArena_Dataset_Cleaner(raw, quarantine=True)
+    cleaned = cleaner.clean(n_jobs=2)
+    table = cleaner.quarantine_table()
+    assert table[['stage', 'column', 'value']].values.tolist() == [['fix_USB', 'USB', 5]]
+    assert cleaned.loc[[0, 399], 'USB_Connector'].isna().all()
+
+
+def test_n_jobs_empty_frame():
+    raw = generate_gsmarena(50, seed=5).iloc[:0]
+    sequential = GSMArena_Dataset_Cleaner(raw).clean()
+    partitioned = GSMArena_Dataset_Cleaner(raw).clean(n_jobs=2)
+    pd.testing.assert_frame_equal(partitioned, sequential)
@@ -0,0 +1,105 @@
+"""""
+These tests check that the vectorized extractors (vectorized=True, the default) give exactly the values of the per-value
+extractors they replace (vectorized=False): every value must have the same Python type and repr, so that the cleaned
+columns have the same dtypes and the same ints, floats and labels.
+
+"""""
+
+import numpy as np
+import pandas as pd
+import pytest
+from cleaners import GSMArena_Dataset_Cleaner
+from synthetic_data import generate_gsmarena
+
+
+EDGE_CASES = { # Values of the raw columns that the vectorized extractors must handle like the per-value ones
+    'Battery': ["Li-Ion 4500 mAh, non-removable", "Removable Li-Ion 1500 mAh battery (BL-5C)", "Li-Po 3.85 V 4000 mAh",
+                "5000mAh", "No battery", "", " ", np.nan],
+    'Charging': ["25W wired", "18W wired, 15W wireless", "Fast charging 120W, 100% in 15 min", "65 W", "15W wireless, 15W wired",
+                 "No", "", np.nan],
+    'Battery Life': ["Endurance rating 98h", "Endurance rating 120h", "12h 3h", "98hours", "no data", "", np.nan],
+    'Internal Storage': ["1000MB 1GB RAM", "1GB 1000MB RAM", "2000MB 2GB RAM, 1GB RAM", # GB/MB ties give the GB int
+                         "128GB 8GB RAM, 256GB 8GB RAM", "512MB 256MB RAM", "16MB", "4GB", "(2TB) 128GB 4GB RAM", "4GB (1000MB) RAM",
+                         "128GB (UFS 3.1) 8GB RAM", "No", "microSDHC", "", np.nan],
+    'Loudspeaker': ["Voice 70dB / Noise 66dB / Ring 80dB", "Voice 66dB / Noise 69dB", "Voice 66dB", "Yes", "-24.5 LUFS (Very good)",
+                    "/ /", "", np.nan],
+    'Approx Price': ["About 250.5 EUR", "About 251.5 EUR", "About 99.49 EUR", "About 100.7 INR", "About 15000.5 INR", # Decimals are rounded
+                     "About 250 EUR", "About 15000 INR", "About 90 USD", "About 100 INR, about 80 EUR", "", np.nan],
+    'Camera': ["12.5 MP", "12.5 MP, 12 MP", "2.0 MP, 2 MP", "2 MP, 2.0 MP", # Decimal resolutions give "no camera"
+               "48 MP, 12 MP, 2 MP", "108 MP, f/1.8 (wide)", "VGA", "13 MP + VGA", "No", "5MP", "", np.nan],
+}
+STAGES = [ # Cleaning function, the raw column it reads and the columns of the vectorized extractors
+    ('fix_Battery', 'Battery', ['Battery_Capacity']),
+    ('fix_Charging', 'Charging', ['Charging_Speed']),
+    ('fix_Battery_Life', 'Battery Life', ['Battery_Life']),
+    ('fix_Internal_Storage', 'Internal Storage', ['ROM', 'RAM']),
+    ('fix_Camera', 'Camera', ['Highest_Camera_Resolution']),
+    ('fix_price_and_approx_price', 'Approx Price', ['Price']),
+    ('fix_Loudspeaker', 'Loudspeaker', ['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring']),
+]
+
+
+def run_stage(name, column, values, vectorized):
+
+    """""
+    This function runs the cleaning function name on a frame holding values in column, and missing values in the other
+    columns it reads, with a new cleaner so that the cache of one mode never gives its results to the other.
+
+    """""
+
+    cleaner = GSMArena_Dataset_Cleaner(None, vectorized=vectorized)
+    frame = pd.DataFrame({col: pd.Series(values if col == column else [np.nan] * len(values), dtype=object)
+                          for col in getattr(GSMArena_Dataset_Cleaner, name).stage.consumes})
+    return getattr(cleaner, name)(frame)
+
+
+def typed_values(series):
+    return [(type(value), repr(value)) for value in series]
+
+
+def assert_same_values(name, column, values, outputs):
+    vectorized = run_stage(name, column, values, vectorized=True)
+    per_value = run_stage(name, column, values, vectorized=False)
+    for output in outputs:
+        assert vectorized[output].dtype == per_value[output].dtype, output
+        assert typed_values(vectorized[output]) == typed_values(per_value[output]), output
+
+
+@pytest.mark.parametrize('name, column, outputs', STAGES)
+def test_edge_cases(name, column, outputs):
+    assert_same_values(name, column, EDGE_CASES[column], outputs)
+
+
+@pytest.mark.parametrize('name, column, outputs', STAGES)
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_synthetic_values(name, column, outputs, seed):
+    values = generate_gsmarena(2000, seed=seed, n_unique=500)[column].tolist() + EDGE_CASES[column]
+    assert_same_values(name, column, values, outputs)
+
+
+@pytest.mark.parametrize('name, column, outputs', STAGES)
+def test_single_value(name, column, outputs):
+    for value in EDGE_CASES[column]: # A column with a single distinct value infers its dtype from that value alone
+        assert_same_values(name, column, [value, value], outputs)
+
+
+def test_clean():
+    raw = generate_gsmarena(3000, seed=3)
+    vectorized = GSMArena_Dataset_Cleaner(raw, vectorized=True).clean()
+    per_value = GSMArena_Dataset_Cleaner(raw, vectorized=False).clean()
+    pd.testing.assert_frame_equal(vectorized, per_value)
+    for column in vectorized.columns[vectorized.dtypes == object]:
+        assert typed_values(vectorized[column]) == typed_values(per_value[column]), column
+
+
+def test_decimal_approx_price():
+    values = ["About 250.5 EUR", "About 251.5 EUR", "About 15000.5 INR"]
+    for vectorized in (True, False):
+        prices = run_stage('fix_price_and_approx_price', 'Approx Price', values, vectorized)['Price']
+        assert prices.tolist() == [250, 252, 165] # Halves are rounded to even, like round()
+
+
+def test_loudspeaker_without_slash():
+    for vectorized in (True, False):
+        frame = run_stage('fix_Loudspeaker', 'Loudspeaker', ["Voice 66dB"], vectorized)
+        assert frame[['Loudspeaker_Voice', 'Loudspeaker_Noise', 'Loudspeaker_Ring']].iloc[0].tolist() == [66, 'untested', 66]